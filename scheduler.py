@@ -2,36 +2,117 @@
 Scheduler implementation scaffolding.
 Follows the design spec in docs/design-specs/scheduler_design_spec.md.
 """
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Iterator, Tuple
 from pathlib import Path
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+import heapq
+import io
 import logging
+import os
+import socket
+import sqlite3
+import threading
+import zlib
 from datetime import datetime, timedelta, timezone
 import re
 import signal
+import tarfile
+import tempfile
 import time
+import tomllib
+
+# Retry/circuit-breaker types live with the shared transport; re-exported here for callers
+try:
+    from http_transport import CircuitBreaker, CircuitOpenError, HTTPTransport, RetryPolicy, host_of, iter_body  # noqa: F401
+except ImportError:  # run from the repo root without src/ on sys.path
+    from src.http_transport import CircuitBreaker, CircuitOpenError, HTTPTransport, RetryPolicy, host_of, iter_body  # noqa: F401
+# Same digest the simulator publishes in its listings
+try:
+    from sharepoint_sim.storage import sha256_file
+except ImportError:  # run from the repo root without src/ on sys.path
+    from src.sharepoint_sim.storage import sha256_file
 
 try:  # Optional APScheduler import for runtime scheduling (not required for tests)
     from apscheduler.schedulers.background import BackgroundScheduler  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     BackgroundScheduler = None  # type: ignore
 
+def local_copy_matches(path: Path, meta: Dict[str, Any]) -> bool:
+    """Return True when ``path`` already holds the content described by listing metadata.
+
+    Compares size first (one stat) and only hashes the file when sizes agree.
+    """
+    if not path.is_file():
+        return False
+    size = meta.get("size")
+    if size is not None and path.stat().st_size != int(size):
+        return False
+    digest = meta.get("sha256")
+    return bool(digest) and sha256_file(path) == digest
+
+
+class _NotModified(Exception):
+    """Raised internally when the server answers 304 to a conditional download."""
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (for streaming tar extraction)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._buf:
+            try:
+                self._buf = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+
+def _write_atomic(dest: Path, src: Any, chunk_size: int = 1024 * 1024) -> None:
+    """Copy a readable stream to ``dest`` via an fsync'd hidden ``.part`` file and rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".part")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter(lambda: src.read(chunk_size), b""):
+                out.write(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 # --- DBServiceClient ---
 class DBServiceClient:
-    def __init__(self, api_url: Optional[str] = None, session: Optional[Any] = None):
+    def __init__(self, api_url: Optional[str] = None, session: Optional[Any] = None, retry_policy: Optional[RetryPolicy] = None, transport: Optional[HTTPTransport] = None):
         """HTTP client for DB service API, used to derive already ingested files.
 
         Args:
             api_url: Base URL for DB API (e.g., http://localhost:8000). Can be empty when using TestClient.
             session: Requests-like session object (requests.Session or FastAPI TestClient).
+                Defaults to the shared pooled session.
+            retry_policy: Shared retry/circuit-breaker policy. Defaults to a private RetryPolicy().
+            transport: Ready-made transport (overrides api_url/session/retry_policy).
         """
         self.api_url = (api_url or "http://localhost:8000").rstrip("/")
-        self.session = session
-        if self.session is None:  # pragma: no cover - environment dependent
-            try:
-                import requests  # type: ignore
-            except Exception as exc:  # pragma: no cover
-                raise RuntimeError("DBServiceClient requires an HTTP session in this environment") from exc
-            self.session = requests.Session()  # type: ignore
+        if transport is None:
+            transport = HTTPTransport(self.api_url, session=session, service="db_service", retry_policy=retry_policy or RetryPolicy())
+        self.transport = transport
+        self.retry_policy = transport.retry_policy
+        self.session = transport.session
         # Precompile pattern like ACQ__2025-08-20_1130 (kept for potential future use)
         self._name_re = re.compile(r"^(?P<prefix>[A-Za-z0-9_]+)__(?P<dt>\d{4}-\d{2}-\d{2}_\d{4})$")
 
@@ -58,36 +139,83 @@ class DBServiceClient:
             "timestamp_column": "ingested_at",
             "columns": "filename",
         }
-        resp: Any = self.session.get(self._url("/tables/ingestion_log/rows"), params=params)  # type: ignore[attr-defined]
+        resp: Any = self.transport.get(self._url("/tables/ingestion_log/rows"), params=params)
         if resp.status_code == 404:
             return []
         resp.raise_for_status()
         rows: List[Dict[str, Any]] = list(resp.json())
         return [str(r.get("filename")) for r in rows if r.get("filename")]
 
+    def get_missing_files(
+        self, filenames: List[str], start_time: Optional[str] = None, end_time: Optional[str] = None
+    ) -> List[str]:
+        """Return the candidate filenames the DB service has not ingested yet.
+
+        The diff is computed server-side (``POST /ingestion_log/missing``) so only the delta
+        crosses the wire. Falls back to ``get_ingested_files`` over the last hour when talking
+        to an older DB service without that endpoint.
+        """
+        if not filenames:
+            return []
+        payload: Dict[str, Any] = {"filenames": list(filenames)}
+        if start_time:
+            payload["start_time"] = start_time
+        if end_time:
+            payload["end_time"] = end_time
+        # A read-only lookup, so it is safe to retry
+        resp: Any = self.transport.post(
+            self._url("/ingestion_log/missing"), json=payload, attempts=self.transport.retry_policy.max_attempts
+        )
+        if resp.status_code in (404, 405):
+            end = datetime.now(timezone.utc)
+            ingested = set(self.get_ingested_files(
+                start_time or (end - timedelta(hours=1)).isoformat(timespec="seconds"),
+                end_time or end.isoformat(timespec="seconds"),
+            ))
+            return [name for name in filenames if name not in ingested]
+        resp.raise_for_status()
+        return [str(name) for name in resp.json().get("missing", [])]
+
 # --- SharePointClient ---
 class SharePointClient:
-    def __init__(self, config: Optional[Dict[str, Any]] = None, session: Optional[Any] = None, base_url: Optional[str] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, session: Optional[Any] = None, base_url: Optional[str] = None, retry_policy: Optional[RetryPolicy] = None, transport: Optional[HTTPTransport] = None):
         """HTTP-based client against the SharePoint simulator REST API.
 
         Args:
-            config: Optional config dict (may include 'sim_base_url').
+            config: Optional config dict (may include 'sim_base_url' and 'list_cursor_path',
+                a file where the last listing cursor is persisted across runs).
             session: Requests-like session (e.g., requests.Session or FastAPI TestClient).
+                Defaults to the shared pooled session.
             base_url: Base URL for the sim server (e.g., 'http://localhost:8000').
+            retry_policy: Shared retry/circuit-breaker policy. Defaults to one built from config.
+            transport: Ready-made transport (overrides session/retry_policy).
         """
         self.config: Dict[str, Any] = config or {}
-        self.session = session
+        self.logger = logging.getLogger("SharePointClient")
         self.base_url = (base_url or self.config.get("sim_base_url") or "").rstrip("/")
+        cursor_path = self.config.get("list_cursor_path")
+        self.cursor_path: Optional[Path] = Path(cursor_path) if cursor_path else None
+        self._cursor: Optional[str] = self._load_cursor()
+        self._pending_cursor: Optional[str] = None
+        # Metadata (size, mtime, sha256) from the most recent listing, keyed by filename
+        self.file_info: Dict[str, Dict[str, Any]] = {}
 
-        if self.session is None:
-            # Lazy create a requests session if available; otherwise require injection.
-            try:  # pragma: no cover - environment dependent
-                import requests  # type: ignore
-            except Exception as exc:  # pragma: no cover - environment dependent
-                raise RuntimeError("SharePointClient requires an HTTP session in this environment") from exc
-            self.session = requests.Session()  # type: ignore
-            if not self.base_url:
+        if transport is None:
+            if session is None and not self.base_url:
                 self.base_url = "http://localhost:8001"
+            transport = HTTPTransport(
+                self.base_url,
+                session=session,
+                service="sharepoint",
+                connect_timeout=float(self.config.get("http_connect_timeout", 5)),
+                read_timeout=float(self.config.get("http_read_timeout", 30)),
+                retry_policy=retry_policy or RetryPolicy.from_config(self.config),
+                # Size the keep-alive pool so concurrent downloads don't churn connections
+                pool_maxsize=max(10, int(self.config.get("max_concurrent_downloads", 1))),
+            )
+        self.transport = transport
+        self.retry_policy = transport.retry_policy
+        self.session = transport.session
 
     def _url(self, path: str) -> str:
         if path.startswith("/"):
@@ -98,90 +226,534 @@ class SharePointClient:
         """Basic reachability check against sim API (optional)."""
         # Try hitting the spec endpoint; ignore failures and allow caller to proceed.
         try:
-            self.session.get(self._url("/sim/spec"))  # type: ignore[attr-defined]
+            self.transport.get(self._url("/sim/spec"), attempts=1)
         except Exception:
             pass
         return True
 
+    def _load_cursor(self) -> Optional[str]:
+        if self.cursor_path is None or not self.cursor_path.is_file():
+            return None
+        return self.cursor_path.read_text(encoding="utf-8").strip() or None
+
     def list_files(self, folder: str) -> List[str]:
-        """List files via sim API (folder is unused)."""
-        resp: Any = self.session.get(self._url("/sim/files"))  # type: ignore[attr-defined]
+        """List files via sim API (folder is unused).
+
+        Sends the last committed cursor as ``since`` so only files added after the previous
+        sync are returned (delta query). The new cursor is held until ``commit_cursor``.
+        """
+        params = {"since": self._cursor} if self._cursor else None
+        resp: Any = self.transport.get(self._url("/sim/files"), params=params)
         resp.raise_for_status()
         payload: Any = resp.json()
         files: Any = payload.get("files", [])
+        cursor = payload.get("cursor")
+        self._pending_cursor = str(cursor) if cursor else None
+        self.file_info = {str(f["filename"]): dict(f) for f in files}
         return [str(f["filename"]) for f in files]
 
+    def commit_cursor(self) -> None:
+        """Advance (and persist) the listing cursor once the listed files were handled."""
+        if self._pending_cursor is None:
+            return
+        self._cursor, self._pending_cursor = self._pending_cursor, None
+        if self.cursor_path is not None:
+            self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cursor_path.with_name(self.cursor_path.name + ".tmp")
+            tmp.write_text(self._cursor, encoding="utf-8")
+            tmp.replace(self.cursor_path)
+
     def download_file(self, folder: str, filename: str, dest: Path) -> Path:
-        """Download a file via sim API to the destination path."""
-        resp: Any = self.session.get(self._url(f"/sim/download/{filename}"))  # type: ignore[attr-defined]
-        resp.raise_for_status()
+        """Stream a file via sim API to the destination path.
+
+        The body is written in chunks to a hidden ``.part`` temp file next to ``dest``
+        (ignored by the consumer's ``*.csv`` glob), fsync'd, and atomically renamed into
+        place, so memory stays constant and partially written files are never visible.
+        When ``dest`` already exists its hash is sent as ``If-None-Match``; a 304 keeps it.
+        """
+        url = self._url(f"/sim/download/{filename}")
         dest.parent.mkdir(parents=True, exist_ok=True)
-        # TestClient returns text; real HTTP returns bytes; support both
-        content = getattr(resp, "text", None)
-        if content is not None:
-            dest.write_text(content)
-        else:
-            dest.write_bytes(resp.content)  # type: ignore[attr-defined]
-        return dest
+        headers: Dict[str, str] = {}
+        if dest.is_file():
+            headers["If-None-Match"] = f'"{sha256_file(dest)}"'
+
+        def _attempt() -> Path:
+            fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".part")
+            tmp = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    for chunk in self._iter_download(url, headers):
+                        out.write(chunk)
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp, dest)
+            except _NotModified:
+                tmp.unlink(missing_ok=True)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+            return dest
+
+        # Single attempt through the host breaker; SyncJob schedules download retries itself
+        return self.retry_policy.call(_attempt, host=host_of(url), max_attempts=1)
+
+    def download_bulk(self, folder: str, filenames: List[str], dest_dir: Path) -> List[str]:
+        """Fetch many files in one ``POST /sim/download/bulk`` request and extract them on the fly.
+
+        The tar stream is read member by member; each file is written to a ``.part`` temp file
+        in ``dest_dir``, fsync'd and atomically renamed, exactly like ``download_file``. Only
+        requested bare filenames are extracted (no paths, links or other member types).
+
+        Returns:
+            List[str]: Filenames extracted, in archive order. Files the archive did not
+            contain (or that were cut off by a failure) are simply absent.
+        """
+        url = self._url("/sim/download/bulk")
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        wanted = set(filenames)
+        payload = {"filenames": list(filenames), "format": "tar"}
+
+        def _attempt() -> List[str]:
+            extracted: List[str] = []
+            chunks = self._iter_download(url, method="POST", json=payload)
+            try:
+                reader = io.BufferedReader(_ChunkReader(chunks))
+                with tarfile.open(fileobj=reader, mode="r|") as tar:
+                    for member in tar:
+                        name = member.name
+                        if not member.isfile() or Path(name).name != name or name not in wanted:
+                            continue
+                        src = tar.extractfile(member)
+                        if src is None:  # pragma: no cover - regular files always have data
+                            continue
+                        _write_atomic(dest_dir / name, src)
+                        extracted.append(name)
+            except Exception as exc:
+                if not extracted:
+                    raise
+                # Files already renamed into place are complete; the caller refetches the rest
+                self.logger.warning("Bulk archive interrupted after %s file(s): %s", len(extracted), exc)
+            finally:
+                chunks.close()
+            return extracted
+
+        return self.retry_policy.call(_attempt, host=host_of(url), max_attempts=1)
+
+    def _iter_download(self, url: str, headers: Optional[Dict[str, str]] = None, method: str = "GET", json: Optional[Any] = None) -> Iterator[bytes]:
+        """Yield raw response bytes in chunks from either an httpx- or requests-style session."""
+        chunk_size = int(self.config.get("download_chunk_bytes", 1024 * 1024))
+        kwargs: Dict[str, Any] = {"headers": headers} if headers else {}
+        if json is not None:
+            kwargs["json"] = json
+        with self.transport.stream(method, url, **kwargs) as resp:
+            if getattr(resp, "status_code", 200) == 304:
+                raise _NotModified(url)
+            resp.raise_for_status()
+            yield from iter_body(resp, chunk_size)
+
+# --- Sharded workers / leases ---
+def shard_of(filename: str, shard_count: int) -> int:
+    """Stable shard for a file, from a CRC32 of its dataset prefix (text before '__')."""
+    dataset = filename.split("__", 1)[0]
+    return zlib.crc32(dataset.encode("utf-8")) % max(1, shard_count)
+
+
+class ShardLeases:
+    def __init__(self, db_path: str, shard_count: int, worker_id: Optional[str] = None, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.time):
+        """Lease table (SQLite) that splits the file set across scheduler processes.
+
+        Each worker owns at most its fair share (ceil(shard_count / live workers)) of shards.
+        Leases expire after ``ttl_seconds`` without renewal, so a dead worker's shards are
+        taken over on the next sync of a live one. Files are additionally claimed one by one
+        so each is downloaded exactly once even while a shard changes hands.
+
+        Args:
+            db_path: SQLite file shared by all workers (a local or shared filesystem path).
+            shard_count: Number of shards the dataset prefixes are hashed into.
+            worker_id: Unique id for this process; defaults to ``<hostname>-<pid>``.
+            ttl_seconds: Lease lifetime; should exceed the sync interval.
+            clock: Wall clock (injectable for tests); workers on different hosts must agree on it.
+        """
+        self.db_path = str(db_path)
+        self.shard_count = max(1, int(shard_count))
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.ttl = float(ttl_seconds)
+        self._clock = clock
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._tx() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS sync_workers (worker_id TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_leases (shard INTEGER PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_file_claims ("
+                "filename TEXT PRIMARY KEY, owner TEXT NOT NULL, state TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["ShardLeases"]:
+        """Build leases when ``shard_count`` > 1 is configured, else None (single worker)."""
+        count = int(config.get("shard_count", 1) or 1)
+        if count <= 1:
+            return None
+        interval_s = float(config.get("interval_minutes", 60)) * 60
+        return cls(
+            db_path=config.get("lease_db_path", "./data/state/sync_leases.sqlite3"),
+            shard_count=count,
+            worker_id=config.get("worker_id") or None,
+            ttl_seconds=float(config.get("lease_ttl_seconds", 2 * interval_s)),
+        )
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")  # serialize writers across processes
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def acquire(self) -> List[int]:
+        """Heartbeat, renew owned leases and take free/expired shards up to the fair share.
+
+        Returns:
+            List[int]: Shards this worker owns until the next renewal.
+        """
+        now = self._clock()
+        expires = now + self.ttl
+        with self._tx() as conn:
+            conn.execute(
+                "INSERT INTO sync_workers (worker_id, seen_at) VALUES (?, ?) "
+                "ON CONFLICT(worker_id) DO UPDATE SET seen_at = excluded.seen_at",
+                (self.worker_id, now),
+            )
+            conn.execute("DELETE FROM sync_workers WHERE seen_at < ?", (now - self.ttl,))
+            live = conn.execute("SELECT COUNT(*) FROM sync_workers").fetchone()[0]
+            share = -(-self.shard_count // max(1, live))
+            leases = {shard: (owner, exp) for shard, owner, exp in conn.execute("SELECT shard, owner, expires_at FROM sync_leases")}
+            owned = sorted(s for s, (owner, exp) in leases.items() if owner == self.worker_id)
+            # Give back shards beyond the fair share so newly started workers get some
+            for shard in owned[share:]:
+                conn.execute("DELETE FROM sync_leases WHERE shard = ? AND owner = ?", (shard, self.worker_id))
+            owned = owned[:share]
+            for shard in range(self.shard_count):
+                if len(owned) >= share:
+                    break
+                lease = leases.get(shard)
+                if shard in owned or (lease is not None and lease[1] >= now):
+                    continue
+                owned.append(shard)
+            for shard in owned:
+                conn.execute(
+                    "INSERT INTO sync_leases (shard, owner, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(shard) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at",
+                    (shard, self.worker_id, expires),
+                )
+        return sorted(owned)
+
+    def claim_files(self, filenames: List[str]) -> List[str]:
+        """Claim files for download; returns those this worker may fetch (input order).
+
+        A file can be claimed when unclaimed, released after a failure, or its claim has
+        expired. A done file is claimable again only after ``ttl_seconds`` (when the DB
+        service still reports it missing, e.g. because its ingest failed).
+        """
+        now = self._clock()
+        claimed: List[str] = []
+        with self._tx() as conn:
+            for name in filenames:
+                cur = conn.execute(
+                    "INSERT INTO sync_file_claims (filename, owner, state, expires_at) VALUES (?, ?, 'claimed', ?) "
+                    "ON CONFLICT(filename) DO UPDATE SET owner = excluded.owner, state = 'claimed', "
+                    "expires_at = excluded.expires_at "
+                    "WHERE sync_file_claims.state = 'released' OR sync_file_claims.expires_at < ? "
+                    "OR (sync_file_claims.state = 'claimed' AND sync_file_claims.owner = excluded.owner)",
+                    (name, self.worker_id, now + self.ttl, now),
+                )
+                if cur.rowcount:
+                    claimed.append(name)
+        return claimed
+
+    def complete_files(self, done: List[str], failed: List[str]) -> None:
+        """Mark downloaded files done and release failed ones for any worker to retry."""
+        with self._tx() as conn:
+            conn.executemany(
+                "UPDATE sync_file_claims SET state = 'done' WHERE filename = ? AND owner = ?",
+                [(n, self.worker_id) for n in done],
+            )
+            conn.executemany(
+                "UPDATE sync_file_claims SET state = 'released' WHERE filename = ? AND owner = ?",
+                [(n, self.worker_id) for n in failed],
+            )
+
+    def release(self) -> None:
+        """Drop this worker's leases and heartbeat (clean shutdown)."""
+        with self._tx() as conn:
+            conn.execute("DELETE FROM sync_leases WHERE owner = ?", (self.worker_id,))
+            conn.execute("DELETE FROM sync_workers WHERE worker_id = ?", (self.worker_id,))
+
 
 # --- SyncJob ---
 class SyncJob:
-    def __init__(self, config: Dict[str, Any], sharepoint_client: SharePointClient, db_service_client: DBServiceClient):
+    def __init__(self, config: Dict[str, Any], sharepoint_client: SharePointClient, db_service_client: DBServiceClient, retry_policy: Optional[RetryPolicy] = None, pipeline: Optional[Any] = None, leases: Optional[ShardLeases] = None):
+        """Sync new SharePoint files into ``ingestion_dir``.
+
+        Args:
+            config: Scheduler configuration.
+            sharepoint_client: Lists and downloads files.
+            db_service_client: Reports which files are not yet ingested.
+            retry_policy: Shared retry/circuit-breaker policy (defaults to the SharePoint client's).
+            pipeline: Optional in-process consumer (``consumer.file_watcher.ConsumerPipeline``).
+                Each downloaded file is handed to ``pipeline.submit(path, payload)`` as soon as
+                it lands, instead of waiting for the consumer to poll ``ingestion_dir``.
+            leases: Shard leases for sharded worker mode; defaults to ``ShardLeases.from_config``
+                (None unless ``shard_count`` > 1).
+        """
         self.config: Dict[str, Any] = config
         self.sharepoint_client = sharepoint_client
         self.db_service_client = db_service_client
+        self.pipeline = pipeline
+        self.leases = leases if leases is not None else ShardLeases.from_config(config)
+        if retry_policy is None:
+            client_policy = getattr(sharepoint_client, "retry_policy", None)
+            retry_policy = client_policy if isinstance(client_policy, RetryPolicy) else RetryPolicy.from_config(config)
+        self.retry_policy = retry_policy
+        self.last_stats: Dict[str, Any] = {}
+        self._stats: Dict[str, Any] = self._new_stats()
         self.logger = logging.getLogger("SyncJob")
     def run(self) -> List[str]:
-        """Run one sync: get already ingested, list new, download new, move files.
+        """Run one sync: list files, ask the DB service which are missing, download those.
+
+        Counters for the run (files listed/downloaded/skipped/failed, bytes, retries and
+        duration) are left in ``last_stats``, also when the run raises.
 
         Returns:
             List[str]: Filenames successfully downloaded.
         """
+        self._stats = self._new_stats()
+        http_retries = self.retry_policy.retries
+        started = time.monotonic()
+        deadline = self.config.get("sync_deadline_seconds")
+        try:
+            with self.retry_policy.deadline_in(float(deadline) if deadline else None):
+                return self._run()
+        finally:
+            self._stats["http_retries"] = self.retry_policy.retries - http_retries
+            self._stats["duration_s"] = round(time.monotonic() - started, 4)
+            self.last_stats = self._stats
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        return {
+            "files_listed": 0,
+            "files_pending": 0,
+            "files_skipped": 0,
+            "files_downloaded": 0,
+            "files_failed": 0,
+            "bytes_downloaded": 0,
+            "download_retries": 0,
+            "shards": None,
+        }
+
+    def _run(self) -> List[str]:
         folder: str = self.config.get("sharepoint_folder", "")
         ingestion_dir = Path(self.config.get("ingestion_dir", "."))
         ingestion_dir.mkdir(parents=True, exist_ok=True)
 
-        # Determine a simple time window (last hour) for querying ingested files
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(hours=1)
-
-        # Query already ingested files
-        already_ingested: List[str] = self.db_service_client.get_ingested_files(
-            start_time.isoformat(timespec="seconds"), end_time.isoformat(timespec="seconds")
-        )
-
-        # List available files from SharePoint
+        # List available files from SharePoint (only those added since the last committed cursor)
         files: List[str] = self.sharepoint_client.list_files(folder)
+        self._stats["files_listed"] = len(files)
+        # Acquiring is also this worker's heartbeat, so do it on every run, even an empty one;
+        # otherwise an idle worker's leases expire and other workers take its shards
+        shards = self._acquire_shards() if self.leases is not None else None
         if not files:
+            if shards is None:
+                self._commit_listing()
             return []
 
-        downloaded: List[str] = []
-        max_retries: int = int(self.config.get("max_retries", 1))
-        retry_delay: float = float(self.config.get("retry_delay_seconds", 0))
-        for name in files:
-            if name in already_ingested:
-                continue
-            dest = ingestion_dir / name
-            attempt = 0
-            success = False
-            while True:
-                try:
-                    self.sharepoint_client.download_file(folder, name, dest)
-                    success = True
-                    break
-                except Exception as exc:  # noqa: BLE001
-                    attempt += 1
-                    if attempt >= max_retries:
-                        self.logger.error("Failed to download %s after %s attempts: %s", name, attempt, exc)
-                        dest.unlink(missing_ok=True)
-                        break
-                    if retry_delay > 0:
-                        time.sleep(retry_delay)
+        # Ask the DB service which of them have not been ingested yet
+        missing = set(self.db_service_client.get_missing_files(files))
+        pending = [name for name in files if name in missing]
+        # Skip files whose local copy already matches the published size/hash (e.g. after a restart)
+        file_info = getattr(self.sharepoint_client, "file_info", None)
+        if isinstance(file_info, dict) and file_info:
+            fresh = [n for n in pending if n in file_info and local_copy_matches(ingestion_dir / n, file_info[n])]
+            if fresh:
+                self.logger.info("Skipping %s file(s) already present in %s", len(fresh), ingestion_dir)
+                pending = [n for n in pending if n not in set(fresh)]
+                for name in fresh:
+                    self._handoff(ingestion_dir / name)
+        if shards is not None:
+            pending = self._claim_sharded(pending, shards)
+        self._stats["files_pending"] = len(pending)
+        self._stats["files_skipped"] = len(files) - len(pending)
+        bulk = getattr(self.sharepoint_client, "download_bulk", None)
+        if self.config.get("bulk_download") and callable(bulk) and pending:
+            downloaded = self._download_bulk(folder, pending, ingestion_dir)
+        else:
+            downloaded = self._download_all(folder, pending, ingestion_dir)
+        self._stats["files_downloaded"] = len(downloaded)
+        self._stats["files_failed"] = len(pending) - len(downloaded)
+        if self.leases is not None:
+            done = set(downloaded)
+            self.leases.complete_files(downloaded, [n for n in pending if n not in done])
+            # A shard taken over from a dead worker must be listed from scratch, so the
+            # listing cursor is never advanced in sharded mode
+            return downloaded
+        # Only advance the listing cursor when nothing failed, so failures are re-listed next sync
+        if len(downloaded) == len(pending):
+            self._commit_listing()
+        return downloaded
+
+    def _acquire_shards(self) -> set[int]:
+        """Heartbeat and renew this worker's shard leases; returns the shards it owns."""
+        if self.leases is None:
+            raise RuntimeError("SyncJob has no shard leases configured")
+        shards = set(self.leases.acquire())
+        self._stats["shards"] = sorted(shards)
+        return shards
+
+    def _claim_sharded(self, pending: List[str], shards: set[int]) -> List[str]:
+        """Keep files in ``shards`` (leased by this worker), then claim them for exactly-once download."""
+        if self.leases is None:
+            raise RuntimeError("SyncJob has no shard leases configured")
+        mine = [n for n in pending if shard_of(n, self.leases.shard_count) in shards]
+        claimed = self.leases.claim_files(mine)
+        if len(claimed) < len(mine):
+            self.logger.info("%s file(s) already claimed by another worker", len(mine) - len(claimed))
+        return claimed
+
+    def _download_bulk(self, folder: str, names: List[str], ingestion_dir: Path) -> List[str]:
+        """Download files ``bulk_batch_size`` at a time as one archive request per batch.
+
+        Files missing from a batch's archive (or the whole batch, if the request fails) fall
+        back to per-file downloads with the usual retry handling.
+
+        Returns:
+            List[str]: Filenames successfully downloaded, in listing order.
+        """
+        batch_size = max(1, int(self.config.get("bulk_batch_size", 50)))
+        succeeded: set[str] = set()
+        leftovers: List[str] = []
+        for i in range(0, len(names), batch_size):
+            batch = names[i:i + batch_size]
+            try:
+                got = set(self.sharepoint_client.download_bulk(folder, batch, ingestion_dir))  # type: ignore[attr-defined]
+            except Exception as exc:
+                self.logger.warning("Bulk download of %s file(s) failed, falling back to single downloads: %s", len(batch), exc)
+                got = set()
+            for name in batch:
+                if name not in got:
+                    leftovers.append(name)
                     continue
-            if success:
-                downloaded.append(name)
+                succeeded.add(name)
+                path = ingestion_dir / name
+                payload = path.read_bytes() if self.pipeline is not None else None
+                try:
+                    self._stats["bytes_downloaded"] += len(payload) if payload is not None else path.stat().st_size
+                except OSError:
+                    pass
+                self._handoff(path, payload)
+        if leftovers:
+            succeeded.update(self._download_all(folder, leftovers, ingestion_dir))
+        return [name for name in names if name in succeeded]
 
-        return downloaded
+    def _fetch(self, folder: str, name: str, dest: Path) -> Tuple[int, Optional[bytes]]:
+        """Download one file; return its size and, in pipeline mode, its bytes (still hot in page cache)."""
+        self.sharepoint_client.download_file(folder, name, dest)
+        if self.pipeline is not None:
+            payload = dest.read_bytes()
+            return len(payload), payload
+        try:
+            return dest.stat().st_size, None
+        except OSError:  # test doubles may not write the file
+            return 0, None
+
+    def _handoff(self, path: Path, payload: Optional[bytes] = None) -> None:
+        """Submit a downloaded file to the pipeline; blocks while its queue is full."""
+        if self.pipeline is None:
+            return
+        try:
+            self.pipeline.submit(path, payload)
+        except Exception as exc:
+            # The file stays in ingestion_dir for the polling consumer
+            self.logger.warning("Pipeline handoff failed for %s: %s", path.name, exc)
+
+    def _commit_listing(self) -> None:
+        commit = getattr(self.sharepoint_client, "commit_cursor", None)
+        if callable(commit):
+            commit()
+
+    def _download_all(self, folder: str, names: List[str], ingestion_dir: Path) -> List[str]:
+        """Download files with up to ``max_concurrent_downloads`` in flight.
+
+        Failed attempts are re-queued after an exponential, jittered backoff instead of
+        sleeping in the worker, so one flaky file does not hold up the others. Retries that
+        would land past the sync deadline, and downloads refused by an open circuit, are
+        given up immediately (the files are listed again next sync). In pipeline mode each
+        completed file is handed to the consumer before more downloads are started.
+
+        Returns:
+            List[str]: Filenames successfully downloaded, in listing order.
+        """
+        max_workers = max(1, int(self.config.get("max_concurrent_downloads", 1)))
+        max_retries: int = int(self.config.get("max_retries", 1))
+        policy = self.retry_policy
+        ready: deque[Tuple[str, int]] = deque((name, 0) for name in names)
+        delayed: List[Tuple[float, int, str, int]] = []  # (due, seq, name, attempts) min-heap
+        in_flight: Dict[Future[Tuple[int, Optional[bytes]]], Tuple[str, int]] = {}
+        succeeded: set[str] = set()
+        seq = 0
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download") as pool:
+            while ready or delayed or in_flight:
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    _, _, name, attempts = heapq.heappop(delayed)
+                    ready.append((name, attempts))
+                left = policy.time_left()
+                if left is not None and left <= 0 and (ready or delayed):
+                    self.logger.error("Sync deadline reached; %s download(s) deferred", len(ready) + len(delayed))
+                    ready.clear()
+                    delayed.clear()
+                while ready and len(in_flight) < max_workers:
+                    name, attempts = ready.popleft()
+                    fut = pool.submit(self._fetch, folder, name, ingestion_dir / name)
+                    in_flight[fut] = (name, attempts)
+                next_due = delayed[0][0] - time.monotonic() if delayed else None
+                if not in_flight:
+                    time.sleep(max(0.0, next_due or 0.0))
+                    continue
+                done, _ = wait(in_flight, timeout=None if next_due is None else max(0.0, next_due), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name, attempts = in_flight.pop(fut)
+                    exc = fut.exception()
+                    if exc is None:
+                        succeeded.add(name)
+                        size, payload = fut.result()
+                        self._stats["bytes_downloaded"] += size
+                        # Blocking here when the consumer lags also stops new downloads (backpressure)
+                        self._handoff(ingestion_dir / name, payload)
+                        continue
+                    attempts += 1
+                    delay = policy.backoff(attempts)
+                    left = policy.time_left()
+                    give_up = (
+                        attempts >= max_retries
+                        or isinstance(exc, CircuitOpenError)
+                        or (left is not None and delay >= left)
+                    )
+                    if give_up:
+                        self.logger.error("Failed to download %s after %s attempts: %s", name, attempts, exc)
+                        continue
+                    seq += 1
+                    self._stats["download_retries"] += 1
+                    heapq.heappush(delayed, (time.monotonic() + delay, seq, name, attempts))
+        return [name for name in names if name in succeeded]
     def _move_file(self, path: Path) -> None:
         """Move file to ingestion directory (stub)."""
         dest = Path(self.config.get("ingestion_dir", ".")) / path.name
@@ -199,40 +771,237 @@ class SyncJob:
                 # Ignore cleanup failures; caller may handle
                 pass
 
+# --- Adaptive interval ---
+def next_quad_daily(now: datetime, times: List[str]) -> Optional[datetime]:
+    """Return the next wall-clock occurrence (after ``now``) of any HH:MM in ``times``."""
+    candidates: List[datetime] = []
+    for t in times:
+        hour, minute = (int(part) for part in t.split(":", 1))
+        at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if at <= now:
+            at += timedelta(days=1)
+        candidates.append(at)
+    return min(candidates) if candidates else None
+
+
+class AdaptiveInterval:
+    def __init__(self, min_seconds: float, max_seconds: float, factor: float = 2.0):
+        """Sync interval that tracks file arrival rate.
+
+        A sync that finds new files drops the interval to ``min_seconds`` (a burst is likely to
+        continue); each empty sync multiplies it by ``factor`` up to ``max_seconds``.
+
+        Args:
+            min_seconds: Shortest interval between syncs.
+            max_seconds: Longest interval between syncs.
+            factor: Backoff multiplier applied after an empty sync.
+        """
+        self.min_seconds = max(1.0, float(min_seconds))
+        self.max_seconds = max(self.min_seconds, float(max_seconds))
+        self.factor = max(1.0, float(factor))
+        self.current = self.min_seconds
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "AdaptiveInterval":
+        interval_minutes = float(config.get("interval_minutes", 60))
+        return cls(
+            min_seconds=float(config.get("adaptive_min_minutes", 1)) * 60,
+            max_seconds=float(config.get("adaptive_max_minutes", interval_minutes)) * 60,
+            factor=float(config.get("adaptive_backoff_factor", 2.0)),
+        )
+
+    def observe(self, new_files: int) -> float:
+        """Update the interval from the outcome of a sync and return it (seconds)."""
+        if new_files > 0:
+            self.current = self.min_seconds
+        else:
+            self.current = min(self.max_seconds, self.current * self.factor)
+        return self.current
+
+
 # --- Scheduler ---
 class Scheduler:
-    def __init__(self, config: Dict[str, Any], sharepoint_client: SharePointClient, db_service_client: DBServiceClient):
+    def __init__(self, config: Dict[str, Any], sharepoint_client: SharePointClient, db_service_client: DBServiceClient, pipeline: Optional[Any] = None):
         self.config: Dict[str, Any] = config
         self.sharepoint_client = sharepoint_client
         self.db_service_client = db_service_client
-        self.sync_job = SyncJob(config, sharepoint_client, db_service_client)
+        self.pipeline = pipeline
+        self.sync_job = SyncJob(config, sharepoint_client, db_service_client, pipeline=pipeline)
         self.logger = logging.getLogger("Scheduler")
+        self.paused = False
+        self.history: deque[Dict[str, Any]] = deque(maxlen=max(1, int(config.get("run_history_size", 50))))
+        self._run_lock = threading.Lock()
+        self._runs_total = 0
+        self._current: Optional[Dict[str, Any]] = None
+        self.quad_daily_times: List[str] = list(config.get("quad_daily_times") or [])
+        self.adaptive: Optional[AdaptiveInterval] = None
+        if config.get("schedule_mode", "interval") == "adaptive":
+            self.adaptive = AdaptiveInterval.from_config(config)
+        self._stop = threading.Event()
+        self._next_run_at: Optional[datetime] = None
     def _schedule_jobs(self) -> None:
-        """Register scheduled jobs using APScheduler if available."""
+        """Register scheduled jobs using APScheduler if available.
+
+        In ``schedule_mode = "adaptive"`` a background thread runs the adaptive loop instead
+        (no APScheduler needed). Either way every ``quad_daily_times`` entry gets a run.
+        """
+        if self.adaptive is not None:
+            self._loop_thread = threading.Thread(target=self._adaptive_loop, name="scheduler-adaptive", daemon=True)
+            self._loop_thread.start()
+            return
         interval_minutes = int(self.config.get("interval_minutes", 60))
         if BackgroundScheduler is None:  # pragma: no cover - optional dependency
             self.logger.warning("APScheduler not available; skipping background scheduling")
             return
         self._scheduler = BackgroundScheduler()  # type: ignore[attr-defined]
-        self._scheduler.add_job(self.sync_job.run, "interval", minutes=interval_minutes, id="sync_job")  # type: ignore[call-arg]
+        self._scheduler.add_job(self._scheduled_run, "interval", minutes=interval_minutes, id="sync_job")  # type: ignore[call-arg]
+        for i, at in enumerate(self.quad_daily_times):  # pragma: no cover - optional dependency
+            hour, minute = at.split(":", 1)
+            self._scheduler.add_job(self._scheduled_run, "cron", hour=int(hour), minute=int(minute), id=f"sync_job_daily_{i}")  # type: ignore[call-arg]
         self._scheduler.start()  # type: ignore[misc]
+    def next_delay(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the next adaptive run, never sleeping past a quad-daily time."""
+        now = now or datetime.now()
+        delay = self.adaptive.current if self.adaptive is not None else float(self.config.get("interval_minutes", 60)) * 60
+        fixed = next_quad_daily(now, self.quad_daily_times)
+        if fixed is not None:
+            delay = min(delay, (fixed - now).total_seconds())
+        return max(0.0, delay)
+    def _adaptive_loop(self) -> None:
+        assert self.adaptive is not None
+        while not self._stop.is_set():
+            delay = self.next_delay()
+            self._next_run_at = datetime.now() + timedelta(seconds=delay)
+            if self._stop.wait(delay):
+                return
+            self._scheduled_run()
+    def _observe_run(self, record: Dict[str, Any]) -> None:
+        if self.adaptive is None or record.get("status") != "ok":
+            return
+        new_files = record.get("files_downloaded")
+        interval = self.adaptive.observe(new_files if isinstance(new_files, int) else 0)
+        self.logger.info("Adaptive interval now %.0fs (downloaded=%s)", interval, new_files)
     def _handle_shutdown(self) -> None:
         """Handle graceful shutdown (stub for patching in tests)."""
         return
+    def _scheduled_run(self) -> None:
+        if self.paused:
+            self.logger.info("Scheduler paused; skipping scheduled sync")
+            return
+        if self.is_running:
+            self.logger.info("Previous sync still running; skipping scheduled sync")
+            return
+        try:
+            self.execute("scheduled")
+        except Exception:
+            pass  # already logged and recorded in history
+        if self.history:
+            self._observe_run(self.history[-1])
     def run_once(self):
         self.logger.info("Running scheduled sync job...")
-        self.sync_job.run()
+        self.execute("run-once")
     def trigger(self):
         self.logger.info("Manual trigger of sync job...")
-        self.sync_job.run()
+        self.execute("manual")
+    @property
+    def is_running(self) -> bool:
+        return self._run_lock.locked()
+    def try_claim_run(self) -> bool:
+        """Take the run lock without waiting; False if a run is already in progress.
+
+        A successful claim must be handed to ``execute(..., claimed=True)``, which releases it.
+        """
+        return self._run_lock.acquire(blocking=False)
+    def release_claim(self) -> None:
+        """Give back a ``try_claim_run`` claim whose run will not happen."""
+        self._run_lock.release()
+    def execute(self, trigger: str = "manual", claimed: bool = False) -> Dict[str, Any]:
+        """Run the sync job once and record it in ``history``.
+
+        Runs are serialized; a second caller waits for the one in progress.
+
+        Args:
+            trigger: What started the run (scheduled, manual, run-once, api).
+            claimed: The caller already holds the run lock from ``try_claim_run``.
+
+        Returns:
+            Dict[str, Any]: The run record (timing, outcome and SyncJob counters).
+
+        Raises:
+            Exception: Whatever the sync job raised (after it has been recorded).
+        """
+        if not claimed:
+            self._run_lock.acquire()
+        try:
+            self._runs_total += 1
+            record: Dict[str, Any] = {
+                "run_id": self._runs_total,
+                "trigger": trigger,
+                "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "status": "running",
+            }
+            self._current = record
+            started = time.monotonic()
+            try:
+                self.sync_job.run()
+                record["status"] = "ok"
+            except Exception as exc:
+                record["status"] = "error"
+                record["error"] = str(exc)
+                self.logger.error("Sync run %s failed: %s", record["run_id"], exc)
+                raise
+            finally:
+                record["finished_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+                record["duration_s"] = round(time.monotonic() - started, 4)
+                stats = getattr(self.sync_job, "last_stats", None)
+                if isinstance(stats, dict):
+                    record.update({k: v for k, v in stats.items() if k != "duration_s"})
+                self.history.append(record)
+                self._current = None
+                self.logger.info(
+                    "sync_run id=%s status=%s duration_s=%s listed=%s downloaded=%s skipped=%s bytes=%s",
+                    record["run_id"], record["status"], record["duration_s"], record.get("files_listed"),
+                    record.get("files_downloaded"), record.get("files_skipped"), record.get("bytes_downloaded"),
+                )
+        finally:
+            self._run_lock.release()
+        return record
+    def pause(self) -> None:
+        """Skip scheduled runs until resumed (manual triggers still run)."""
+        self.paused = True
+    def resume(self) -> None:
+        self.paused = False
+    def status(self) -> Dict[str, Any]:
+        """Snapshot of scheduler state for the control-plane API."""
+        return {
+            "state": "running" if self.is_running else ("paused" if self.paused else "idle"),
+            "paused": self.paused,
+            "running": self.is_running,
+            "current_run": dict(self._current) if self._current else None,
+            "runs_total": self._runs_total,
+            "interval_minutes": int(self.config.get("interval_minutes", 60)),
+            "schedule_mode": "adaptive" if self.adaptive is not None else "interval",
+            "adaptive_interval_s": self.adaptive.current if self.adaptive is not None else None,
+            "next_run_at": self._next_run_at.isoformat(timespec="seconds") if self._next_run_at else None,
+            "last_run": self.history[-1] if self.history else None,
+        }
+    def runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent run records, newest first."""
+        return list(reversed(self.history))[: max(0, int(limit))]
     def shutdown(self):
         self.logger.info("Scheduler shutting down...")
+        self._stop.set()
         sched = getattr(self, "_scheduler", None)
         if sched is not None:  # pragma: no cover
             try:
                 sched.shutdown()
             except Exception:
                 pass
+        if self.pipeline is not None:
+            self.pipeline.close()
+        leases = getattr(self.sync_job, "leases", None)
+        if isinstance(leases, ShardLeases):
+            leases.release()
     # TODO: Add scheduling, signal handling, config loading, etc.
 
 # --- CLI Entrypoint ---
@@ -245,9 +1014,11 @@ def main():
     args = parser.parse_args()
 
     cfg = load_config()
-    sp = SharePointClient(cfg)
-    db = DBServiceClient()
-    scheduler = Scheduler(cfg, sp, db)
+    policy = RetryPolicy.from_config(cfg)
+    sp = SharePointClient(cfg, retry_policy=policy)
+    db = DBServiceClient(retry_policy=policy)
+    pipeline = _build_pipeline(cfg) if cfg.get("pipeline_mode") else None
+    scheduler = Scheduler(cfg, sp, db, pipeline=pipeline)
 
     def _handle_sig(_sig: int, _frm: Any) -> None:  # pragma: no cover - runtime only
         scheduler.shutdown()
@@ -260,8 +1031,10 @@ def main():
 
     if args.command == "run-once":
         scheduler.run_once()
+        scheduler.shutdown()
     elif args.command == "trigger":
         scheduler.trigger()
+        scheduler.shutdown()
     else:  # start
         scheduler._schedule_jobs()  # type: ignore[protected-access]
         try:  # keep process alive
@@ -270,13 +1043,66 @@ def main():
         except KeyboardInterrupt:  # pragma: no cover
             scheduler.shutdown()
 
+def _build_pipeline(cfg: Dict[str, Any]) -> Any:  # pragma: no cover - runtime wiring
+    """Create an in-process FileConsumer pipeline writing to the local DB service."""
+    from consumer.file_watcher import ConsumerPipeline, FileConsumer  # src/ must be on PYTHONPATH
+    from db_service import DBClient
+
+    archive_dir = Path(cfg.get("archive_dir", "./data/outputs"))
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    consumer = FileConsumer(
+        input_dir=Path(cfg.get("ingestion_dir", ".")),
+        archive_dir=archive_dir,
+        db_service=DBClient(),
+        max_workers=int(cfg.get("pipeline_workers", 1)),
+    )
+    return ConsumerPipeline(consumer, queue_size=int(cfg.get("pipeline_queue_size", 16)))
+
 # Provide a minimal load_config stub to support tests that patch this symbol.
-def load_config() -> Dict[str, Any]:
-    """Load scheduler configuration (stub for tests)."""
+SETTINGS_PATH = Path(__file__).resolve().parent / "config" / "settings.toml"
+DEFAULT_QUAD_DAILY_TIMES = ["08:00", "12:00", "16:00", "19:00"]
+
+
+def load_quad_daily_times(path: Optional[Path | str] = None) -> List[str]:
+    """Return ``[schedules] quad_daily_times`` from ``config/settings.toml`` (or ``SCHEDULER_SETTINGS_PATH``).
+
+    A missing file or key gives ``DEFAULT_QUAD_DAILY_TIMES``.
+    """
+    if path is None:
+        path = os.environ.get("SCHEDULER_SETTINGS_PATH") or SETTINGS_PATH
+    p = Path(path)
+    if not p.exists():
+        return list(DEFAULT_QUAD_DAILY_TIMES)
+    times = tomllib.loads(p.read_text(encoding="utf-8")).get("schedules", {}).get("quad_daily_times")
+    return [str(t) for t in times] if times is not None else list(DEFAULT_QUAD_DAILY_TIMES)
+
+
+def load_config(settings_path: Optional[Path | str] = None) -> Dict[str, Any]:
+    """Load scheduler configuration (stub for tests); schedule times come from the settings file."""
     return {
         "sharepoint_folder": "/Shared Documents/Reports",
         "ingestion_dir": "./data/incoming",
         "interval_minutes": 60,
+        "schedule_mode": "interval",  # or "adaptive"
+        "adaptive_min_minutes": 1,
+        "adaptive_max_minutes": 60,
+        "adaptive_backoff_factor": 2.0,
+        "quad_daily_times": load_quad_daily_times(settings_path),
         "max_retries": 3,
-        "retry_delay_seconds": 60,
+        "retry_delay_seconds": 2,
+        "retry_max_delay_seconds": 30,
+        "circuit_failure_threshold": 5,
+        "circuit_reset_seconds": 30,
+        "sync_deadline_seconds": 600,
+        "max_concurrent_downloads": 4,
+        "bulk_download": False,  # fetch new files as tar archives of bulk_batch_size
+        "bulk_batch_size": 50,
+        "pipeline_mode": False,
+        "archive_dir": "./data/outputs",
+        "pipeline_queue_size": 16,
+        "pipeline_workers": 1,
+        "list_cursor_path": "./data/state/sim_list_cursor",
+        # Sharded worker mode: >1 splits datasets across scheduler processes sharing lease_db_path
+        "shard_count": 1,
+        "lease_db_path": "./data/state/sync_leases.sqlite3",
     }
@@ -6,27 +6,42 @@ SharePoint simulator FastAPI endpoints (mounted under /sim).
 """
 from __future__ import annotations
 
-from typing import List
+from typing import Any, List, Optional
 from pathlib import Path
 import os
 
+try:
+    from http_transport import HTTPTransport, iter_body
+except ImportError:  # run from the repo root without src/ on sys.path
+    from src.http_transport import HTTPTransport, iter_body
+
 try:
     import requests  # type: ignore
 except Exception as exc:  # pragma: no cover - environment dependent
     requests = None  # type: ignore
 
+_transport: Optional[HTTPTransport] = None
+
 
 def _base_url() -> str:
     # Prefer environment, fall back to localhost:8001
     return os.environ.get("SIM_BASE_URL", "http://localhost:8001").rstrip("/")
 
 
+def _http() -> HTTPTransport:
+    """Pooled transport for the simulator; rebuilt if SIM_BASE_URL changes."""
+    global _transport
+    if _transport is None or _transport.base_url != _base_url():
+        _transport = HTTPTransport(_base_url(), service="sharepoint")
+    return _transport
+
+
 def authenticate_sharepoint() -> None:
     """Authenticate with SharePoint/Graph API (no-op for simulator)."""
     if requests is None:  # pragma: no cover
         return
     try:
-        requests.get(f"{_base_url()}/sim/spec", timeout=5)
+        _http().get("/sim/spec", timeout=5, attempts=1)
     except Exception:
         # Reachability is best-effort; callers can proceed and handle failures lazily
         return
@@ -42,7 +57,7 @@ def list_sharepoint_files(folder: str) -> List[str]:
     """
     if requests is None:  # pragma: no cover
         return []
-    resp = requests.get(f"{_base_url()}/sim/files", timeout=10)
+    resp = _http().get("/sim/files", timeout=10)
     resp.raise_for_status()
     payload = resp.json()
     files = payload.get("files", [])
@@ -61,9 +76,20 @@ def download_sharepoint_file(folder: str, filename: str, dest: Path) -> Path:
     """
     if requests is None:  # pragma: no cover
         raise RuntimeError("HTTP client unavailable in this environment")
-    resp = requests.get(f"{_base_url()}/sim/download/{filename}", timeout=30)
-    resp.raise_for_status()
     dest.parent.mkdir(parents=True, exist_ok=True)
-    # Write bytes; requests returns bytes for content
-    dest.write_bytes(resp.content)
+    resp: Any = _http().request("GET", f"/sim/download/{filename}", timeout=30, stream=True)
+    try:
+        resp.raise_for_status()
+        tmp = dest.with_name(f".{dest.name}.part")
+        try:
+            with tmp.open("wb") as out:
+                for chunk in iter_body(resp, 1024 * 1024):
+                    out.write(chunk)
+            tmp.replace(dest)
+        except BaseException:
+            # Don't leave a half-written temp file behind, like SharePointClient.download_file
+            tmp.unlink(missing_ok=True)
+            raise
+    finally:
+        resp.close()
     return dest
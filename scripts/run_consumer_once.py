@@ -4,6 +4,12 @@
 Environment variables:
   INGESTION_DIR  - directory to read CSVs from (default: ./data/incoming)
   ARCHIVE_DIR    - directory to move processed CSVs to (default: ./data/outputs)
+  CONSUMER_DB_API_URL - when set, upload to a remote DB service over HTTP instead of in-process
+  CONSUMER_WORKERS - number of files processed concurrently (default: 1); the DB service
+                   applies HTTP uploads one at a time under its write lock, so more workers
+                   only overlap reading, transfer and CSV parsing, not the writes
+  ARCHIVE_MODE   - move (default), gzip or zstd; compressed modes archive in the background
+  CONSUMER_METRICS_PATH - write a Prometheus text snapshot of per-stage ingest metrics here
 
 Usage:
   python scripts/run_consumer_once.py
@@ -15,7 +21,9 @@ import logging
 from pathlib import Path
 
 from src.consumer.file_watcher import FileConsumer
+from src.consumer.metrics import ConsumerMetrics
 from src.db_service import DBClient
+from src.db_service_http import HTTPDBClient
 
 
 def main() -> None:
@@ -25,8 +33,24 @@ def main() -> None:
     input_dir.mkdir(parents=True, exist_ok=True)
     archive_dir.mkdir(parents=True, exist_ok=True)
 
-    consumer = FileConsumer(input_dir=input_dir, archive_dir=archive_dir, db_service=DBClient())
-    consumer.consume_new_files()
+    workers = int(os.environ.get("CONSUMER_WORKERS", "1"))
+    db_api_url = os.environ.get("CONSUMER_DB_API_URL")
+    metrics = ConsumerMetrics()
+    db_service = HTTPDBClient(db_api_url, max_concurrency=workers) if db_api_url else DBClient(metrics=metrics)
+    consumer = FileConsumer(
+        input_dir=input_dir,
+        archive_dir=archive_dir,
+        db_service=db_service,
+        max_workers=workers,
+        archive_mode=os.environ.get("ARCHIVE_MODE", "move"),
+        metrics=metrics,
+        metrics_path=os.environ.get("CONSUMER_METRICS_PATH") or None,
+    )
+    try:
+        consumer.consume_new_files()
+    finally:
+        consumer.close()
+        consumer.write_metrics()
     print(f"Processed CSVs from {input_dir} to {archive_dir} and ingested into DB.")
 
 
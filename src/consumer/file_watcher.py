@@ -2,11 +2,27 @@
 
 Implements all behaviors and interfaces specified in file_consumer_spec.md.
 """
+import gzip
+import os
+import queue
 import shutil
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, Any
 
+from .metrics import ConsumerMetrics
+
+try:  # Optional zstandard import for .csv.zst archives
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
+
+ARCHIVE_MODES = ("move", "gzip", "zstd")
+
 class FileConsumer:
     """Consumes new files from an input directory, archives them, and sends to DB service.
 
@@ -16,69 +32,168 @@ class FileConsumer:
         db_service (Any): Service for sending data to the database.
         tracker (Optional[Any]): Tracks processed files. Defaults to in-memory.
         logger (Optional[logging.Logger]): Logger instance. Defaults to standard logger.
+        max_workers (int): Files processed concurrently (useful with a remote HTTP DB client). Defaults to 1.
+        archive_mode (str): "move" (raw synchronous move), or "gzip"/"zstd" to compress in a background worker.
+        archive_queue_size (int): Bound on files waiting for the background archiver. Defaults to 64.
+        metrics (Optional[ConsumerMetrics]): Stage timing/counter sink. Share it with the DB client to
+            capture parse/ddl/insert/log timings. Defaults to a private instance.
+        metrics_path (Optional[Path]): Write a Prometheus text snapshot here after each run.
     """
-    def __init__(self, input_dir: Path, archive_dir: Path, db_service: Any, tracker: Optional[Any] = None, logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        input_dir: Path,
+        archive_dir: Path,
+        db_service: Any,
+        tracker: Optional[Any] = None,
+        logger: Optional[logging.Logger] = None,
+        max_workers: int = 1,
+        archive_mode: str = "move",
+        archive_queue_size: int = 64,
+        metrics: Optional[ConsumerMetrics] = None,
+        metrics_path: Optional[Path] = None,
+    ) -> None:
+        if archive_mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unsupported archive mode: {archive_mode}")
         self.input_dir = Path(input_dir)
         self.archive_dir = Path(archive_dir)
         self.db_service = db_service
         self.tracker = tracker or InMemoryTracker()
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max(1, int(max_workers))
+        self.archive_mode = archive_mode
+        self.metrics = metrics or ConsumerMetrics()
+        self.metrics_path = Path(metrics_path) if metrics_path else None
+        self._backlog = 0
+        self._backlog_lock = threading.Lock()
+        self._archiver: Optional[BackgroundArchiver] = None
+        if archive_mode != "move":
+            self._archiver = BackgroundArchiver(
+                self.archive_dir, archive_mode, archive_queue_size, self.logger, metrics=self.metrics
+            )
 
     def consume_new_files(self) -> None:
         """Process all unprocessed files in the input directory."""
-        for file_path in self.input_dir.glob("*.csv"):
-            if not self.tracker.is_processed(file_path.name):
-                self.process_file(file_path)
+        pending = [p for p in self.input_dir.glob("*.csv") if not self.tracker.is_processed(p.name)]
+        self._set_backlog(len(pending))
+        if self.max_workers == 1 or len(pending) <= 1:
+            for file_path in pending:
+                self._process_pending(file_path)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="consumer") as pool:
+                # process_file logs its own failures, so draining the iterator cannot raise
+                list(pool.map(self._process_pending, pending))
+        self.write_metrics()
+
+    def _process_pending(self, path: Path) -> None:
+        try:
+            self.process_file(path)
+        finally:
+            with self._backlog_lock:
+                self._backlog -= 1
+                self.metrics.set_gauge("backlog_files", max(self._backlog, 0))
+
+    def _set_backlog(self, count: int) -> None:
+        with self._backlog_lock:
+            self._backlog = count
+            self.metrics.set_gauge("backlog_files", count)
 
-    def process_file(self, path: Path) -> None:
+    def write_metrics(self) -> None:
+        """Write the Prometheus text snapshot to ``metrics_path`` (if configured)."""
+        if self._archiver is not None:
+            self.metrics.set_gauge("archive_queue_files", self._archiver.qsize())
+        if self.metrics_path is None:
+            return
+        try:
+            self.metrics.write_snapshot(self.metrics_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write metrics snapshot {self.metrics_path}: {e}")
+
+    def process_file(self, path: Path, payload: bytes | str | None = None) -> None:
         """Validate, send to DB, and archive file if successful.
 
         Args:
             path (Path): Path to the file to process.
+            payload (bytes | str | None): File contents already held in memory (pipeline mode);
+                when omitted the file is read from disk.
         """
         if not self.validate_file(path):
             self.logger.info(f"Skipping invalid file: {path.name}")
             return
-        try:
-            with path.open("r") as f:
-                data = f.read()
-            # Use dataset prefix (before '__') as the destination table name
-            filename = path.name
-            stem = path.stem
-            dataset = stem.split("__", 1)[0] if "__" in stem else stem
-            self.send_to_db(data, table_name=dataset, original_filename=filename)
-            self.archive_file(path)
-            self.tracker.mark_processed(path.name)
-        except Exception as e:
-            self.logger.error(f"Failed to process {path.name}: {e}")
+        started = time.perf_counter()
+        with self.metrics.file_scope() as timings:
+            try:
+                with self.metrics.stage("read"):
+                    if payload is None:
+                        with path.open("r") as f:
+                            data = f.read()
+                        nbytes = path.stat().st_size
+                    elif isinstance(payload, bytes):
+                        data = payload.decode("utf-8")
+                        nbytes = len(payload)
+                    else:
+                        data = payload
+                        nbytes = len(payload.encode("utf-8"))
+                # Use dataset prefix (before '__') as the destination table name
+                filename = path.name
+                stem = path.stem
+                dataset = stem.split("__", 1)[0] if "__" in stem else stem
+                with self.metrics.stage("send"):
+                    result = self.send_to_db(data, table_name=dataset, original_filename=filename)
+                self.archive_file(path)
+                self.tracker.mark_processed(path.name)
+            except Exception as e:
+                self.metrics.inc("files_error")
+                self.logger.error(f"Failed to process {path.name}: {e}")
+                return
+        rows = int(result.get("row_count", 0)) if isinstance(result, dict) else 0
+        self.metrics.inc("files_ok")
+        self.metrics.inc("rows", rows)
+        self.metrics.inc("bytes", nbytes)
+        stages = " ".join(f"{k}_s={v:.4f}" for k, v in timings.items())
+        self.logger.info(
+            f"ingest_metrics file={filename} dataset={dataset} rows={rows} bytes={nbytes} "
+            f"total_s={time.perf_counter() - started:.4f} {stages}"
+        )
 
     def archive_file(self, path: Path) -> None:
-        """Move file to archive directory.
+        """Move file to archive directory, or queue it for compressed background archiving.
 
         Args:
             path (Path): Path to the file to archive.
         """
+        if self._archiver is not None:
+            self._archiver.submit(path)
+            return
         dest = self.archive_dir / path.name
-        shutil.move(str(path), str(dest))
+        with self.metrics.stage("archive"):
+            shutil.move(str(path), str(dest))
 
-    def send_to_db(self, data: str, table_name: str | None = None, original_filename: str | None = None) -> None:
+    def close(self) -> None:
+        """Wait for queued background archives to finish and stop the archiver."""
+        if self._archiver is not None:
+            self._archiver.close()
+
+    def send_to_db(self, data: str, table_name: str | None = None, original_filename: str | None = None) -> Any:
         """Send file data to the DB service.
 
         Args:
             data (str): File contents to send.
             table_name (str | None): Optional explicit table name.
             original_filename (str | None): Original filename for ingestion logging.
+
+        Returns:
+            Any: Whatever the DB client returns (DBClient returns a dict with row_count).
         """
         # Forward optional table name if supported by the DB client
         try:
             # Prefer newer signature supporting filename
             try:
-                self.db_service.send_to_db(data, table_name=table_name, original_filename=original_filename)
+                return self.db_service.send_to_db(data, table_name=table_name, original_filename=original_filename)
             except TypeError:
-                self.db_service.send_to_db(data, table_name=table_name)
+                return self.db_service.send_to_db(data, table_name=table_name)
         except TypeError:
             # Fallback for legacy clients that only accept a single positional argument
-            self.db_service.send_to_db(data)
+            return self.db_service.send_to_db(data)
 
     def validate_file(self, path: Path) -> bool:
         """Validate file extension and (optionally) schema.
@@ -91,6 +206,84 @@ class FileConsumer:
         """
         return path.suffix == ".csv"
 
+class ConsumerPipeline:
+    """Feeds in-memory payloads from the scheduler straight into a FileConsumer.
+
+    ``SyncJob`` calls :meth:`submit` as each download completes; worker threads ingest
+    the payload and archive the on-disk copy without waiting for the next
+    ``consume_new_files`` poll. The queue is bounded, so ``submit`` blocks (backpressure)
+    when ingest falls behind downloads. Files that fail here stay in the input
+    directory and are picked up by a later ``consume_new_files`` run.
+
+    Args:
+        consumer (FileConsumer): Consumer doing the ingest and archiving.
+        queue_size (int): Maximum payloads waiting to be ingested. Defaults to 16.
+        workers (int): Ingest threads. Defaults to the consumer's ``max_workers``.
+    """
+    def __init__(self, consumer: FileConsumer, queue_size: int = 16, workers: Optional[int] = None) -> None:
+        self.consumer = consumer
+        self._queue: "queue.Queue[Optional[tuple[Path, bytes | str | None]]]" = queue.Queue(
+            maxsize=max(1, int(queue_size))
+        )
+        count = max(1, int(workers if workers is not None else consumer.max_workers))
+        self._threads = [
+            threading.Thread(target=self._run, name=f"pipeline-{i}", daemon=True) for i in range(count)
+        ]
+        self._closed = False
+        for t in self._threads:
+            t.start()
+
+    def submit(self, path: Path, payload: bytes | str | None = None) -> None:
+        """Queue a downloaded file for ingest, blocking while the queue is full.
+
+        Args:
+            path (Path): Location of the downloaded file (archived after ingest).
+            payload (bytes | str | None): File contents; read from ``path`` when omitted.
+
+        Raises:
+            RuntimeError: If the pipeline has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("pipeline is closed")
+        self._queue.put((Path(path), payload))
+        self.consumer.metrics.set_gauge("backlog_files", self._queue.qsize())
+
+    def qsize(self) -> int:
+        """Approximate number of payloads waiting to be ingested."""
+        return self._queue.qsize()
+
+    def join(self) -> None:
+        """Block until every submitted payload has been ingested."""
+        self._queue.join()
+        self.consumer.write_metrics()
+
+    def close(self) -> None:
+        """Ingest what is queued, then stop the worker threads."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        self.consumer.write_metrics()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, payload = item
+                if self.consumer.tracker.is_processed(path.name):
+                    continue
+                self.consumer.process_file(path, payload)
+            except Exception as e:  # process_file logs its own failures; guard the thread anyway
+                self.consumer.logger.error(f"Pipeline failed for {item[0].name if item else item}: {e}")
+            finally:
+                self.consumer.metrics.set_gauge("backlog_files", self._queue.qsize())
+                self._queue.task_done()
+
 class InMemoryTracker:
     """Tracks processed files in memory."""
     def __init__(self) -> None:
@@ -99,3 +292,119 @@ class InMemoryTracker:
         return filename in self._seen
     def mark_processed(self, filename: str) -> None:
         self._seen.add(filename)
+
+class BackgroundArchiver:
+    """Compresses processed files into the archive directory on a worker thread.
+
+    The source file is removed only after the compressed copy has been fsync'd and
+    atomically renamed into place. ``submit`` blocks when the queue is full.
+
+    Args:
+        archive_dir (Path): Directory receiving compressed archives.
+        mode (str): "gzip" (``.csv.gz``) or "zstd" (``.csv.zst``).
+        queue_size (int): Maximum number of files waiting to be archived.
+        logger (logging.Logger): Logger for archive failures.
+        metrics (Optional[ConsumerMetrics]): Receives "archive" stage timings. Defaults to None.
+    """
+    def __init__(
+        self,
+        archive_dir: Path,
+        mode: str,
+        queue_size: int,
+        logger: logging.Logger,
+        metrics: Optional[ConsumerMetrics] = None,
+    ) -> None:
+        if mode == "zstd" and zstandard is None:
+            raise RuntimeError("zstd archive mode requires the 'zstandard' package")
+        self.archive_dir = Path(archive_dir)
+        self.mode = mode
+        self.logger = logger
+        self.metrics = metrics
+        self._queue: "queue.Queue[Optional[Path]]" = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._thread = threading.Thread(target=self._run, name="archiver", daemon=True)
+        self._thread.start()
+
+    @property
+    def suffix(self) -> str:
+        """Extension appended to archived filenames."""
+        return ".gz" if self.mode == "gzip" else ".zst"
+
+    def submit(self, path: Path) -> None:
+        """Queue a file for archiving.
+
+        Args:
+            path (Path): Path to the file to archive.
+        """
+        self._queue.put(Path(path))
+
+    def qsize(self) -> int:
+        """Approximate number of files waiting to be archived."""
+        return self._queue.qsize()
+
+    def join(self) -> None:
+        """Block until every queued file has been archived."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Drain the queue and stop the worker thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                with self.metrics.stage("archive") if self.metrics else nullcontext():
+                    self.compress(path)
+            except Exception as e:
+                self.logger.error(f"Failed to archive {path.name if path else path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def compress(self, path: Path) -> Path:
+        """Compress a file into the archive directory and remove the source.
+
+        Args:
+            path (Path): Path to the file to archive.
+
+        Returns:
+            Path: Path of the compressed archive.
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        dest = self.archive_dir / f"{path.name}{self.suffix}"
+        tmp = dest.with_name(dest.name + ".part")
+        try:
+            with path.open("rb") as src, tmp.open("wb") as raw:
+                if self.mode == "gzip":
+                    with gzip.GzipFile(filename=path.name, mode="wb", fileobj=raw, compresslevel=6) as out:
+                        shutil.copyfileobj(src, out, 1024 * 1024)
+                else:
+                    cctx = zstandard.ZstdCompressor(level=3)  # type: ignore[union-attr]
+                    with cctx.stream_writer(raw, closefd=False) as out:  # type: ignore[union-attr]
+                        shutil.copyfileobj(src, out, 1024 * 1024)
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        _fsync_dir(self.archive_dir)
+        path.unlink()
+        return dest
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename by fsyncing its directory (no-op where unsupported)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:  # pragma: no cover - platform dependent (e.g. Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - platform dependent
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,153 @@
+"""Ingest metrics for FileConsumer and DBClient.
+
+Collects cumulative per-stage timings (read, parse, ddl, insert, log, archive),
+row/byte/file counters and backlog gauges. Snapshots render as Prometheus text
+exposition format so they can be scraped from a file (node_exporter textfile
+collector) or served from an HTTP endpoint.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+STAGES = ("read", "send", "parse", "ddl", "insert", "log", "archive")
+
+
+class ConsumerMetrics:
+    """Thread-safe accumulator for ingest stage timings and counters.
+
+    Args:
+        prefix (str): Metric name prefix. Defaults to "consumer".
+    """
+    def __init__(self, prefix: str = "consumer") -> None:
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stage_seconds: Dict[str, float] = {s: 0.0 for s in STAGES}
+        self._stage_calls: Dict[str, int] = {s: 0 for s in STAGES}
+        self._counters: Dict[str, float] = {"rows": 0, "bytes": 0, "files_ok": 0, "files_error": 0}
+        self._gauges: Dict[str, float] = {"backlog_files": 0, "archive_queue_files": 0}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of work and attribute it to an ingest stage.
+
+        Args:
+            name (str): Stage name (e.g. "read", "insert").
+
+        Yields:
+            None: Control to the timed block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._stage_seconds[name] = self._stage_seconds.get(name, 0.0) + elapsed
+                self._stage_calls[name] = self._stage_calls.get(name, 0) + 1
+            current: Optional[Dict[str, float]] = getattr(self._local, "current", None)
+            if current is not None:
+                current[name] = current.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def file_scope(self) -> Iterator[Dict[str, float]]:
+        """Collect stage timings recorded on this thread for a single file.
+
+        Yields:
+            Dict[str, float]: Per-stage seconds, filled in as stages complete.
+        """
+        timings: Dict[str, float] = {}
+        self._local.current = timings
+        try:
+            yield timings
+        finally:
+            self._local.current = None
+
+    def inc(self, name: str, amount: float = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name (str): Counter name (rows, bytes, files_ok, files_error).
+            amount (float): Increment. Defaults to 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to an absolute value.
+
+        Args:
+            name (str): Gauge name (backlog_files, archive_queue_files).
+            value (float): New value.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return a consistent copy of all metrics.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Keys stage_seconds, stage_calls, counters, gauges.
+        """
+        with self._lock:
+            return {
+                "stage_seconds": dict(self._stage_seconds),
+                "stage_calls": {k: float(v) for k, v in self._stage_calls.items()},
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+            }
+
+    def to_prometheus(self) -> str:
+        """Render the current metrics in Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text ending in a newline.
+        """
+        snap = self.snapshot()
+        p = self.prefix
+        c = snap["counters"]
+        lines = [
+            f"# HELP {p}_stage_seconds_total Cumulative seconds spent per ingest stage.",
+            f"# TYPE {p}_stage_seconds_total counter",
+        ]
+        lines += [f'{p}_stage_seconds_total{{stage="{k}"}} {v:.6f}' for k, v in snap["stage_seconds"].items()]
+        lines += [
+            f"# HELP {p}_stage_calls_total Number of timed executions per ingest stage.",
+            f"# TYPE {p}_stage_calls_total counter",
+        ]
+        lines += [f'{p}_stage_calls_total{{stage="{k}"}} {int(v)}' for k, v in snap["stage_calls"].items()]
+        lines += [
+            f"# HELP {p}_rows_total Rows ingested.",
+            f"# TYPE {p}_rows_total counter",
+            f"{p}_rows_total {int(c.get('rows', 0))}",
+            f"# HELP {p}_bytes_total CSV bytes read.",
+            f"# TYPE {p}_bytes_total counter",
+            f"{p}_bytes_total {int(c.get('bytes', 0))}",
+            f"# HELP {p}_files_total Files processed by outcome.",
+            f"# TYPE {p}_files_total counter",
+            f'{p}_files_total{{status="ok"}} {int(c.get("files_ok", 0))}',
+            f'{p}_files_total{{status="error"}} {int(c.get("files_error", 0))}',
+        ]
+        for name, value in snap["gauges"].items():
+            lines += [f"# TYPE {p}_{name} gauge", f"{p}_{name} {int(value)}"]
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, path: Path) -> None:
+        """Atomically write the Prometheus text snapshot to a file.
+
+        Args:
+            path (Path): Destination file (e.g. a node_exporter textfile collector path).
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+__all__ = ["ConsumerMetrics", "STAGES"]
@@ -2,21 +2,38 @@
 
 Parses CSV text, creates a corresponding table if needed, and inserts rows
 using the DBService core (no HTTP involved for tests/in-process runs).
+
+Rows are inserted in batches; each batch commits together with a checkpoint of
+(filename, content hash, committed rows), so a failed ingest of the same file
+resumes after the last committed batch instead of starting over.
 """
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, Dict, List
 import csv
+import hashlib
 import io
 
 from db_service_core import DBService
 
 
 class DBClient:
-	"""Thin wrapper to send CSV data to the DBService core."""
+	"""Thin wrapper to send CSV data to the DBService core.
+
+	Args:
+		service: DBService instance; defaults to a new one.
+		metrics: Optional ``consumer.metrics.ConsumerMetrics`` receiving parse/ddl/insert/log timings.
+		batch_size: Rows per insert transaction (and checkpoint granularity).
+	"""
 
-	def __init__(self, service: DBService | None = None) -> None:
+	def __init__(self, service: DBService | None = None, metrics: Any | None = None, batch_size: int = 5000) -> None:
 		self.service = service or DBService()
+		self.metrics = metrics
+		self.batch_size = max(1, int(batch_size))
+
+	def _stage(self, name: str) -> AbstractContextManager[Any]:
+		return self.metrics.stage(name) if self.metrics is not None else nullcontext()
 
 	def send_to_db(self, data: str, table_name: str | None = None, original_filename: str | None = None) -> Dict[str, Any]:
 		"""Ingest CSV text into a table.
@@ -24,34 +41,47 @@ class DBClient:
 		Args:
 			data: Raw CSV text (first row is header).
 			table_name: Optional explicit table name; if omitted, uses 'ingest'.
+			original_filename: Original filename; enables ingestion logging and resumable checkpoints.
 
 		Returns:
-			Dict with keys: table, row_count.
+			Dict with keys: table, row_count, resumed_from.
 		"""
 		if not data:
 			return {"table": table_name or "ingest", "row_count": 0}
-		reader = csv.DictReader(io.StringIO(data))
-		rows: List[Dict[str, Any]] = list(reader)
+		with self._stage("parse"):
+			reader = csv.DictReader(io.StringIO(data))
+			rows: List[Dict[str, Any]] = list(reader)
 		if not rows:
 			return {"table": table_name or "ingest", "row_count": 0}
 		# Infer schema as TEXT columns
 		columns = {str(k): "TEXT" for k in rows[0].keys()}
 		tbl = table_name or "ingest"
-		# Recreate table to avoid stale schemas across tests/runs
-		try:
-			self.service.delete_table(tbl)
-		except Exception:
-			pass
-		self.service.create_table(tbl, columns)
-		inserted = 0
-		for r in rows:
-			self.service.insert_row(tbl, r)
-			inserted += 1
+		content_hash = hashlib.sha256(data.encode("utf-8")).hexdigest()
+		offset = 0
+		if original_filename:
+			offset = min(self.service.get_checkpoint(original_filename, content_hash, tbl), len(rows))
+		if offset == 0:
+			with self._stage("ddl"):
+				# Recreate table to avoid stale schemas across tests/runs
+				try:
+					self.service.delete_table(tbl)
+				except Exception:
+					pass
+				self.service.create_table(tbl, columns)
+		with self._stage("insert"):
+			for start in range(offset, len(rows), self.batch_size):
+				end = min(start + self.batch_size, len(rows))
+				checkpoint = None
+				if original_filename:
+					checkpoint = {"filename": original_filename, "content_hash": content_hash, "committed_rows": end}
+				self.service.insert_rows(tbl, rows[start:end], checkpoint=checkpoint)
 		# Log ingestion for downstream filtering
 		if original_filename:
 			dataset = tbl
-			self.service.log_ingestion(original_filename, dataset)
-		return {"table": tbl, "row_count": inserted}
+			with self._stage("log"):
+				self.service.log_ingestion(original_filename, dataset)
+				self.service.clear_checkpoint(original_filename)
+		return {"table": tbl, "row_count": len(rows), "resumed_from": offset}
 
 
 __all__ = ["DBClient"]
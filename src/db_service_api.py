@@ -7,8 +7,10 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import Any, Dict, Optional, List
 import csv
+import gzip
 import io
 import threading
+import zlib
 from db_service_core import DBService
 
 app = FastAPI(title="DB Service API")
@@ -30,26 +32,66 @@ class TableCreateResponse(BaseModel):
     message: str
     table_name: str
 
+class MissingFilesRequest(BaseModel):
+    filenames: List[str] = Field(..., description="Candidate filenames to check against the ingestion log.")
+    start_time: Optional[str] = Field(None, description="Only count ingestions at or after this ISO time.")
+    end_time: Optional[str] = Field(None, description="Only count ingestions at or before this ISO time.")
+
 @app.get("/health")
 def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
+def _csv_rows(content: bytes) -> List[Dict[str, Any]]:
+    return list(csv.DictReader(io.StringIO(content.decode("utf-8"))))
+
+async def _read_raw_csv(request: Request) -> bytes:
+    """Collect a raw text/csv or application/gzip body, inflating gzip chunk by chunk as it arrives."""
+    gzipped = request.headers.get("content-type", "").startswith("application/gzip")
+    inflater = zlib.decompressobj(wbits=47) if gzipped else None
+    parts = []
+    async for chunk in request.stream():
+        parts.append(inflater.decompress(chunk) if inflater else chunk)
+    if inflater:
+        parts.append(inflater.flush())
+    return b"".join(parts)
+
 @app.post("/ingest")
 async def ingest(
     request: Request,
     file: UploadFile = File(None),
-    dataset: Optional[str] = None
+    dataset: Optional[str] = None,
+    filename: Optional[str] = None,
+    replace: bool = Query(False, description="Drop the table first so this file replaces its contents, like DBClient.send_to_db."),
 ) -> JSONResponse:
+    content_type = request.headers.get("content-type", "")
     if file:
         content = await file.read()
-        csv_text = content.decode("utf-8")
-        reader = csv.DictReader(io.StringIO(csv_text))
-        rows = list(reader)
+        # Remote consumers may upload gzip-compressed CSV bodies
+        if content[:2] == b"\x1f\x8b":
+            try:
+                content = gzip.decompress(content)
+            except OSError:
+                return JSONResponse(status_code=400, content={"error": "Invalid gzip payload."})
+        rows = _csv_rows(content)
         if not rows:
             return JSONResponse(status_code=400, content={"error": "Empty CSV file."})
         if not file.filename:
             return JSONResponse(status_code=400, content={"error": "Missing filename for uploaded file."})
-        table_name = file.filename.rsplit(".", 1)[0]
+        upload_name = file.filename[:-3] if file.filename.endswith(".gz") else file.filename
+        table_name = dataset or upload_name.rsplit(".", 1)[0]
+        columns = {str(col): "TEXT" for col in rows[0].keys()}
+    elif content_type.startswith(("text/csv", "application/gzip")):
+        # Streamed upload from HTTPDBClient: the raw (optionally gzipped) CSV is the request body
+        try:
+            content = await _read_raw_csv(request)
+        except zlib.error:
+            return JSONResponse(status_code=400, content={"error": "Invalid gzip payload."})
+        rows = _csv_rows(content)
+        if not rows:
+            return JSONResponse(status_code=400, content={"error": "Empty CSV file."})
+        if not (dataset or filename):
+            return JSONResponse(status_code=400, content={"error": "Missing dataset name."})
+        table_name = dataset or filename.rsplit(".", 1)[0]
         columns = {str(col): "TEXT" for col in rows[0].keys()}
     else:
         try:
@@ -65,18 +107,64 @@ async def ingest(
             return JSONResponse(status_code=400, content={"error": "Missing dataset name."})
         table_name = dataset
         columns = {str(col): "TEXT" for col in rows[0].keys()}
-    try:
-        db_service.create_table(table_name, columns)
-    except HTTPException as e:
-        if e.status_code != 400:
-            raise
-    inserted = 0
     with _db_lock:
-        for row in rows:
-            db_service.insert_row(table_name, row)
-            inserted += 1
+        if replace:
+            # Same semantics as DBClient.send_to_db: each file replaces the table, so a
+            # re-sent file is simply applied again rather than skipped
+            try:
+                db_service.delete_table(table_name)
+            except HTTPException:
+                pass
+        elif filename and not db_service.get_missing_filenames([filename]):
+            # Append mode is idempotent per filename: a file that is already logged is not inserted again
+            return JSONResponse(
+                status_code=200,
+                content={"message": "File already ingested; skipped.", "row_count": 0, "table": table_name, "skipped": True},
+            )
+        try:
+            db_service.create_table(table_name, columns)
+        except HTTPException as e:
+            if e.status_code != 400:
+                raise
+        # One transaction for the rows, their hourly rollups and the ingestion log entry that
+        # lets the scheduler skip the file on later syncs
+        inserted = db_service.insert_rows(table_name, rows, ingested_filename=filename or None)
     return JSONResponse(status_code=200, content={"message": "Ingested rows.", "row_count": inserted, "table": table_name})
 
+@app.post("/ingestion_log/missing")
+def missing_files(payload: MissingFilesRequest) -> Dict[str, List[str]]:
+    with _db_lock:
+        missing = db_service.get_missing_filenames(payload.filenames, payload.start_time, payload.end_time)
+    return {"missing": missing}
+
+@app.get("/rollups/hourly")
+def get_hourly_rollup(
+    dataset: Optional[str] = Query(None, description="Dataset/table name"),
+    start_hour: Optional[str] = Query(None, description="Inclusive start hour (YYYY-MM-DDTHH:00:00)"),
+    end_hour: Optional[str] = Query(None, description="Inclusive end hour (YYYY-MM-DDTHH:00:00)"),
+    agent: Optional[str] = Query(None, description="Agent name"),
+) -> Dict[str, Any]:
+    """Precomputed per dataset x hour x agent aggregates, maintained as rows are written.
+
+    Metrics are sums, except ``Avg *`` columns, which are averaged over their ``samples``.
+    Date-only datasets are bucketed at the start of each day.
+
+    Example response:
+        {"rollups": [{"dataset": "IB_Calls", "hour": "2025-08-22T09:00:00", "agent": "Ada",
+                      "rows": 4, "metrics": {"Handle": 31.0, "Avg Handle": 120.0},
+                      "samples": {"Handle": 4, "Avg Handle": 3}}]}
+    """
+    with _db_lock:
+        groups = db_service.get_hourly_rollup(dataset, start_hour, end_hour, agent)
+    return {"rollups": groups}
+
+@app.post("/rollups/hourly/rebuild")
+def rebuild_hourly_rollup(dataset: str = Query(..., description="Dataset/table name")) -> Dict[str, Any]:
+    """Recompute a dataset's rollup from its raw rows (backfill for data loaded before rollups)."""
+    with _db_lock:
+        scanned = db_service.rebuild_rollup(dataset)
+    return {"dataset": dataset, "rows_scanned": scanned}
+
 @app.post("/tables", response_model=TableCreateResponse, status_code=status.HTTP_201_CREATED)
 def create_table(payload: dict[str, Any] = Body(...)):
     table_name: str = str(payload.get("table_name")) if payload.get("table_name") else ""
@@ -134,6 +222,36 @@ def get_rows(
         rows = db_service.get_rows(table_name, start_time, end_time, timestamp_column, col_list)
     return rows
 
+@app.get("/tables/{table_name}/rows/page")
+def get_rows_page(
+    table_name: str,
+    start_time: Optional[str] = Query(None, description="Start time (inclusive) in ISO format."),
+    end_time: Optional[str] = Query(None, description="End time (inclusive) in ISO format."),
+    timestamp_column: str = Query("timestamp", description="Name of the timestamp column to filter on."),
+    columns: Optional[str] = Query(None, description="Comma-separated list of columns to return."),
+    limit: int = Query(1000, ge=1, le=50000, description="Maximum rows in this page."),
+    after: Optional[int] = Query(None, description="Cursor (next_after) returned by the previous page."),
+) -> Dict[str, Any]:
+    """Return one page of rows plus the cursor for the next page.
+
+    Example response: {"rows": [{"timestamp": "...", "value": "a"}], "next_after": 1000}
+    (``next_after`` is null on the last page).
+    """
+    col_list = [col.strip() for col in columns.split(",") if col.strip()] if columns else None
+    with _db_lock:
+        return db_service.get_rows_page(table_name, start_time, end_time, timestamp_column, col_list, limit, after)
+
+@app.get("/tables/{table_name}/generation")
+def get_table_generation(table_name: str) -> Dict[str, Any]:
+    """Current write generation of a table; readers compare it to detect changed data.
+
+    Example response:
+        {"table": "ACQ", "generation": 42}
+    """
+    with _db_lock:
+        generation = db_service.get_generation(table_name)
+    return {"table": table_name, "generation": generation}
+
 @app.delete("/tables/{table_name}/rows/{row_id}")
 def delete_row(table_name: str, row_id: int) -> JSONResponse:
     with _db_lock:
@@ -1,22 +1,91 @@
 """
 DBService: Business logic and SQLAlchemy operations for the DB Service API.
 """
+import logging
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
-from sqlalchemy import create_engine, MetaData, Table, Column, String, Integer, select, text
+from sqlalchemy import create_engine, event, MetaData, Table, Column, Float, String, Integer, literal_column, select, text
 import os
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker
 from fastapi import HTTPException
 
 DB_PATH = os.environ.get("DB_SERVICE_DB_PATH", "sqlite:///db_service.sqlite3")
 engine = create_engine(DB_PATH, connect_args={"check_same_thread": False})
+if DB_PATH.startswith("sqlite:///") and ":memory:" not in DB_PATH:
+    # WAL lets read-only report clients (SQLiteReportDBClient) read while ingest writes
+    @event.listens_for(engine, "connect")
+    def _enable_wal(dbapi_conn: Any, _record: Any) -> None:
+        dbapi_conn.execute("PRAGMA journal_mode=WAL")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 metadata = MetaData()
+logger = logging.getLogger("DBService")
+
+# Hourly rollups: first present column gives the hour, agent column groups rows, and every other
+# numeric column (minus identifiers/interval bounds) is summed as a metric. Metrics named with a
+# ROLLUP_MEAN_PREFIXES prefix are per-row averages already, so reads return their mean, not the sum.
+ROLLUP_TIME_COLUMNS = ("timestamp", "Interval Start", "Date")
+ROLLUP_MEAN_PREFIXES = ("Avg ",)
+ROLLUP_AGENT_COLUMN = "Agent Name"
+ROLLUP_EXCLUDE_COLUMNS = {"id", "Agent Id", "Interval End", "Interval Complete"}
+ROLLUP_ROW_COUNT = "__rows__"
+INTERNAL_TABLES = {"ingestion_log", "ingest_checkpoint", "table_generation", "hourly_rollup"}
+
+
+def _rollup_hour(value: Any) -> Optional[str]:
+    """Truncate an ISO timestamp (``T`` or space separated) to ``YYYY-MM-DDTHH:00:00``.
+
+    A date-only value (``YYYY-MM-DD``, e.g. Campaign_Interactions' ``Date``) has no hour and is
+    bucketed at the start of its day.
+    """
+    text_value = str(value or "")
+    if len(text_value) == 10 and text_value[4] == "-" and text_value[7] == "-":
+        return f"{text_value}T00:00:00"
+    if len(text_value) < 13 or text_value[10] not in ("T", " "):
+        return None
+    return f"{text_value[:10]}T{text_value[11:13]}:00:00"
+
+
+def _rollup_groups(rows: List[Dict[str, Any]]) -> Dict[tuple, List[float]]:
+    """Aggregate rows into {(hour, agent, metric): [total, samples]}."""
+    groups: Dict[tuple, List[float]] = {}
+    if not rows:
+        return groups
+    time_col = next((c for c in ROLLUP_TIME_COLUMNS if c in rows[0]), None)
+    if time_col is None:
+        return groups
+    skip = ROLLUP_EXCLUDE_COLUMNS | {time_col, ROLLUP_AGENT_COLUMN}
+    skipped = 0
+    for row in rows:
+        hour = _rollup_hour(row.get(time_col))
+        if hour is None:
+            skipped += 1
+            continue
+        agent = str(row.get(ROLLUP_AGENT_COLUMN) or "")
+        count = groups.setdefault((hour, agent, ROLLUP_ROW_COUNT), [0.0, 0])
+        count[0] += 1
+        count[1] += 1
+        for col, value in row.items():
+            if col in skip or value is None or value == "":
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+            acc = groups.setdefault((hour, agent, col), [0.0, 0])
+            acc[0] += number
+            acc[1] += 1
+    if skipped:
+        logger.warning("Hourly rollup skipped %d row(s) without a usable %r value", skipped, time_col)
+    return groups
 
 class DBService:
     def __init__(self):
         self.engine = engine
         self.metadata = metadata
         self.SessionLocal = SessionLocal
+        self._ingestion_log_ready = False
+        self._ingest_checkpoint_ready = False
 
     def create_table(self, table_name: str, columns_dict: Dict[str, str]):
         columns: list[Column[Any]] = []
@@ -62,6 +131,15 @@ class DBService:
             table = self.metadata.tables[table_name]
             table.drop(bind=self.engine, checkfirst=True)
             self.metadata.remove(table)
+            gen = self._ensure_table_generation()
+            rollup = self._ensure_hourly_rollup()
+            ckpt = self._ensure_ingest_checkpoint()
+            with self.SessionLocal() as session:
+                self._bump_generation(session, gen, table_name)
+                session.execute(rollup.delete().where(rollup.c.dataset == table_name))
+                # Offsets into the dropped table are meaningless for a recreated one
+                session.execute(ckpt.delete().where(ckpt.c.table_name == table_name))
+                session.commit()
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"DB error: {e}")
 
@@ -70,16 +148,78 @@ class DBService:
         if table_name not in self.metadata.tables:
             raise HTTPException(status_code=404, detail="Table not found.")
         table = self.metadata.tables[table_name]
+        gen = self._ensure_table_generation()
+        rollup = self._ensure_hourly_rollup()
         with self.SessionLocal() as session:
             try:
                 ins = table.insert().values(**row)
                 result = session.execute(ins)
+                self._bump_generation(session, gen, table_name)
+                self._apply_rollup(session, rollup, table_name, [row])
                 session.commit()
                 return int(result.inserted_primary_key[0]) if result.inserted_primary_key and result.inserted_primary_key[0] is not None else None
             except Exception as e:
                 session.rollback()
                 raise HTTPException(status_code=400, detail=f"DB error: {e}")
 
+    def insert_rows(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        checkpoint: Optional[Dict[str, Any]] = None,
+        ingested_filename: Optional[str] = None,
+    ) -> int:
+        """Insert a batch of rows in one transaction.
+
+        When ``checkpoint`` (filename, content_hash, committed_rows) is given, the ingest
+        checkpoint is upserted in the same transaction so it never runs ahead of the data.
+        When ``ingested_filename`` is given, the file is recorded in the ingestion log in that
+        transaction too, so a file is never logged without its rows or vice versa.
+        Hourly rollups for the batch are folded in within that transaction as well.
+        """
+        if not rows:
+            return 0
+        if checkpoint is not None:
+            ckpt = self._ensure_ingest_checkpoint()
+        if ingested_filename is not None:
+            log = self._ensure_ingestion_log()
+        self.metadata.reflect(bind=self.engine)
+        if table_name not in self.metadata.tables:
+            raise HTTPException(status_code=404, detail="Table not found.")
+        table = self.metadata.tables[table_name]
+        gen = self._ensure_table_generation()
+        rollup = self._ensure_hourly_rollup()
+        with self.SessionLocal() as session:
+            try:
+                session.execute(table.insert(), rows)
+                self._bump_generation(session, gen, table_name)
+                self._apply_rollup(session, rollup, table_name, rows)
+                if checkpoint is not None:
+                    values = {
+                        "filename": checkpoint["filename"],
+                        "content_hash": checkpoint["content_hash"],
+                        "table_name": table_name,
+                        "committed_rows": int(checkpoint["committed_rows"]),
+                        "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    }
+                    updated = session.execute(
+                        ckpt.update().where(ckpt.c.filename == values["filename"]).values(**values)
+                    )
+                    if updated.rowcount == 0:
+                        session.execute(ckpt.insert().values(**values))
+                if ingested_filename is not None:
+                    # A replaced file is logged again; keep its first ingestion entry
+                    session.execute(sqlite_insert(log).values(
+                        filename=ingested_filename,
+                        dataset=table_name,
+                        ingested_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    ).on_conflict_do_nothing())
+                session.commit()
+                return len(rows)
+            except Exception as e:
+                session.rollback()
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+
     def get_rows(self, table_name: str, start_time: Optional[str], end_time: Optional[str], timestamp_column: str, columns: Optional[List[str]]) -> List[Dict[str, Any]]:
         self.metadata.reflect(bind=self.engine)
         if table_name not in self.metadata.tables:
@@ -99,11 +239,52 @@ class DBService:
             except Exception as e:
                 raise HTTPException(status_code=400, detail=f"DB error: {e}")
 
+    def get_rows_page(
+        self,
+        table_name: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        timestamp_column: str,
+        columns: Optional[List[str]],
+        limit: int = 1000,
+        after: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Return one page of rows in insertion (SQLite rowid) order.
+
+        Keyset pagination: pass the returned ``next_after`` as ``after`` to fetch the next page;
+        it is None once the last page has been returned. Each page is a cheap index range scan
+        no matter how deep into the table it starts.
+        """
+        self.metadata.reflect(bind=self.engine)
+        if table_name not in self.metadata.tables:
+            raise HTTPException(status_code=404, detail="Table not found.")
+        table = self.metadata.tables[table_name]
+        rowid = literal_column(f'"{table_name}".rowid')
+        with self.SessionLocal() as session:
+            try:
+                sel_cols = [table.c[col] for col in columns] if columns else [table]
+                stmt = select(*sel_cols, rowid.label("__rowid__")).order_by(rowid).limit(limit)
+                if after is not None:
+                    stmt = stmt.where(rowid > after)
+                if start_time:
+                    stmt = stmt.where(table.c[timestamp_column] >= start_time)
+                if end_time:
+                    stmt = stmt.where(table.c[timestamp_column] <= end_time)
+                rows = [dict(m) for m in session.execute(stmt).mappings().all()]
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+        last = None
+        for row in rows:
+            last = row.pop("__rowid__")
+        return {"rows": rows, "next_after": last if len(rows) == limit else None}
+
     def delete_row(self, table_name: str, row_id: int):
         self.metadata.reflect(bind=self.engine)
         if table_name not in self.metadata.tables:
             raise HTTPException(status_code=404, detail="Table not found.")
         table = self.metadata.tables[table_name]
+        gen = self._ensure_table_generation()
+        rollup = self._ensure_hourly_rollup()
         with self.SessionLocal() as session:
             try:
                 # Prefer primary key if available
@@ -111,11 +292,15 @@ class DBService:
                 if pk_cols:
                     stmt = table.delete().where(pk_cols[0] == row_id)
                 else:
-                    stmt = table.delete().where(text("rowid = :rowid")).params(rowid=row_id)
+                    stmt = table.delete().where(text("rowid = :rowid").bindparams(rowid=row_id))
+                old = self._row_by_id(session, table, row_id)
                 result = session.execute(stmt)
-                session.commit()
                 if result.rowcount == 0:
                     raise HTTPException(status_code=404, detail="Row not found.")
+                self._bump_generation(session, gen, table_name)
+                if old is not None:
+                    self._apply_rollup(session, rollup, table_name, [old], sign=-1)
+                session.commit()
             except Exception as e:
                 session.rollback()
                 raise HTTPException(status_code=400, detail=f"DB error: {e}")
@@ -125,23 +310,192 @@ class DBService:
         if table_name not in self.metadata.tables:
             raise HTTPException(status_code=404, detail="Table not found.")
         table = self.metadata.tables[table_name]
+        gen = self._ensure_table_generation()
+        rollup = self._ensure_hourly_rollup()
         with self.SessionLocal() as session:
             try:
                 pk_cols = list(table.primary_key.columns)
                 if pk_cols:
                     stmt = table.update().where(pk_cols[0] == row_id).values(**row)
                 else:
-                    stmt = table.update().where(text("rowid = :rowid")).values(**row).params(rowid=row_id)
+                    stmt = table.update().where(text("rowid = :rowid").bindparams(rowid=row_id)).values(**row)
+                old = self._row_by_id(session, table, row_id)
                 result = session.execute(stmt)
-                session.commit()
                 if result.rowcount == 0:
                     raise HTTPException(status_code=404, detail="Row not found.")
+                self._bump_generation(session, gen, table_name)
+                if old is not None:
+                    # Move the row's contribution from its old group/values to the new ones
+                    self._apply_rollup(session, rollup, table_name, [old], sign=-1)
+                    self._apply_rollup(session, rollup, table_name, [{**old, **row}])
+                session.commit()
             except Exception as e:
                 session.rollback()
                 raise HTTPException(status_code=400, detail=f"DB error: {e}")
 
+    @staticmethod
+    def _row_by_id(session: Any, table: Table, row_id: int) -> Optional[Dict[str, Any]]:
+        """Current values of a row addressed like update_row/delete_row do (primary key or rowid)."""
+        pk_cols = list(table.primary_key.columns)
+        if pk_cols:
+            stmt = select(table).where(pk_cols[0] == row_id)
+        else:
+            stmt = select(table).where(text("rowid = :rowid").bindparams(rowid=row_id))
+        found = session.execute(stmt).mappings().first()
+        return dict(found) if found is not None else None
+
+    # --- Table generations (data version for cache invalidation) ---
+    def _ensure_table_generation(self) -> Table:
+        if "table_generation" in self.metadata.tables:
+            return self.metadata.tables["table_generation"]
+        try:
+            gen = Table(
+                "table_generation",
+                self.metadata,
+                Column("table_name", String, primary_key=True),
+                Column("generation", Integer),
+            )
+            gen.create(bind=self.engine, checkfirst=True)
+            return gen
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"DB error: {e}")
+
+    def _bump_generation(self, session: Any, gen: Table, table_name: str) -> None:
+        """Increment a table's generation inside the caller's write transaction."""
+        updated = session.execute(
+            gen.update().where(gen.c.table_name == table_name).values(generation=gen.c.generation + 1)
+        )
+        if updated.rowcount == 0:
+            session.execute(gen.insert().values(table_name=table_name, generation=1))
+
+    def get_generation(self, table_name: str) -> int:
+        """Return the table's write generation; it changes whenever rows are written or the table is dropped.
+
+        0 means the table has never been written through this service.
+        """
+        gen = self._ensure_table_generation()
+        with self.SessionLocal() as session:
+            try:
+                value = session.execute(select(gen.c.generation).where(gen.c.table_name == table_name)).scalar()
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+        return int(value or 0)
+
+    # --- Hourly rollups (maintained on insert, update and delete) ---
+    def _ensure_hourly_rollup(self) -> Table:
+        if "hourly_rollup" in self.metadata.tables:
+            return self.metadata.tables["hourly_rollup"]
+        try:
+            rollup = Table(
+                "hourly_rollup",
+                self.metadata,
+                Column("dataset", String, primary_key=True),
+                Column("hour", String, primary_key=True),
+                Column("agent", String, primary_key=True),
+                Column("metric", String, primary_key=True),
+                Column("total", Float),
+                Column("samples", Integer),
+            )
+            rollup.create(bind=self.engine, checkfirst=True)
+            return rollup
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"DB error: {e}")
+
+    def _apply_rollup(
+        self, session: Any, rollup: Table, table_name: str, rows: List[Dict[str, Any]], sign: int = 1
+    ) -> None:
+        """Add (``sign=1``) or subtract (``sign=-1``) the rows' per hour/agent sums in the caller's transaction."""
+        if table_name in INTERNAL_TABLES:
+            return
+        groups = _rollup_groups(rows)
+        if not groups:
+            return
+        stmt = sqlite_insert(rollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[rollup.c.dataset, rollup.c.hour, rollup.c.agent, rollup.c.metric],
+            set_={"total": rollup.c.total + stmt.excluded.total, "samples": rollup.c.samples + stmt.excluded.samples},
+        )
+        session.execute(stmt, [
+            {"dataset": table_name, "hour": hour, "agent": agent, "metric": metric, "total": sign * total, "samples": sign * int(samples)}
+            for (hour, agent, metric), (total, samples) in groups.items()
+        ])
+        if sign < 0:
+            session.execute(rollup.delete().where(rollup.c.dataset == table_name, rollup.c.samples <= 0))
+
+    def rebuild_rollup(self, table_name: str, batch_size: int = 5000) -> int:
+        """Recompute a dataset's hourly rollup from its raw rows (backfill); returns rows scanned."""
+        self.metadata.reflect(bind=self.engine)
+        if table_name not in self.metadata.tables:
+            raise HTTPException(status_code=404, detail="Table not found.")
+        table = self.metadata.tables[table_name]
+        rollup = self._ensure_hourly_rollup()
+        scanned = 0
+        with self.SessionLocal() as session:
+            try:
+                session.execute(rollup.delete().where(rollup.c.dataset == table_name))
+                result = session.execute(select(table)).mappings()
+                while True:
+                    chunk = [dict(m) for m in result.fetchmany(batch_size)]
+                    if not chunk:
+                        break
+                    self._apply_rollup(session, rollup, table_name, chunk)
+                    scanned += len(chunk)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+        return scanned
+
+    def get_hourly_rollup(
+        self,
+        dataset: Optional[str] = None,
+        start_hour: Optional[str] = None,
+        end_hour: Optional[str] = None,
+        agent: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return rollup groups as ``{dataset, hour, agent, rows, metrics: {name: value}, samples: {name: n}}``.
+
+        ``metrics`` holds each metric's sum, except ``Avg *`` metrics (see ``ROLLUP_MEAN_PREFIXES``),
+        which hold the mean over their ``samples`` non-empty values. Groups are ordered by dataset,
+        hour and agent; hours are inclusive ISO bounds.
+        """
+        rollup = self._ensure_hourly_rollup()
+        with self.SessionLocal() as session:
+            try:
+                stmt = select(rollup).order_by(rollup.c.dataset, rollup.c.hour, rollup.c.agent, rollup.c.metric)
+                if dataset:
+                    stmt = stmt.where(rollup.c.dataset == dataset)
+                if start_hour:
+                    stmt = stmt.where(rollup.c.hour >= start_hour)
+                if end_hour:
+                    stmt = stmt.where(rollup.c.hour <= end_hour)
+                if agent is not None:
+                    stmt = stmt.where(rollup.c.agent == agent)
+                records = session.execute(stmt).mappings().all()
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+        out: Dict[tuple, Dict[str, Any]] = {}
+        for r in records:
+            key = (r["dataset"], r["hour"], r["agent"])
+            group = out.setdefault(
+                key, {"dataset": r["dataset"], "hour": r["hour"], "agent": r["agent"], "rows": 0, "metrics": {}, "samples": {}}
+            )
+            samples = int(r["samples"] or 0)
+            if r["metric"] == ROLLUP_ROW_COUNT:
+                group["rows"] = samples
+                continue
+            value = r["total"]
+            if r["metric"].startswith(ROLLUP_MEAN_PREFIXES):
+                value = value / samples if samples else None
+            group["metrics"][r["metric"]] = value
+            group["samples"][r["metric"]] = samples
+        return list(out.values())
+
     # --- Ingestion log support ---
     def _ensure_ingestion_log(self) -> Table:
+        # Reflection and the index DDL run once; a dropped log table leaves metadata and is redone
+        if self._ingestion_log_ready and "ingestion_log" in self.metadata.tables:
+            return self.metadata.tables["ingestion_log"]
         try:
             self.metadata.reflect(bind=self.engine)
             if "ingestion_log" not in self.metadata.tables:
@@ -154,14 +508,19 @@ class DBService:
                 )
                 log.create(bind=self.engine, checkfirst=True)
                 self.metadata.reflect(bind=self.engine)
-            return self.metadata.tables["ingestion_log"]
+            log = self.metadata.tables["ingestion_log"]
+            if not log.primary_key.columns:
+                # Tables created through the generic /tables API have no PK; index filename lookups
+                with self.engine.begin() as conn:
+                    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_ingestion_log_filename ON ingestion_log (filename)"))
+            self._ingestion_log_ready = True
+            return log
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"DB error: {e}")
 
     def log_ingestion(self, filename: str, dataset: str, ingested_at: Optional[str] = None) -> None:
         log = self._ensure_ingestion_log()
         if not ingested_at:
-            from datetime import datetime, timezone
             ingested_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
         with self.SessionLocal() as session:
             try:
@@ -188,3 +547,73 @@ class DBService:
                 return [row[0] for row in result.fetchall()]
             except Exception as e:
                 raise HTTPException(status_code=400, detail=f"DB error: {e}")
+
+    def get_missing_filenames(
+        self, filenames: List[str], start_time: Optional[str] = None, end_time: Optional[str] = None
+    ) -> List[str]:
+        """Return the candidate filenames that have no ingestion log entry (input order, de-duplicated)."""
+        log = self._ensure_ingestion_log()
+        candidates = list(dict.fromkeys(filenames))
+        found: set[str] = set()
+        with self.SessionLocal() as session:
+            try:
+                # Chunk to stay under SQLite's bound-parameter limit; each IN probe hits the filename index
+                for i in range(0, len(candidates), 500):
+                    stmt = select(log.c.filename).where(log.c.filename.in_(candidates[i:i + 500]))
+                    if start_time:
+                        stmt = stmt.where(log.c.ingested_at >= start_time)
+                    if end_time:
+                        stmt = stmt.where(log.c.ingested_at <= end_time)
+                    found.update(row[0] for row in session.execute(stmt))
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+        return [name for name in candidates if name not in found]
+
+    # --- Resumable ingest checkpoints ---
+    def _ensure_ingest_checkpoint(self) -> Table:
+        # Reflected once per service, like the ingestion log, instead of on every checkpointed batch
+        if self._ingest_checkpoint_ready and "ingest_checkpoint" in self.metadata.tables:
+            return self.metadata.tables["ingest_checkpoint"]
+        try:
+            self.metadata.reflect(bind=self.engine)
+            if "ingest_checkpoint" not in self.metadata.tables:
+                ckpt = Table(
+                    "ingest_checkpoint",
+                    self.metadata,
+                    Column("filename", String, primary_key=True),
+                    Column("content_hash", String),
+                    Column("table_name", String),
+                    Column("committed_rows", Integer),
+                    Column("updated_at", String),
+                )
+                ckpt.create(bind=self.engine, checkfirst=True)
+                self.metadata.reflect(bind=self.engine)
+            self._ingest_checkpoint_ready = True
+            return self.metadata.tables["ingest_checkpoint"]
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"DB error: {e}")
+
+    def get_checkpoint(self, filename: str, content_hash: str, table_name: str) -> int:
+        """Return rows already committed for this file content (0 when nothing to resume)."""
+        ckpt = self._ensure_ingest_checkpoint()
+        with self.SessionLocal() as session:
+            try:
+                row = session.execute(select(ckpt).where(ckpt.c.filename == filename)).mappings().first()
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
+        if row is None or row["content_hash"] != content_hash or row["table_name"] != table_name:
+            return 0
+        # The partially loaded table must still exist for the offset to be meaningful
+        if table_name not in self.metadata.tables:
+            return 0
+        return int(row["committed_rows"] or 0)
+
+    def clear_checkpoint(self, filename: str) -> None:
+        ckpt = self._ensure_ingest_checkpoint()
+        with self.SessionLocal() as session:
+            try:
+                session.execute(ckpt.delete().where(ckpt.c.filename == filename))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise HTTPException(status_code=400, detail=f"DB error: {e}")
@@ -0,0 +1,133 @@
+"""HTTP DB service client for FileConsumer.
+
+Uploads CSV text to the DB Service API ``POST /ingest`` endpoint so the consumer can
+run on a different host than the DB service. Implements the same ``send_to_db``
+interface as the in-process ``db_service.DBClient``.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import zlib
+from typing import Any, Dict, Iterator, Optional
+
+from http_transport import HTTPTransport
+
+
+class _CSVBody:
+    """Re-iterable upload body yielding CSV text in chunks, gzip-compressed on the fly.
+
+    Each iteration starts a fresh compressor, so a retried POST re-sends the whole body
+    without ever holding the compressed payload in memory.
+    """
+
+    def __init__(self, data: str, compress_level: Optional[int], chunk_chars: int = 64 * 1024) -> None:
+        self.data = data
+        self.compress_level = compress_level
+        self.chunk_chars = chunk_chars
+
+    def __iter__(self) -> Iterator[bytes]:
+        deflater = None
+        if self.compress_level is not None:
+            deflater = zlib.compressobj(self.compress_level, zlib.DEFLATED, 31)
+        for start in range(0, len(self.data), self.chunk_chars):
+            chunk = self.data[start:start + self.chunk_chars].encode("utf-8")
+            if deflater is not None:
+                chunk = deflater.compress(chunk)
+            if chunk:
+                yield chunk
+        if deflater is not None:
+            yield deflater.flush()
+
+
+class HTTPDBClient:
+    """Send CSV data to a remote DB service through the shared pooled ``HTTPTransport``.
+
+    Args:
+        api_url: Base URL for the DB API (defaults to ``DB_API_URL`` or http://localhost:8000).
+            Can be empty when using TestClient.
+        session: Requests-like session (requests.Session or FastAPI TestClient). Defaults to
+            the shared pooled session, grown to at least ``max_concurrency`` connections.
+        max_concurrency: Maximum number of uploads in flight at once. The DB service applies
+            uploads one at a time under its write lock, so extra concurrency only overlaps
+            network transfer and CSV parsing with the write in progress.
+        connect_timeout: Seconds to wait for a connection to the DB service.
+        read_timeout: Seconds to wait for the DB service to answer an upload.
+        compress: Gzip request bodies (streamed, chunk by chunk) during upload.
+        compress_level: Gzip compression level (1 fastest .. 9 smallest).
+        transport: Ready-made transport (overrides api_url/session/timeouts).
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        session: Optional[Any] = None,
+        max_concurrency: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 120.0,
+        compress: bool = True,
+        compress_level: int = 5,
+        transport: Optional[HTTPTransport] = None,
+    ) -> None:
+        if api_url is None:
+            api_url = os.environ.get("DB_API_URL", "http://localhost:8000")
+        self.api_url = api_url.rstrip("/")
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.compress = compress
+        self.compress_level = compress_level
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        if transport is None:
+            transport = HTTPTransport(
+                self.api_url,
+                session=session,
+                service="db_service",
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                pool_maxsize=self.max_concurrency,
+            )
+        self.transport = transport
+        self.session = transport.session
+
+    def _url(self, path: str) -> str:
+        if path.startswith("/"):
+            return f"{self.api_url}{path}"
+        return f"{self.api_url}/{path}"
+
+    def send_to_db(self, data: str, table_name: str | None = None, original_filename: str | None = None) -> Dict[str, Any]:
+        """Upload CSV text to the DB service.
+
+        The upload uses ``/ingest?replace=true``, so like ``DBClient.send_to_db`` each file
+        replaces the table's contents and re-sending a file is safe.
+
+        Args:
+            data: Raw CSV text (first row is header).
+            table_name: Optional explicit table name; if omitted, uses 'ingest'.
+            original_filename: Original filename recorded in the DB ingestion log.
+
+        Returns:
+            Dict with keys: table, row_count.
+        """
+        tbl = table_name or "ingest"
+        if not data:
+            return {"table": tbl, "row_count": 0}
+        body = _CSVBody(data, self.compress_level if self.compress else None)
+        headers = {"Content-Type": "application/gzip" if self.compress else "text/csv"}
+        params: Dict[str, str] = {"dataset": tbl, "replace": "true"}
+        if original_filename:
+            params["filename"] = original_filename
+        # httpx-style sessions (TestClient) take raw bodies as content=; requests streams data= chunked
+        body_arg = "content" if callable(getattr(self.session, "stream", None)) else "data"
+        with self._slots:
+            # Replacing the table makes the upload idempotent, so it is safe to retry
+            resp: Any = self.transport.post(
+                self._url("/ingest"),
+                params=params,
+                headers=headers,
+                attempts=self.transport.retry_policy.max_attempts,
+                **{body_arg: body},
+            )
+        resp.raise_for_status()
+        payload: Dict[str, Any] = dict(resp.json())
+        return {"table": str(payload.get("table", tbl)), "row_count": int(payload.get("row_count", 0))}
+
+__all__ = ["HTTPDBClient"]
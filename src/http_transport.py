@@ -0,0 +1,469 @@
+"""Shared pooled HTTP transport for inter-service clients.
+
+One process-wide ``requests.Session`` (sized connection pool, keep-alive) backs every
+``HTTPTransport``; each transport binds a base URL and adds per-call timeouts, retries with
+exponential backoff and jitter, a per-host circuit breaker (``RetryPolicy``) and request
+timing metrics (``TransportMetrics``). Clients may inject their own session instead
+(e.g. FastAPI TestClient in tests); everything else behaves the same.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+
+Timeout = Union[float, Tuple[float, float]]
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """Per-host breaker: opens after consecutive failures, allows one trial call after a cool-down.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a half-open trial call.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Return 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may proceed now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._clock() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError("circuit open")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+
+class RetryPolicy:
+    RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Exponential backoff with jitter, per-host circuit breakers and an optional deadline.
+
+        One instance can be shared by several clients (e.g. SharePointClient, DBServiceClient
+        and SyncJob) so that a failing host trips a single breaker and every caller fails fast.
+
+        Args:
+            max_attempts: Attempts per call (including the first).
+            base_delay: Delay before the first retry, in seconds.
+            max_delay: Upper bound for any single delay.
+            multiplier: Growth factor between consecutive delays.
+            jitter: Fraction of each delay that is randomized (0 = none, 1 = full jitter).
+            failure_threshold: Consecutive failures that open a host's circuit.
+            reset_timeout: Seconds before an open circuit allows a trial call.
+            sleep: Sleep function (injectable for tests).
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(0.0, float(max_delay))
+        self.multiplier = max(1.0, float(multiplier))
+        self.jitter = min(1.0, max(0.0, float(jitter)))
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._sleep = sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.deadline: Optional[float] = None
+        self.retries = 0  # cumulative retries performed by call()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RetryPolicy":
+        """Build a policy from scheduler config keys (max_retries, retry_delay_seconds, ...)."""
+        return cls(
+            max_attempts=int(config.get("max_retries", 1)),
+            base_delay=float(config.get("retry_delay_seconds", 0)),
+            max_delay=float(config.get("retry_max_delay_seconds", 30)),
+            jitter=float(config.get("retry_jitter", 0.5)),
+            failure_threshold=int(config.get("circuit_failure_threshold", 5)),
+            reset_timeout=float(config.get("circuit_reset_seconds", 30)),
+        )
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Return the circuit breaker for a host (created on first use)."""
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based), with jitter applied."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** max(0, attempt - 1))
+        return delay * (1.0 - self.jitter * random.random())
+
+    def time_left(self) -> Optional[float]:
+        """Seconds until the current deadline (None when no deadline is set)."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    @contextmanager
+    def deadline_in(self, seconds: Optional[float]) -> Iterator[None]:
+        """Bound retries started inside the block to ``seconds`` from now (None = unbounded)."""
+        previous = self.deadline
+        self.deadline = None if seconds is None else time.monotonic() + float(seconds)
+        try:
+            yield
+        finally:
+            self.deadline = previous
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Transport errors and retryable HTTP statuses are retried; other errors are not."""
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        if isinstance(status, int):
+            return status in self.RETRY_STATUSES
+        if isinstance(exc, (ConnectionError, TimeoutError, OSError)):
+            return True
+        # httpx transport errors don't subclass OSError
+        return any(cls.__name__ in {"TransportError", "TimeoutException"} for cls in type(exc).__mro__)
+
+    def call(self, fn: Callable[[], T], host: str = "default", max_attempts: Optional[int] = None) -> T:
+        """Call ``fn`` through the host's breaker, retrying transient failures.
+
+        Responses whose ``status_code`` is retryable count as failures; the last one is
+        returned so the caller's ``raise_for_status`` reports it. Retries stop early when
+        the next delay would cross the deadline.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+        """
+        attempts = self.max_attempts if max_attempts is None else max(1, int(max_attempts))
+        breaker = self.breaker(host)
+        attempt = 0
+        while True:
+            breaker.before_call()
+            attempt += 1
+            try:
+                result = fn()
+            except Exception as exc:
+                if not self.is_retryable(exc):
+                    breaker.record_success()  # the host answered; the request itself was bad
+                    raise
+                breaker.record_failure()
+                if not self._wait_for_retry(attempt, attempts):
+                    raise
+                continue
+            status = getattr(result, "status_code", None)
+            if isinstance(status, int) and status in self.RETRY_STATUSES:
+                breaker.record_failure()
+                if not self._wait_for_retry(attempt, attempts):
+                    return result
+                continue
+            breaker.record_success()
+            return result
+
+    def _wait_for_retry(self, attempt: int, attempts: int) -> bool:
+        if attempt >= attempts:
+            return False
+        delay = self.backoff(attempt)
+        left = self.time_left()
+        if left is not None and delay >= left:
+            return False
+        with self._lock:
+            self.retries += 1
+        if delay > 0:
+            self._sleep(delay)
+        return True
+
+
+def host_of(url: str) -> str:
+    """Breaker key for a URL (its netloc, or "local" for path-only TestClient URLs)."""
+    return urlsplit(url).netloc or "local"
+
+
+class TransportMetrics:
+    """Thread-safe request counters and latency totals per (service, method, status class).
+
+    Args:
+        prefix (str): Metric name prefix. Defaults to "http_client".
+    """
+    def __init__(self, prefix: str = "http_client") -> None:
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+
+    def observe(self, service: str, method: str, status: str, seconds: float) -> None:
+        """Record one request.
+
+        Args:
+            service (str): Logical service name (or host) the request went to.
+            method (str): HTTP method.
+            status (str): Status class ("2xx", "5xx", ...) or "error" for transport failures.
+            seconds (float): Wall time until the response (or error) arrived.
+        """
+        key = (service, method.upper(), status)
+        with self._lock:
+            s = self._series.setdefault(key, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            s["count"] += 1
+            s["seconds"] += seconds
+            s["max_seconds"] = max(s["max_seconds"], seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return a copy keyed by "service method status"."""
+        with self._lock:
+            return {" ".join(k): dict(v) for k, v in self._series.items()}
+
+    def to_prometheus(self) -> str:
+        """Render request counts and latency sums in Prometheus text exposition format."""
+        p = self.prefix
+        with self._lock:
+            items = sorted(self._series.items())
+        lines = [
+            f"# HELP {p}_requests_total HTTP requests sent by inter-service clients.",
+            f"# TYPE {p}_requests_total counter",
+        ]
+        lines += [
+            f'{p}_requests_total{{service="{svc}",method="{m}",status="{st}"}} {int(v["count"])}'
+            for (svc, m, st), v in items
+        ]
+        lines += [
+            f"# HELP {p}_request_seconds_total Cumulative request latency.",
+            f"# TYPE {p}_request_seconds_total counter",
+        ]
+        lines += [
+            f'{p}_request_seconds_total{{service="{svc}",method="{m}",status="{st}"}} {v["seconds"]:.6f}'
+            for (svc, m, st), v in items
+        ]
+        return "\n".join(lines) + "\n"
+
+
+default_metrics = TransportMetrics()
+_shared_lock = threading.Lock()
+_shared_session: Any = None
+_shared_pool_maxsize = 0
+
+
+def shared_session(pool_maxsize: int = 16) -> Any:
+    """Return the process-wide pooled ``requests.Session`` (created on first use).
+
+    Args:
+        pool_maxsize: Keep-alive connections kept per host. The pool is sized to the largest
+            value any caller has asked for: a bigger request mounts a larger adapter.
+
+    Raises:
+        RuntimeError: If ``requests`` is not installed.
+    """
+    global _shared_session, _shared_pool_maxsize
+    size = max(1, int(pool_maxsize))
+    with _shared_lock:
+        if _shared_session is None or size > _shared_pool_maxsize:
+            try:
+                import requests  # type: ignore
+                from requests.adapters import HTTPAdapter  # type: ignore
+            except Exception as exc:  # pragma: no cover - environment dependent
+                raise RuntimeError("HTTP transport requires the 'requests' package") from exc
+            if _shared_session is None:
+                _shared_session = requests.Session()  # type: ignore
+            replaced = {_shared_session.adapters.get(prefix) for prefix in ("http://", "https://")} - {None}
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=size)  # type: ignore
+            _shared_session.mount("http://", adapter)
+            _shared_session.mount("https://", adapter)
+            _shared_pool_maxsize = size
+            # Close the old pools' idle sockets; connections still in use are closed when released
+            for old in replaced:
+                old.close()
+        return _shared_session
+
+
+def _status_class(resp: Any) -> str:
+    code = getattr(resp, "status_code", None)
+    return f"{code // 100}xx" if isinstance(code, int) else "unknown"
+
+
+class HTTPTransport:
+    """Base-URL-bound HTTP client on top of the shared pooled session.
+
+    Args:
+        base_url: Prefix for path-only URLs (empty string for TestClient sessions).
+        session: Requests-like session to use instead of the shared pool (tests, custom auth).
+        service: Name used in metrics labels. Defaults to the base URL host.
+        connect_timeout: Seconds to establish a connection.
+        read_timeout: Seconds to wait for response data.
+        retry_policy: Retry/circuit-breaker policy for ``request``. Defaults to 3 attempts;
+            ``post`` makes one attempt unless the caller passes ``attempts``.
+        metrics: Metrics sink. Defaults to the process-wide ``default_metrics``.
+        pool_maxsize: Connections per host this transport needs from the shared session's pool.
+    """
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        session: Optional[Any] = None,
+        service: Optional[str] = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[TransportMetrics] = None,
+        pool_maxsize: int = 16,
+    ) -> None:
+        self.base_url = (base_url or "").rstrip("/")
+        self.session = session if session is not None else shared_session(pool_maxsize)
+        self.host = host_of(self.base_url)
+        self.service = service or self.host
+        self.timeout: Tuple[float, float] = (float(connect_timeout), float(read_timeout))
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or default_metrics
+
+    def url(self, path: str) -> str:
+        """Join ``path`` onto the base URL (absolute URLs pass through)."""
+        if path.startswith(("http://", "https://")):
+            return path
+        if path.startswith("/"):
+            return f"{self.base_url}{path}"
+        return f"{self.base_url}/{path}"
+
+    def _timeout(self, timeout: Optional[Timeout]) -> Any:
+        value = timeout if timeout is not None else self.timeout
+        if isinstance(value, tuple) and callable(getattr(self.session, "stream", None)):
+            # httpx sessions take an httpx.Timeout rather than a (connect, read) pair
+            try:
+                import httpx  # type: ignore
+
+                return httpx.Timeout(value[1], connect=value[0])
+            except Exception:  # pragma: no cover - optional dependency
+                return value[1]
+        return value
+
+    def _send(self, method: str, url: str, timeout: Optional[Timeout], **kwargs: Any) -> Any:
+        send = getattr(self.session, method.lower(), None)
+        if not callable(send):
+            send = lambda u, **kw: self.session.request(method, u, **kw)  # noqa: E731
+        started = time.perf_counter()
+        try:
+            resp = send(url, timeout=self._timeout(timeout), **kwargs)
+        except Exception:
+            self.metrics.observe(self.service, method, "error", time.perf_counter() - started)
+            raise
+        self.metrics.observe(self.service, method, _status_class(resp), time.perf_counter() - started)
+        return resp
+
+    def request(self, method: str, path: str, timeout: Optional[Timeout] = None, attempts: Optional[int] = None, **kwargs: Any) -> Any:
+        """Send a request through the retry policy and circuit breaker.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the base URL (or an absolute URL).
+            timeout: Per-call timeout overriding the transport default.
+            attempts: Per-call attempt limit overriding the policy default.
+            **kwargs: Passed to the session (params, json, files, headers, stream, ...).
+
+        Returns:
+            Any: The response; retryable statuses are returned after the last attempt so the
+            caller's ``raise_for_status`` reports them.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+        """
+        url = self.url(path)
+        return self.retry_policy.call(
+            lambda: self._send(method, url, timeout, **kwargs), host=host_of(url), max_attempts=attempts
+        )
+
+    def get(self, path: str, **kwargs: Any) -> Any:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> Any:
+        # A POST is not assumed to be idempotent: callers opt in to retries with ``attempts``
+        kwargs.setdefault("attempts", 1)
+        return self.request("POST", path, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, path: str, timeout: Optional[Timeout] = None, **kwargs: Any) -> Iterator[Any]:
+        """Open a streamed response (single attempt; callers decide how to retry a body).
+
+        Yields an httpx response (``session.stream``) or a requests response fetched with
+        ``stream=True``; use :func:`iter_body` to read either in chunks. The connection goes
+        back to the pool when the block exits.
+        """
+        url = self.url(path)
+        opener = getattr(self.session, "stream", None)
+        if not callable(opener):  # requests-style session
+            resp = self._send(method, url, timeout, stream=True, **kwargs)
+            try:
+                yield resp
+            finally:
+                close = getattr(resp, "close", None)
+                if callable(close):
+                    close()
+            return
+        started = time.perf_counter()
+        observed = False
+        try:
+            with opener(method, url, timeout=self._timeout(timeout), **kwargs) as resp:
+                self.metrics.observe(self.service, method, _status_class(resp), time.perf_counter() - started)
+                observed = True
+                yield resp
+        except Exception:
+            if not observed:
+                self.metrics.observe(self.service, method, "error", time.perf_counter() - started)
+            raise
+
+
+def iter_body(resp: Any, chunk_size: int) -> Iterator[bytes]:
+    """Yield a streamed response body from either an httpx- or requests-style response."""
+    iter_bytes = getattr(resp, "iter_bytes", None)
+    if callable(iter_bytes):
+        yield from iter_bytes(chunk_size)
+        return
+    yield from resp.iter_content(chunk_size=chunk_size)
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "HTTPTransport",
+    "RetryPolicy",
+    "TransportMetrics",
+    "default_metrics",
+    "host_of",
+    "iter_body",
+    "shared_session",
+]
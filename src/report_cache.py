@@ -0,0 +1,180 @@
+"""Report result cache.
+
+Maps a report request (dataset, window, format, columns, DB table generation) to an artifact
+already rendered into ``reports_dir``, so repeating a request for unchanged data returns the
+existing file instead of re-querying and re-rendering. The table generation comes from the DB
+service (``GET /tables/{t}/generation``) and changes on every write, so new data always misses.
+
+Entries live in a small JSON index (``.report_cache.json``) next to the reports. Cached
+artifacts are evicted least-recently-used first once their total size exceeds ``max_bytes``,
+and any entry older than ``max_age_seconds`` is dropped. ``on_evict`` is told about every
+artifact the cache deletes, so the report catalog never lists a file that is gone.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+INDEX_NAME = ".report_cache.json"
+
+
+class ReportCache:
+    """LRU cache of rendered report files within a reports directory.
+
+    Args:
+        reports_dir (Path): Directory holding the report artifacts and the cache index.
+        max_bytes (int): Total size of cached artifacts to keep. Defaults to 512 MiB.
+        max_age_seconds (float): Entries older than this are evicted. Defaults to 7 days.
+        clock (Callable[[], float]): Time source, injectable for tests.
+        on_evict (Optional[Callable[[str], None]]): Called with the file name of every artifact
+            the cache deletes (size/age eviction, expired or missing entries).
+    """
+
+    def __init__(
+        self,
+        reports_dir: Path | str,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age_seconds: float = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.reports_dir = Path(reports_dir)
+        self.max_bytes = int(max_bytes)
+        self.max_age_seconds = float(max_age_seconds)
+        self.clock = clock
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        self._index_path = self.reports_dir / INDEX_NAME
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @classmethod
+    def from_env(cls, reports_dir: Path | str, on_evict: Optional[Callable[[str], None]] = None) -> "ReportCache":
+        """Build a cache using ``REPORT_CACHE_MAX_BYTES`` / ``REPORT_CACHE_MAX_AGE_SECONDS``."""
+        return cls(
+            reports_dir,
+            on_evict=on_evict,
+            max_bytes=int(os.environ.get("REPORT_CACHE_MAX_BYTES", str(512 * 1024 * 1024))),
+            max_age_seconds=float(os.environ.get("REPORT_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600))),
+        )
+
+    @staticmethod
+    def key(
+        dataset: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        fmt: str,
+        columns: Optional[Sequence[str]],
+        generation: int,
+    ) -> str:
+        """Stable cache key for a report request against a given table generation."""
+        raw = json.dumps(
+            [dataset, start_time, end_time, fmt.lower(), list(columns or []), int(generation)],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {str(k): v for k, v in data.items() if isinstance(v, dict)} if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_path.with_name(self._index_path.name + ".tmp")
+        tmp.write_text(json.dumps(self._entries), encoding="utf-8")
+        os.replace(tmp, self._index_path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached report metadata for ``key`` and mark it used, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = self.clock()
+            if not (self.reports_dir / entry["filename"]).exists() or now - entry["created"] > self.max_age_seconds:
+                self._drop(key)
+                self._save()
+                return None
+            entry["last_used"] = now
+            self._save()
+            return dict(entry["report"])
+
+    def put(self, key: str, filename: str, report: Dict[str, Any]) -> List[str]:
+        """Record a freshly rendered artifact and evict as needed.
+
+        Args:
+            key (str): Cache key from ``ReportCache.key``.
+            filename (str): Artifact file name inside ``reports_dir``.
+            report (Dict[str, Any]): Response metadata to return on later hits.
+
+        Returns:
+            List[str]: File names evicted to stay within the size/age limits.
+
+        Raises:
+            ValueError: If ``filename`` already belongs to another key. Each entry owns its
+                artifact, because evicting an entry deletes its file.
+        """
+        path = self.reports_dir / filename
+        now = self.clock()
+        with self._lock:
+            owner = next((k for k, e in self._entries.items() if e["filename"] == filename and k != key), None)
+            if owner is not None:
+                raise ValueError(f"Report file {filename!r} is already cached under another key")
+            self._entries[key] = {
+                "filename": filename,
+                "size": path.stat().st_size if path.exists() else 0,
+                "created": now,
+                "last_used": now,
+                "report": dict(report),
+            }
+            evicted = self._evict(now, keep=key)
+            self._save()
+        return evicted
+
+    def _drop(self, key: str) -> Optional[str]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        (self.reports_dir / entry["filename"]).unlink(missing_ok=True)
+        if self.on_evict is not None:
+            self.on_evict(str(entry["filename"]))
+        return str(entry["filename"])
+
+    def _evict(self, now: float, keep: Optional[str] = None) -> List[str]:
+        evicted: List[str] = []
+        for k in [k for k, e in self._entries.items() if now - e["created"] > self.max_age_seconds and k != keep]:
+            name = self._drop(k)
+            if name:
+                evicted.append(name)
+        total = sum(int(e["size"]) for e in self._entries.values())
+        for k in sorted(self._entries, key=lambda k: self._entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if k == keep:
+                continue
+            total -= int(self._entries[k]["size"])
+            name = self._drop(k)
+            if name:
+                evicted.append(name)
+        return evicted
+
+    def evict(self) -> List[str]:
+        """Apply the size/age limits now; returns the evicted file names."""
+        with self._lock:
+            evicted = self._evict(self.clock())
+            self._save()
+        return evicted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = ["ReportCache"]
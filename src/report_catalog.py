@@ -0,0 +1,186 @@
+"""Indexed catalog of generated reports.
+
+``GET /reports`` used to glob the reports directory and ``stat()`` every file on each request.
+``ReportCatalog`` keeps a small SQLite manifest (``.report_catalog.sqlite3``) in the reports
+directory instead. It is written when a report is generated or deleted (including cache
+evictions) and read with keyset pagination, so listing costs O(page) however many reports exist.
+
+On open the manifest is reconciled with the directory: report files it does not know about are
+indexed and rows whose file has gone are dropped, so existing deployments keep seeing their older
+reports and files removed behind the service's back disappear from the listing. ``created_at`` is
+stored in UTC.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+CATALOG_NAME = ".report_catalog.sqlite3"
+REPORT_SUFFIXES = (".csv", ".xlsx")
+
+
+_REPORT_NAME = re.compile(r"^(?P<dataset>.+)_\d{8}_\d{6}(?:_[0-9a-f]{8})?$")
+_INSERT = "INSERT INTO reports (filename, dataset, format, row_count, size, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def safe_dataset_name(name: str, default: str = "dataset") -> str:
+    """Filename-safe form of a dataset name, as used in report filenames and catalog rows."""
+    return "".join(ch for ch in name if ch.isalnum() or ch in ("_", "-")) or default
+
+
+def dataset_from_filename(filename: str) -> str:
+    """Dataset part of ``{dataset}_{YYYYmmdd}_{HHMMSS}[_{suffix}].{ext}`` report names."""
+    stem = Path(filename).stem
+    m = _REPORT_NAME.match(stem)
+    return m.group("dataset") if m else stem
+
+
+class ReportCatalog:
+    """SQLite manifest of the reports in a directory.
+
+    Args:
+        reports_dir (Path): Directory holding the reports; the manifest lives inside it.
+    """
+
+    def __init__(self, reports_dir: Path | str) -> None:
+        self.reports_dir = Path(reports_dir)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self._path = self.reports_dir / CATALOG_NAME
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS reports (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    filename TEXT NOT NULL UNIQUE,
+                    dataset TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    row_count INTEGER,
+                    size INTEGER NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_reports_dataset_id ON reports (dataset, id);
+                CREATE INDEX IF NOT EXISTS ix_reports_created_at ON reports (created_at);
+                """
+            )
+        self.reconcile()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:  # commit on success, roll back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def add(
+        self,
+        filename: str,
+        dataset: str,
+        fmt: str,
+        row_count: Optional[int] = None,
+        created_at: Optional[str] = None,
+    ) -> None:
+        """Record (or replace) a report that has just been written to ``reports_dir``."""
+        path = self.reports_dir / filename
+        size = path.stat().st_size if path.exists() else 0
+        created_at = created_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM reports WHERE filename = ?", (filename,))
+            conn.execute(_INSERT, (filename, dataset, fmt, row_count, size, created_at))
+
+    def remove(self, filename: str) -> bool:
+        """Forget a report; returns whether it was catalogued."""
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM reports WHERE filename = ?", (filename,)).rowcount > 0
+
+    def _scan(self, skip: frozenset[str] = frozenset()) -> List[Tuple[Any, ...]]:
+        """Catalog rows for the report files in ``reports_dir`` (oldest first), minus ``skip``."""
+        entries = []
+        for p in sorted(self.reports_dir.iterdir(), key=lambda p: p.stat().st_mtime):
+            if p.suffix.lower() not in REPORT_SUFFIXES or not p.is_file() or p.name in skip:
+                continue
+            st = p.stat()
+            created_at = datetime.fromtimestamp(st.st_mtime, timezone.utc).isoformat(timespec="seconds")
+            entries.append((p.name, dataset_from_filename(p.name), p.suffix.lower().lstrip("."), None, st.st_size, created_at))
+        return entries
+
+    def rebuild(self) -> int:
+        """Re-index the report files present in ``reports_dir``; returns how many were found."""
+        entries = self._scan()
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM reports")
+            conn.executemany(_INSERT, entries)
+        return len(entries)
+
+    def reconcile(self) -> Tuple[int, int]:
+        """Index report files missing from the manifest and drop rows whose file is gone.
+
+        Unlike ``rebuild`` this keeps the row counts and ids of reports that are still present.
+
+        Returns:
+            Tuple[int, int]: How many rows were added and removed.
+        """
+        with self._lock, self._connect() as conn:
+            known = frozenset(r["filename"] for r in conn.execute("SELECT filename FROM reports"))
+            gone = [(name,) for name in known if not (self.reports_dir / name).is_file()]
+            conn.executemany("DELETE FROM reports WHERE filename = ?", gone)
+            entries = self._scan(skip=known)
+            conn.executemany(_INSERT, entries)
+        return len(entries), len(gone)
+
+    def list(
+        self,
+        dataset: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """One page of reports, newest first.
+
+        Args:
+            dataset (Optional[str]): Only reports for this dataset (as given by ``safe_dataset_name``).
+            start (Optional[str]): Inclusive ISO lower bound on created_at.
+            end (Optional[str]): Inclusive ISO upper bound on created_at; a bare date covers the whole day.
+            limit (int): Page size.
+            before (Optional[int]): Cursor from the previous page.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[int]]: The page and the cursor for the next one
+            (None on the last page).
+        """
+        where: List[str] = []
+        params: List[Any] = []
+        if dataset:
+            where.append("dataset = ?")
+            params.append(dataset)
+        if start:
+            where.append("created_at >= ?")
+            params.append(start)
+        if end:
+            where.append("created_at <= ?")
+            # Past any UTC offset suffix, so a bare date covers the whole day
+            params.append(f"{end}T23:59:60" if len(end) == 10 else end)
+        if before is not None:
+            where.append("id < ?")
+            params.append(before)
+        sql = "SELECT * FROM reports"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit + 1)
+        with self._connect() as conn:
+            rows = [dict(r) for r in conn.execute(sql, params)]
+        next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
+
+__all__ = ["ReportCatalog", "dataset_from_filename", "safe_dataset_name"]
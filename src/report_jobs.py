@@ -0,0 +1,141 @@
+"""Asynchronous report jobs.
+
+``ReportJobQueue`` runs report rendering on a bounded thread pool so the API can answer
+``POST /reports/jobs`` immediately with a job id. Each job records its status
+(queued, running, succeeded, failed), progress counters updated while pages are written,
+and the final report metadata or error. See ``docs/specs/report_jobs_openapi.yaml``.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """Raised when the number of unfinished jobs has reached the queue limit."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class ReportJob:
+    job_id: str
+    request: Dict[str, Any]
+    status: str = QUEUED
+    created_at: str = field(default_factory=_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    rows_written: int = 0
+    pages_written: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def advance(self, rows: int) -> None:
+        """Record one written page of ``rows`` rows."""
+        self.pages_written += 1
+        self.rows_written += rows
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "request": self.request,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": {"rows_written": self.rows_written, "pages_written": self.pages_written},
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class ReportJobQueue:
+    """Run report jobs on a bounded worker pool and keep their state for polling.
+
+    Args:
+        workers (int): Jobs rendered concurrently.
+        max_pending (int): Unfinished (queued + running) jobs accepted before ``submit`` raises
+            ``JobQueueFull``.
+        history (int): Finished jobs kept for status/result lookups; oldest are forgotten first.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 64, history: int = 500) -> None:
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending))
+        self.history = max(1, int(history))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="report-job")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, ReportJob]" = OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> "ReportJobQueue":
+        """Build a queue from ``REPORT_JOB_WORKERS`` / ``REPORT_JOB_MAX_PENDING`` / ``REPORT_JOB_HISTORY``."""
+        return cls(
+            workers=int(os.environ.get("REPORT_JOB_WORKERS", "4")),
+            max_pending=int(os.environ.get("REPORT_JOB_MAX_PENDING", "64")),
+            history=int(os.environ.get("REPORT_JOB_HISTORY", "500")),
+        )
+
+    def submit(self, request: Dict[str, Any], render: Callable[[ReportJob], Dict[str, Any]]) -> ReportJob:
+        """Queue ``render(job)`` and return the job immediately.
+
+        ``render`` returns the report metadata and may call ``job.advance`` to report progress;
+        an exception marks the job failed with its message.
+        """
+        with self._lock:
+            if sum(1 for j in self._jobs.values() if not j.done) >= self.max_pending:
+                raise JobQueueFull(f"{self.max_pending} report jobs already pending")
+            job = ReportJob(job_id=uuid.uuid4().hex, request=dict(request))
+            self._jobs[job.job_id] = job
+            self._trim()
+        self._executor.submit(self._run, job, render)
+        return job
+
+    def _run(self, job: ReportJob, render: Callable[[ReportJob], Dict[str, Any]]) -> None:
+        job.status = RUNNING
+        job.started_at = _now()
+        try:
+            job.result = render(job)
+            job.status = SUCCEEDED
+        except Exception as exc:  # noqa: BLE001 - reported through the job status
+            job.error = str(getattr(exc, "detail", None) or exc)
+            job.status = FAILED
+        finally:
+            job.finished_at = _now()
+
+    def _trim(self) -> None:
+        finished = [k for k, j in self._jobs.items() if j.done]
+        for key in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[key]
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, limit: int = 50) -> List[ReportJob]:
+        """Most recently submitted jobs first."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))[:limit]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+__all__ = ["JobQueueFull", "ReportJob", "ReportJobQueue", "QUEUED", "RUNNING", "SUCCEEDED", "FAILED"]
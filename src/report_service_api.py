@@ -3,21 +3,53 @@ Report Service API (FastAPI) for generating, listing, and downloading reports.
 
 Design goals:
 - Pull rows from the existing DB Service API using an injected HTTP session (FastAPI TestClient in tests).
-- Generate CSV reports for a given dataset and time window (ISO 8601 strings).
+- Generate CSV reports for a given dataset and time window (ISO 8601 strings). CSV output is
+  streamed page by page from ``/tables/{t}/rows/page`` so memory does not grow with the window.
+- Generate XLSX reports with a constant-memory (write-only) workbook fed from the same pages.
+- Reuse an already rendered report when the same dataset/window/format is requested and the
+  table's generation in the DB service is unchanged (see ``report_cache.ReportCache``).
+- Render large reports asynchronously: ``POST /reports/jobs`` returns a job id at once and the
+  report is rendered on a bounded worker pool (``report_jobs.ReportJobQueue``); poll
+  ``GET /reports/jobs/{id}`` for status/progress and fetch ``/reports/jobs/{id}/result``.
+  The contract is in ``docs/specs/report_jobs_openapi.yaml``.
+- Read directly from the DB service's SQLite file instead of over HTTP when co-located: set
+  ``REPORT_DB_PATH`` (or ``app.state.direct_db``) to use a read-only ``SQLiteReportDBClient``.
+- Fetch only the columns a report shows: the request's ``columns`` or the dataset's entry in
+  ``[report.columns]`` (``config/settings.toml``) is pushed into the DB query's projection.
+- List reports from an indexed manifest (``report_catalog.ReportCatalog``) kept up to date on
+  generate/delete, with dataset/date filters and cursor pagination instead of a directory scan.
+- Build the multi-sheet workbook described by ``[report.columns]`` in ``config/settings.toml``
+  (``POST /reports/workbook``); all datasets are fetched concurrently, one sheet each.
 - Store reports on disk in a configurable directory and expose download/list endpoints.
 """
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, cast
 
-from fastapi import FastAPI, HTTPException, Body
+from fastapi import FastAPI, HTTPException, Body, Query
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel, Field
-import csv
 import os
-import pandas as pd
+
+from http_transport import HTTPTransport
+from report_cache import ReportCache
+from report_catalog import ReportCatalog, safe_dataset_name
+from report_jobs import SUCCEEDED, JobQueueFull, ReportJob, ReportJobQueue
+from report_service_core import (
+    DEFAULT_PAGE_SIZE,
+    SQLiteReportDBClient,
+    configured_columns,
+    fetch_parallel,
+    iter_row_pages,
+    load_report_settings,
+    project_columns,
+    report_filename,
+    resolve_tables,
+    write_csv_pages,
+    write_xlsx_pages,
+    write_xlsx_sheets,
+)
 
 
 app = FastAPI(title="Report Service API")
@@ -37,30 +69,68 @@ def _get_reports_dir() -> Path:
 def _db_session() -> Any:
     sess = getattr(app.state, "db_session", None)  # type: ignore[attr-defined]
     if sess is None:
+        base_url = os.environ.get("DB_API_URL", "http://localhost:8000").rstrip("/")
         try:
-            import requests  # type: ignore
-        except Exception as exc:  # pragma: no cover
+            # Pooled keep-alive session with timeouts/retries; prepends base_url to path-only requests
+            sess = HTTPTransport(base_url, service="db_service", read_timeout=120.0)
+        except RuntimeError as exc:  # pragma: no cover - requests not installed
             raise HTTPException(status_code=500, detail="DB session not configured") from exc
-        base_url = os.environ.get("DB_API_URL", "http://localhost:8000").rstrip("/")
-        s = requests.Session()  # type: ignore
-        # Wrap to prepend base_url for path-only requests
-        class _Wrapper:
-            def __init__(self, session: Any, base: str):
-                self._s = session
-                self._base = base
-            def get(self, url: str, **kwargs: Any):  # noqa: D401
-                full = url if url.startswith("http") else f"{self._base}{url}"
-                return self._s.get(full, **kwargs)
-        sess = _Wrapper(s, base_url)
         app.state.db_session = sess  # type: ignore[attr-defined]
     return sess
 
 
+_UNSET = object()
+
+
+def _direct_db() -> Optional[SQLiteReportDBClient]:
+    direct = getattr(app.state, "direct_db", _UNSET)  # type: ignore[attr-defined]
+    if direct is _UNSET:
+        direct = SQLiteReportDBClient.from_env()
+        app.state.direct_db = direct  # type: ignore[attr-defined]
+    return cast(Optional[SQLiteReportDBClient], direct)
+
+
+def _report_cache(reports_dir: Path) -> ReportCache:
+    cache: Optional[ReportCache] = getattr(app.state, "report_cache", None)  # type: ignore[attr-defined]
+    if cache is None or cache.reports_dir != reports_dir:
+        cache = ReportCache.from_env(reports_dir, on_evict=_report_catalog(reports_dir).remove)
+        app.state.report_cache = cache  # type: ignore[attr-defined]
+    return cache
+
+
+def _report_catalog(reports_dir: Path) -> ReportCatalog:
+    catalog: Optional[ReportCatalog] = getattr(app.state, "report_catalog", None)  # type: ignore[attr-defined]
+    if catalog is None or catalog.reports_dir != reports_dir:
+        catalog = ReportCatalog(reports_dir)
+        app.state.report_catalog = catalog  # type: ignore[attr-defined]
+    return catalog
+
+
+def _table_generation(dataset: str) -> Optional[int]:
+    """Current data version of the dataset's table, or None when the DB service can't say."""
+    try:
+        direct = _direct_db()
+        if direct is not None:
+            return direct.get_generation(dataset)
+        resp = _db_session().get(f"/tables/{dataset}/generation")
+        resp.raise_for_status()
+        return int(resp.json()["generation"])
+    except Exception:  # noqa: BLE001 - caching is best effort
+        return None
+
+
 class ReportRequest(BaseModel):
     dataset: str = Field(..., description="Dataset/table name to query")
     start_time: str = Field(..., description="Inclusive ISO 8601 start time")
     end_time: str = Field(..., description="Inclusive ISO 8601 end time")
     format: str = Field("csv", description="Report format (csv)")
+    columns: Optional[List[str]] = Field(None, description="Columns to include (default: the dataset's [report.columns])")
+
+
+class WorkbookRequest(BaseModel):
+    start_time: str = Field(..., description="Inclusive ISO 8601 start time")
+    end_time: str = Field(..., description="Inclusive ISO 8601 end time")
+    datasets: Optional[List[str]] = Field(None, description="Datasets to include (default: [report.columns] keys)")
 
 
 @app.get("/health")
@@ -69,109 +139,275 @@ def health() -> Dict[str, str]:
 
 
 @app.get("/reports")
-def list_reports() -> JSONResponse:
+def list_reports(
+    dataset: Optional[str] = Query(None, description="Only reports for this dataset"),
+    start: Optional[str] = Query(None, description="Inclusive ISO date/time lower bound on created_at (UTC)"),
+    end: Optional[str] = Query(None, description="Inclusive ISO date/time upper bound on created_at (UTC)"),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
+) -> JSONResponse:
+    """One page of generated reports (CSV and XLSX), newest first.
+
+    Example response:
+        {"reports": [{"filename": "ACQ_20250822_100000.csv", "dataset": "ACQ", "format": "csv",
+                      "row_count": 120, "size": 5120, "created_at": "2025-08-22T10:00:00+00:00", "path": "..."}],
+         "next_cursor": 41}
+    """
     reports_dir = _get_reports_dir()
-    items: List[Dict[str, Any]] = []
-    # Include both CSV and XLSX outputs
-    files = list(reports_dir.glob("*.csv")) + list(reports_dir.glob("*.xlsx"))
-    for p in sorted(files):
-        stat = p.stat()
-        items.append({
-            "filename": p.name,
-            "path": str(p.resolve()),
-            "size": stat.st_size,
-            "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-        })
-    return JSONResponse(content={"reports": items})
-
-
-def _fetch_rows(dataset: str, start_time: str, end_time: str) -> List[Dict[str, Any]]:
-    sess = _db_session()
-    params = {
-        "start_time": start_time,
-        "end_time": end_time,
-        "timestamp_column": "timestamp",
-    }
-    resp = sess.get(f"/tables/{dataset}/rows", params=params)
-    if getattr(resp, "status_code", 200) == 404:
-        return []
+    # The catalog keys reports by the filename-safe dataset name, so filter on that form too
+    safe = safe_dataset_name(dataset) if dataset else None
+    rows, next_cursor = _report_catalog(reports_dir).list(safe, start, end, limit, cursor)
+    root = reports_dir.resolve()
+    items = [{**{k: v for k, v in r.items() if k != "id"}, "path": str(root / r["filename"])} for r in rows]
+    return JSONResponse(content={"reports": items, "next_cursor": next_cursor})
+
+
+@app.delete("/reports/{filename}")
+def delete_report(filename: str) -> Dict[str, Any]:
+    reports_dir = _get_reports_dir()
+    path = (reports_dir / filename).resolve()
+    if path.parent != reports_dir.resolve() or path.suffix.lower() not in (".csv", ".xlsx"):
+        raise HTTPException(status_code=404, detail="Report not found")
+    catalogued = _report_catalog(reports_dir).remove(filename)
+    if not path.exists() and not catalogued:
+        raise HTTPException(status_code=404, detail="Report not found")
+    path.unlink(missing_ok=True)
+    return {"message": "Report deleted", "filename": filename}
+
+
+def _table_columns(dataset: str) -> Optional[List[str]]:
+    direct = _direct_db()
+    if direct is not None:
+        return direct.table_columns(dataset)
+    resp = _db_session().get(f"/tables/{dataset}/schema")
+    if getattr(resp, "status_code", 200) in (400, 404):
+        return None
     try:
         resp.raise_for_status()
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=502, detail=f"DB API error: {getattr(resp, 'text', str(exc))}")
-    data_raw: Any = resp.json()
-    if not isinstance(data_raw, list):
-        raise HTTPException(status_code=502, detail="Unexpected DB API response")
-    rows: List[Dict[str, Any]] = []
-    for item in data_raw:
-        if isinstance(item, dict):
-            rows.append(cast(Dict[str, Any], item))
-        # ignore non-dict rows defensively
-    return rows
-
-
-def _write_csv(rows: List[Dict[str, Any]], path: Path) -> int:
-    if not rows:
-        # Write just headers if no data? Keep minimal CSV with no header if unknown columns.
-        path.write_text("")
-        return 0
-    # Determine fieldnames from first row (stable order by insertion or sorted as fallback)
-    fieldnames = list(rows[0].keys())
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    return len(rows)
-
-
-def _write_xlsx(rows: List[Dict[str, Any]], path: Path) -> int:
-    # Write an XLSX using pandas; supports empty datasets as an empty sheet
-    df = pd.DataFrame(rows)
-    # Use openpyxl engine by default
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        sheet = "Sheet1"
-        # Truncate sheet name to Excel's 31-char limit if we can infer from filename stem
-        try:
-            stem = path.stem
-            sheet = (stem.split("_", 1)[0] or sheet)[:31]
-        except Exception:
-            pass
-        df.to_excel(writer, sheet_name=sheet, index=False)  # type: ignore
-    return int(len(df))
+    return [str(c["name"]) for c in resp.json().get("schema", [])]
 
 
-@app.post("/reports/generate")
-def generate_report(payload: ReportRequest = Body(...)) -> JSONResponse:
+def _iter_pages(
+    dataset: str, start_time: str, end_time: str, columns: Optional[List[str]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    page_size = int(getattr(app.state, "page_size", DEFAULT_PAGE_SIZE))  # type: ignore[attr-defined]
+    direct = _direct_db()
+    if direct is not None:
+        pages = direct.iter_pages(dataset, start_time, end_time, columns=columns, page_size=page_size)
+    else:
+        sess = _db_session()
+        pages = iter_row_pages(
+            lambda path, params: sess.get(path, params=params),
+            dataset, start_time, end_time, columns=columns, page_size=page_size,
+        )
+    try:
+        yield from pages
+    except HTTPException:
+        raise
+    except ValueError as exc:
+        if direct is None:
+            raise HTTPException(status_code=502, detail=f"DB API error: {exc}")
+        # The direct reader's request errors (e.g. no timestamp column) match the DB API's 400
+        raise HTTPException(status_code=400, detail=str(exc))
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=502, detail=f"DB API error: {exc}")
+
+
+def _job_queue() -> ReportJobQueue:
+    queue: Optional[ReportJobQueue] = getattr(app.state, "job_queue", None)  # type: ignore[attr-defined]
+    if queue is None:
+        queue = ReportJobQueue.from_env()
+        app.state.job_queue = queue  # type: ignore[attr-defined]
+    return queue
+
+
+def _check_format(payload: ReportRequest) -> str:
     fmt = payload.format.lower()
     if fmt not in {"csv", "xlsx", "excel"}:
         raise HTTPException(status_code=400, detail="Only csv or xlsx formats are supported")
+    return fmt
+
+
+def _report_pages(
+    payload: ReportRequest, columns: Optional[List[str]], on_page: Optional[Callable[[int], None]]
+) -> Iterator[List[Dict[str, Any]]]:
+    for page in _iter_pages(payload.dataset, payload.start_time, payload.end_time, columns):
+        yield page
+        if on_page is not None:
+            on_page(len(page))
+
 
-    rows = _fetch_rows(payload.dataset, payload.start_time, payload.end_time)
+def _render_report(payload: ReportRequest, on_page: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+    """Render (or reuse from cache) one report; ``on_page(rows)`` is called after each written page."""
+    fmt = _check_format(payload)
     reports_dir = _get_reports_dir()
-    safe_dataset = "".join(ch for ch in payload.dataset if ch.isalnum() or ch in ("_", "-")) or "dataset"
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_fmt = "csv" if fmt == "csv" else "xlsx"
+    cache = _report_cache(reports_dir)
+    wanted = payload.columns or configured_columns(payload.dataset, _report_settings())
+    generation = _table_generation(payload.dataset)
+    cache_key = None
+    if generation is not None:
+        # The table's layout can only change with its generation, so the requested columns suffice
+        cache_key = ReportCache.key(payload.dataset, payload.start_time, payload.end_time, out_fmt, wanted, generation)
+        hit = cache.get(cache_key)
+        if hit is not None:
+            return {**hit, "message": "Report served from cache", "cached": True}
+
+    try:
+        # Explicitly requested columns must all exist; configured ones fall back to every column
+        columns = project_columns(wanted, _table_columns(payload.dataset), strict=bool(payload.columns)) if wanted else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"{exc} (dataset {payload.dataset!r})")
+    safe_dataset = safe_dataset_name(payload.dataset)
 
     if fmt == "csv":
-        filename = f"{safe_dataset}_{timestamp}.csv"
+        filename = report_filename(safe_dataset, "csv")
         out_path = reports_dir / filename
-        count = _write_csv(rows, out_path)
-        out_fmt = "csv"
+        count = write_csv_pages(_report_pages(payload, columns, on_page), out_path)
     else:
-        filename = f"{safe_dataset}_{timestamp}.xlsx"
+        filename = report_filename(safe_dataset, "xlsx")
         out_path = reports_dir / filename
-        count = _write_xlsx(rows, out_path)
-        out_fmt = "xlsx"
+        count = write_xlsx_pages(_report_pages(payload, columns, on_page), out_path, sheet_name=safe_dataset)
 
-    return JSONResponse(content={
+    result: Dict[str, Any] = {
         "message": "Report generated",
         "dataset": payload.dataset,
         "format": out_fmt,
         "row_count": count,
+        "columns": columns,
         "filename": filename,
         "path": str(out_path.resolve()),
+    }
+    _report_catalog(reports_dir).add(filename, safe_dataset, out_fmt, count)
+    if cache_key is not None:
+        cache.put(cache_key, filename, result)  # evictions reach the catalog through on_evict
+    return {**result, "cached": False}
+
+
+@app.post("/reports/generate")
+def generate_report(payload: ReportRequest = Body(...)) -> JSONResponse:
+    return JSONResponse(content=_render_report(payload))
+
+
+def _report_settings() -> Dict[str, Any]:
+    settings: Optional[Dict[str, Any]] = getattr(app.state, "report_settings", None)  # type: ignore[attr-defined]
+    if settings is None:
+        settings = load_report_settings()
+        app.state.report_settings = settings  # type: ignore[attr-defined]
+    return settings
+
+
+def _list_tables() -> List[str]:
+    direct = _direct_db()
+    if direct is not None:
+        return direct.list_tables()
+    resp = _db_session().get("/tables")
+    try:
+        resp.raise_for_status()
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=502, detail=f"DB API error: {getattr(resp, 'text', str(exc))}")
+    return [str(t) for t in resp.json().get("tables", [])]
+
+
+@app.post("/reports/workbook")
+def generate_workbook(payload: WorkbookRequest = Body(...)) -> JSONResponse:
+    """Write one sheet per configured dataset into a single XLSX workbook.
+
+    Datasets are fetched concurrently, so the workbook costs about as much as its slowest
+    dataset. Dataset keys are matched to DB tables case-insensitively (``ib_calls`` -> ``IB_Calls``);
+    a dataset with no table or no rows in the window gives an empty sheet.
+
+    Example response:
+        {"message": "Workbook generated", "format": "xlsx", "filename": "hourly_report_20250822_010000.xlsx",
+         "path": "...", "row_count": 120, "sheets": {"ib_calls": 40, "qcbs": 0, ...}}
+    """
+    settings = _report_settings()
+    names = list(payload.datasets or settings.get("columns", {}).keys())
+    if not names:
+        raise HTTPException(status_code=400, detail="No datasets requested or configured in [report.columns]")
+    tables = resolve_tables(names, _list_tables())
+    workers = int(os.environ.get("REPORT_WORKBOOK_WORKERS", "8"))
+
+    def fetch(d: str) -> Iterator[List[Dict[str, Any]]]:
+        columns = project_columns(configured_columns(d, settings), _table_columns(tables[d]))
+        return _iter_pages(tables[d], payload.start_time, payload.end_time, columns)
+
+    stem = safe_dataset_name(Path(str(settings.get("workbook_name", "workbook.xlsx"))).stem, "workbook")
+    filename = report_filename(stem, "xlsx")
+    out_path = _get_reports_dir() / filename
+    with fetch_parallel(fetch, names, workers) as pages:
+        counts = write_xlsx_sheets(((d, pages[d]) for d in names), out_path)
+    _report_catalog(_get_reports_dir()).add(filename, stem, "xlsx", sum(counts.values()))
+    return JSONResponse(content={
+        "message": "Workbook generated",
+        "format": "xlsx",
+        "filename": filename,
+        "path": str(out_path.resolve()),
+        "row_count": sum(counts.values()),
+        "sheets": counts,
+    })
+
+
+@app.post("/reports/jobs")
+def submit_report_job(payload: ReportRequest = Body(...)) -> JSONResponse:
+    """Queue a report for asynchronous rendering.
+
+    Example response (202):
+        {"job_id": "3f2c...", "status": "queued",
+         "status_url": "/reports/jobs/3f2c...", "result_url": "/reports/jobs/3f2c.../result"}
+    """
+    _check_format(payload)
+
+    def render(job: ReportJob) -> Dict[str, Any]:
+        return _render_report(payload, on_page=job.advance)
+
+    try:
+        job = _job_queue().submit(payload.model_dump(), render)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=429, detail=str(exc))
+    return JSONResponse(status_code=202, content={
+        "job_id": job.job_id,
+        "status": job.status,
+        "status_url": f"/reports/jobs/{job.job_id}",
+        "result_url": f"/reports/jobs/{job.job_id}/result",
     })
 
 
+@app.get("/reports/jobs")
+def list_report_jobs(limit: int = Query(50, ge=1, le=1000)) -> Dict[str, Any]:
+    return {"jobs": [j.to_dict() for j in _job_queue().list(limit)]}
+
+
+def _get_job(job_id: str) -> ReportJob:
+    job = _job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/reports/jobs/{job_id}")
+def get_report_job(job_id: str) -> Dict[str, Any]:
+    """Job status with progress.
+
+    Example response:
+        {"job_id": "3f2c...", "status": "running", "progress": {"rows_written": 15000, "pages_written": 3},
+         "result": null, "error": null, ...}
+    """
+    return _get_job(job_id).to_dict()
+
+
+@app.get("/reports/jobs/{job_id}/result")
+def get_report_job_result(job_id: str) -> FileResponse:
+    """Download the finished report; 409 while the job is queued/running or if it failed."""
+    job = _get_job(job_id)
+    if job.status != SUCCEEDED or job.result is None:
+        detail = job.error if job.error else f"Job is {job.status}"
+        raise HTTPException(status_code=409, detail=detail)
+    return download_report(str(job.result["filename"]))
+
+
 @app.get("/reports/download/{filename}")
 def download_report(filename: str) -> FileResponse:
     reports_dir = _get_reports_dir()
@@ -1,27 +1,48 @@
 """
 Report Generation Service Core Logic.
 Fetches data from DB Service API and emits reports (CSV/XLSX).
+
+Two DB backends share one interface (get_rows / iter_pages / list_tables / get_generation):
+``ReportDBClient`` talks to the DB Service API over HTTP, and ``SQLiteReportDBClient`` reads the
+DB service's SQLite file directly through a read-only connection for co-located deployments.
+
+Reports are streamed: rows are fetched page by page (``GET /tables/{t}/rows/page``)
+and appended to the output as they arrive, so memory stays bounded by the page size. XLSX
+output uses openpyxl's write-only workbook, which serialises rows instead of keeping a DOM.
 """
 from __future__ import annotations
 
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+import tomllib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from openpyxl import Workbook
+
+from http_transport import HTTPTransport
+from report_catalog import ReportCatalog
 
-import pandas as pd
+
+SETTINGS_PATH = Path(__file__).resolve().parents[1] / "config" / "settings.toml"
+
+# Rows per DB API request when streaming reports
+DEFAULT_PAGE_SIZE = int(os.environ.get("REPORT_PAGE_SIZE", "5000"))
 
 
 class ReportDBClient:
-    def __init__(self, api_url: Optional[str] = None, session: Optional[Any] = None) -> None:
+    def __init__(self, api_url: Optional[str] = None, session: Optional[Any] = None, transport: Optional[HTTPTransport] = None) -> None:
         self.api_url = (api_url or "http://localhost:8000").rstrip("/")
-        self.session = session
-        if self.session is None:
-            try:
-                import requests  # type: ignore
-            except Exception as exc:  # pragma: no cover
-                raise RuntimeError("ReportDBClient requires an HTTP session in this environment") from exc
-            self.session = requests.Session()  # type: ignore
+        self.transport = transport or HTTPTransport(self.api_url, session=session, service="db_service", read_timeout=120.0)
+        self.session = self.transport.session
 
     def _url(self, path: str) -> str:
         if path.startswith("/"):
@@ -43,10 +64,441 @@ class ReportDBClient:
             params["end_time"] = end_time
         if columns:
             params["columns"] = ",".join(columns)
-        resp: Any = self.session.get(self._url(f"/tables/{dataset}/rows"), params=params)  # type: ignore[attr-defined]
+        resp: Any = self.transport.get(self._url(f"/tables/{dataset}/rows"), params=params)
         resp.raise_for_status()
         return list(resp.json())
 
+    def list_tables(self) -> List[str]:
+        resp: Any = self.transport.get(self._url("/tables"))
+        resp.raise_for_status()
+        return [str(t) for t in resp.json().get("tables", [])]
+
+    def table_columns(self, dataset: str) -> Optional[List[str]]:
+        """Column names of a table, or None when it does not exist."""
+        resp: Any = self.transport.get(self._url(f"/tables/{dataset}/schema"))
+        if getattr(resp, "status_code", 200) in (400, 404):
+            return None
+        resp.raise_for_status()
+        return [str(c["name"]) for c in resp.json().get("schema", [])]
+
+    def get_generation(self, dataset: str) -> int:
+        resp: Any = self.transport.get(self._url(f"/tables/{dataset}/generation"))
+        resp.raise_for_status()
+        return int(resp.json()["generation"])
+
+    def iter_pages(
+        self,
+        dataset: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        timestamp_column: str = "timestamp",
+        columns: Optional[List[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the window's rows one page at a time (see ``iter_row_pages``)."""
+        return iter_row_pages(
+            lambda path, params: self.transport.get(self._url(path), params=params),
+            dataset, start_time, end_time, timestamp_column, columns, page_size,
+        )
+
+
+def iter_row_pages(
+    get: Callable[[str, Dict[str, Any]], Any],
+    dataset: str,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    timestamp_column: str = "timestamp",
+    columns: Optional[List[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Page through ``GET /tables/{dataset}/rows/page`` until the last page.
+
+    Args:
+        get: Callable ``(path, params) -> response`` (a DB API session or transport).
+        dataset: Table to read.
+        start_time: Inclusive ISO start of the window.
+        end_time: Inclusive ISO end of the window.
+        timestamp_column: Column the window applies to.
+        columns: Optional column projection.
+        page_size: Rows per request.
+
+    Yields:
+        List[Dict[str, Any]]: Non-empty pages of rows in insertion order. A missing table
+        (404) yields nothing.
+    """
+    params: Dict[str, Any] = {"timestamp_column": timestamp_column, "limit": page_size}
+    if start_time:
+        params["start_time"] = start_time
+    if end_time:
+        params["end_time"] = end_time
+    if columns:
+        params["columns"] = ",".join(columns)
+    after: Optional[int] = None
+    while True:
+        page_params = dict(params, after=after) if after is not None else params
+        resp: Any = get(f"/tables/{dataset}/rows/page", page_params)
+        if getattr(resp, "status_code", 200) == 404:
+            return
+        resp.raise_for_status()
+        payload: Dict[str, Any] = resp.json()
+        rows = [r for r in payload.get("rows", []) if isinstance(r, dict)]
+        if rows:
+            yield rows
+        after = payload.get("next_after")
+        if after is None:
+            return
+
+
+class SQLiteReportDBClient:
+    """Read report rows straight from the DB service's SQLite file, skipping HTTP and JSON.
+
+    Opens ``file:<path>?mode=ro`` connections, so this client can never write. The DB service
+    runs its database in WAL mode, which lets these readers proceed while ingest is writing.
+    A connection is opened per call, so one client can serve concurrent fetches.
+
+    Args:
+        db_path: SQLite file path, or a ``sqlite:///`` URL as used by ``DB_SERVICE_DB_PATH``.
+        timeout: Seconds to wait on a locked database.
+    """
+
+    def __init__(self, db_path: str | Path, timeout: float = 30.0) -> None:
+        path = str(db_path)
+        if path.startswith("sqlite:///"):
+            path = path[len("sqlite:///"):]
+        self.db_path = Path(path)
+        self.timeout = float(timeout)
+
+    @classmethod
+    def from_env(cls) -> Optional["SQLiteReportDBClient"]:
+        """Build from ``REPORT_DB_PATH`` (file path or sqlite URL); None when unset."""
+        path = os.environ.get("REPORT_DB_PATH")
+        return cls(path) if path else None
+
+    def _connect(self) -> sqlite3.Connection:
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        return sqlite3.connect(uri, uri=True, timeout=self.timeout, check_same_thread=False)
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def _table_exists(self, conn: sqlite3.Connection, table: str) -> bool:
+        row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+        return row is not None
+
+    def _select(
+        self,
+        conn: sqlite3.Connection,
+        dataset: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        timestamp_column: str,
+        columns: Optional[List[str]],
+    ) -> Tuple[str, List[Any]]:
+        if (start_time or end_time) and timestamp_column not in self._column_names(conn, dataset):
+            # Comparing a missing column would silently match nothing; the DB API answers 400 here
+            raise ValueError(f"Table {dataset!r} has no timestamp column {timestamp_column!r}")
+        cols = ", ".join(self._quote(c) for c in columns) if columns else "*"
+        sql = f"SELECT {cols} FROM {self._quote(dataset)}"
+        where: List[str] = []
+        params: List[Any] = []
+        if start_time:
+            where.append(f"{self._quote(timestamp_column)} >= ?")
+            params.append(start_time)
+        if end_time:
+            where.append(f"{self._quote(timestamp_column)} <= ?")
+            params.append(end_time)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return sql + " ORDER BY rowid", params
+
+    def _column_names(self, conn: sqlite3.Connection, dataset: str) -> List[str]:
+        return [r[1] for r in conn.execute(f"PRAGMA table_info({self._quote(dataset)})")]
+
+    def _iter_chunks(
+        self,
+        dataset: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        timestamp_column: str,
+        columns: Optional[List[str]],
+        page_size: int,
+    ) -> Iterator[Tuple[List[str], List[Tuple[Any, ...]]]]:
+        """Yield ``(column names, raw row tuples)`` per ``page_size`` rows; a missing table yields nothing."""
+        conn = self._connect()
+        try:
+            if not self._table_exists(conn, dataset):
+                return
+            sql, params = self._select(conn, dataset, start_time, end_time, timestamp_column, columns)
+            cur = conn.execute(sql, params)
+            names = [d[0] for d in cur.description]
+            while True:
+                chunk = cur.fetchmany(page_size)
+                if not chunk:
+                    return
+                yield names, chunk
+        finally:
+            conn.close()
+
+    def iter_columns(
+        self,
+        dataset: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        timestamp_column: str = "timestamp",
+        columns: Optional[List[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """Yield the window as columnar chunks ``{column: [values...]}`` of up to ``page_size`` rows.
+
+        For columnar consumers; report writers use ``iter_pages``. A missing table yields nothing.
+
+        Raises:
+            ValueError: If a time bound is given and the table has no ``timestamp_column``.
+        """
+        for names, chunk in self._iter_chunks(dataset, start_time, end_time, timestamp_column, columns, page_size):
+            yield {name: list(values) for name, values in zip(names, zip(*chunk))}
+
+    def iter_pages(
+        self,
+        dataset: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        timestamp_column: str = "timestamp",
+        columns: Optional[List[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the window's rows one page at a time, like ``ReportDBClient.iter_pages``.
+
+        Raises:
+            ValueError: If a time bound is given and the table has no ``timestamp_column``.
+        """
+        for names, chunk in self._iter_chunks(dataset, start_time, end_time, timestamp_column, columns, page_size):
+            yield [dict(zip(names, row)) for row in chunk]
+
+    def get_rows(
+        self,
+        dataset: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        timestamp_column: str = "timestamp",
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        return [row for page in self.iter_pages(dataset, start_time, end_time, timestamp_column, columns) for row in page]
+
+    def list_tables(self) -> List[str]:
+        conn = self._connect()
+        try:
+            return [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+        finally:
+            conn.close()
+
+    def table_columns(self, dataset: str) -> Optional[List[str]]:
+        """Column names of a table, or None when it does not exist."""
+        conn = self._connect()
+        try:
+            if not self._table_exists(conn, dataset):
+                return None
+            return self._column_names(conn, dataset)
+        finally:
+            conn.close()
+
+    def get_generation(self, dataset: str) -> int:
+        """Read the table's write generation maintained by the DB service (0 if never written)."""
+        conn = self._connect()
+        try:
+            if not self._table_exists(conn, "table_generation"):
+                return 0
+            row = conn.execute("SELECT generation FROM table_generation WHERE table_name = ?", (dataset,)).fetchone()
+            return int(row[0] or 0) if row else 0
+        finally:
+            conn.close()
+
+
+def report_filename(stem: str, ext: str) -> str:
+    """Unique report file name ``{stem}_{YYYYmmdd_HHMMSS}_{8 hex}.{ext}``.
+
+    The random suffix keeps renders that start in the same second (parallel jobs, different
+    windows of one dataset) from sharing a file.
+    """
+    return f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.{ext}"
+
+
+def _temp_path(path: Path) -> Path:
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    os.close(fd)
+    return Path(name)
+
+
+def write_csv_pages(pages: Iterable[List[Dict[str, Any]]], path: Path) -> int:
+    """Append pages of rows to a CSV file as they arrive; returns the row count.
+
+    The header comes from the first row's keys. Output goes to a private temp file in the same
+    directory, renamed into place when complete, so readers never see a half-written report.
+    No rows gives an empty file.
+    """
+    tmp = _temp_path(path)
+    count = 0
+    try:
+        with tmp.open("w", newline="", encoding="utf-8") as f:
+            writer: Optional[csv.DictWriter[str]] = None
+            for page in pages:
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(page[0].keys()), extrasaction="ignore")
+                    writer.writeheader()
+                writer.writerows(page)
+                count += len(page)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def write_xlsx_sheets(sheets: Iterable[Tuple[str, Iterable[List[Dict[str, Any]]]]], path: Path) -> Dict[str, int]:
+    """Stream ``(sheet_name, pages)`` pairs into one XLSX in constant memory.
+
+    Uses an openpyxl write-only workbook, so each row is written out as it is appended.
+    Each sheet's header comes from its first row's keys; no rows gives an empty sheet.
+    Titles are cut to Excel's 31 characters; names that collide after the cut get a
+    ``~2``, ``~3``... suffix.
+
+    Returns:
+        Dict[str, int]: Row count per ``sheet_name`` as given (not the possibly shortened
+        title), in sheet order.
+    """
+    wb = Workbook(write_only=True)
+    counts: Dict[str, int] = {}
+    used: set[str] = set()
+    for sheet_name, pages in sheets:
+        base = (sheet_name or "Sheet1")[:31]
+        title, n = base, 1
+        while title.lower() in used:  # Excel compares sheet titles case-insensitively
+            n += 1
+            suffix = f"~{n}"
+            title = base[: 31 - len(suffix)] + suffix
+        used.add(title.lower())
+        ws = wb.create_sheet(title=title)
+        fieldnames: Optional[List[str]] = None
+        count = 0
+        for page in pages:
+            if fieldnames is None:
+                fieldnames = list(page[0].keys())
+                ws.append(fieldnames)
+            for row in page:
+                ws.append([row.get(k) for k in fieldnames])
+            count += len(page)
+        counts[sheet_name] = counts.get(sheet_name, 0) + count
+    tmp = _temp_path(path)
+    try:
+        wb.save(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return counts
+
+
+def write_xlsx_pages(pages: Iterable[List[Dict[str, Any]]], path: Path, sheet_name: str = "Sheet1") -> int:
+    """Stream pages of rows into a single-sheet XLSX in constant memory; returns the row count."""
+    return sum(write_xlsx_sheets([(sheet_name, pages)], path).values())
+
+
+def load_report_settings(path: Optional[Path | str] = None) -> Dict[str, Any]:
+    """Return the ``[report]`` table of ``config/settings.toml`` (or ``REPORT_SETTINGS_PATH``).
+
+    A missing file gives an empty mapping.
+    """
+    if path is None:
+        path = os.environ.get("REPORT_SETTINGS_PATH") or SETTINGS_PATH
+    p = Path(path)
+    if not p.exists():
+        return {}
+    return dict(tomllib.loads(p.read_text(encoding="utf-8")).get("report", {}))
+
+
+def configured_columns(dataset: str, settings: Dict[str, Any]) -> Optional[List[str]]:
+    """Columns ``[report.columns]`` lists for a dataset (keys match case-insensitively), or None."""
+    by_lower = {str(k).lower(): v for k, v in dict(settings.get("columns", {})).items()}
+    wanted = by_lower.get(dataset.lower())
+    return [str(c) for c in wanted] if wanted else None
+
+
+def project_columns(
+    wanted: Optional[List[str]], available: Optional[List[str]], strict: bool = False
+) -> Optional[List[str]]:
+    """Columns to request from the DB: ``wanted`` restricted to those the table actually has.
+
+    For configured columns, returns None (fetch every column) when nothing is wanted or the table
+    has none of them, so a table that doesn't follow the configured layout still reports in full.
+    With ``strict`` (columns the caller asked for explicitly) every wanted column must exist.
+
+    Raises:
+        ValueError: With ``strict``, naming the wanted columns the table does not have.
+    """
+    if not wanted:
+        return None
+    if available is None:
+        return list(wanted)
+    present = set(available)
+    if strict:
+        unknown = [c for c in wanted if c not in present]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        return list(wanted)
+    return [c for c in wanted if c in present] or None
+
+
+def resolve_tables(datasets: Iterable[str], tables: Iterable[str]) -> Dict[str, str]:
+    """Map configured dataset keys (e.g. ``ib_calls``) to DB table names (``IB_Calls``).
+
+    Matching is case-insensitive; keys without a matching table map to themselves.
+    """
+    by_lower = {t.lower(): t for t in tables}
+    return {d: by_lower.get(d.lower(), d) for d in datasets}
+
+
+def _replay_spool(spool: IO[str]) -> Iterator[List[Dict[str, Any]]]:
+    for line in spool:
+        yield json.loads(line)
+
+
+@contextmanager
+def fetch_parallel(
+    fetch: Callable[[str], Iterable[List[Dict[str, Any]]]], datasets: Sequence[str], max_workers: int = 8
+) -> Iterator[Dict[str, Iterator[List[Dict[str, Any]]]]]:
+    """Drain ``fetch(dataset)`` for every dataset concurrently into per-dataset spool files.
+
+    Each page is written to an anonymous temp file as a JSON line as it arrives (values the DB
+    returns that JSON cannot hold, such as BLOBs, are spooled as text), so memory stays bounded by
+    the page size rather than the whole workbook. Wall time is roughly the slowest fetch rather
+    than the sum. The first error is re-raised.
+
+    Yields:
+        Dict[str, Iterator[List[Dict[str, Any]]]]: Per dataset, an iterator replaying its pages
+        from the spool. The spool files are removed when the context exits.
+    """
+    spools: Dict[str, IO[str]] = {
+        d: tempfile.TemporaryFile("w+", encoding="utf-8", prefix="report-spool-") for d in datasets
+    }
+
+    def drain(d: str) -> None:
+        spool = spools[d]
+        for page in fetch(d):
+            spool.write(json.dumps(page, default=str) + "\n")
+        spool.seek(0)
+
+    try:
+        if datasets:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(datasets))), thread_name_prefix="report-fetch") as pool:
+                futures = [pool.submit(drain, d) for d in datasets]
+                for f in futures:
+                    f.result()
+        yield {d: _replay_spool(spool) for d, spool in spools.items()}
+    finally:
+        for spool in spools.values():
+            spool.close()
+
 
 @dataclass
 class ReportResult:
@@ -58,10 +510,19 @@ class ReportResult:
 
 
 class ReportService:
-    def __init__(self, db_client: ReportDBClient, reports_dir: Path | str = "./reports") -> None:
+    """Render reports into ``reports_dir`` and register each one in the directory's catalog,
+    so ``GET /reports`` lists them like reports rendered through the API."""
+
+    def __init__(
+        self,
+        db_client: ReportDBClient | SQLiteReportDBClient,
+        reports_dir: Path | str = "./reports",
+        catalog: Optional[ReportCatalog] = None,
+    ) -> None:
         self.db = db_client
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = catalog or ReportCatalog(self.reports_dir)
 
     def generate_report(
         self,
@@ -69,21 +530,60 @@ class ReportService:
         start_time: Optional[str],
         end_time: Optional[str],
         format: str = "xlsx",
+        columns: Optional[List[str]] = None,
+        settings: Optional[Dict[str, Any]] = None,
     ) -> ReportResult:
-        rows = self.db.get_rows(dataset, start_time=start_time, end_time=end_time)
-        df = pd.DataFrame(rows)
-        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        base = f"{dataset}_report_{ts}"
+        """Write one dataset's window to CSV or XLSX.
+
+        Only the columns the report shows are fetched: ``columns`` if given (each must exist, or
+        ValueError is raised), otherwise the dataset's ``[report.columns]`` entry (limited to
+        columns the table has).
+        """
+        if format.lower() not in {"csv", "xlsx", "excel"}:
+            raise ValueError(f"Unsupported report format: {format}")
+        if columns:
+            columns = project_columns(columns, self.db.table_columns(dataset), strict=True)
+        else:
+            settings = load_report_settings() if settings is None else settings
+            columns = project_columns(configured_columns(dataset, settings), self.db.table_columns(dataset))
         generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
         if format.lower() == "csv":
-            path = self.reports_dir / f"{base}.csv"
-            df.to_csv(path, index=False)
-            return ReportResult(dataset=dataset, format="csv", path=path, row_count=len(df), generated_at=generated_at)
-        elif format.lower() in {"xlsx", "excel"}:
-            path = self.reports_dir / f"{base}.xlsx"
-            with pd.ExcelWriter(path, engine="openpyxl") as writer:
-                sheet = dataset[:31] or "Sheet1"
-                df.to_excel(writer, sheet_name=sheet, index=False)
-            return ReportResult(dataset=dataset, format="xlsx", path=path, row_count=len(df), generated_at=generated_at)
+            # Stream page by page; memory is bounded by the page size, not the window
+            path = self.reports_dir / report_filename(dataset, "csv")
+            count = write_csv_pages(self.db.iter_pages(dataset, start_time=start_time, end_time=end_time, columns=columns), path)
+            self.catalog.add(path.name, dataset, "csv", count)
+            return ReportResult(dataset=dataset, format="csv", path=path, row_count=count, generated_at=generated_at)
         else:
-            raise ValueError(f"Unsupported report format: {format}")
+            path = self.reports_dir / report_filename(dataset, "xlsx")
+            pages = self.db.iter_pages(dataset, start_time=start_time, end_time=end_time, columns=columns)
+            count = write_xlsx_pages(pages, path, sheet_name=dataset)
+            self.catalog.add(path.name, dataset, "xlsx", count)
+        return ReportResult(dataset=dataset, format="xlsx", path=path, row_count=count, generated_at=generated_at)
+
+    def generate_workbook(
+        self,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        datasets: Optional[Sequence[str]] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> ReportResult:
+        """Write one sheet per dataset into a single workbook, fetching the datasets concurrently.
+
+        Datasets default to the keys of ``[report.columns]`` in the settings, and each sheet is
+        projected to that dataset's configured columns.
+        """
+        settings = load_report_settings() if settings is None else settings
+        names = list(datasets or settings.get("columns", {}).keys())
+        tables = resolve_tables(names, self.db.list_tables())
+
+        def fetch(d: str) -> Iterator[List[Dict[str, Any]]]:
+            columns = project_columns(configured_columns(d, settings), self.db.table_columns(tables[d]))
+            return self.db.iter_pages(tables[d], start_time=start_time, end_time=end_time, columns=columns)
+
+        stem = Path(str(settings.get("workbook_name", "workbook.xlsx"))).stem
+        path = self.reports_dir / report_filename(stem, "xlsx")
+        with fetch_parallel(fetch, names) as pages:
+            counts = write_xlsx_sheets(((d, pages[d]) for d in names), path)
+        self.catalog.add(path.name, stem, "xlsx", sum(counts.values()))
+        generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return ReportResult(dataset=",".join(names), format="xlsx", path=path, row_count=sum(counts.values()), generated_at=generated_at)
@@ -1,13 +1,116 @@
 """
-Scheduler FastAPI adapter (placeholder).
+Scheduler control-plane API (FastAPI).
 
-This module intentionally remains minimal. The scheduler is currently a CLI-driven component
-implemented in `scheduler.py` with a `SyncJob` that interacts with the SharePoint simulator
-and the DB Service API. If/when an HTTP control plane is desired for the scheduler
-(e.g., start/stop/status endpoints), the FastAPI app and routes will live here.
+Exposes the running `scheduler.Scheduler` over HTTP so sync latency and throughput can be
+watched and controlled in production:
 
-Tests reference the CLI and core classes directly; keeping this file present avoids
-import errors in places where `scheduler_api` might be referenced.
+- GET  /status          current state (idle/running/paused) and the last run record
+- POST /trigger         start a sync now (in the background, or synchronously with ?wait=true)
+- POST /pause, /resume  skip/allow scheduled runs (manual triggers always run)
+- GET  /runs?limit=N    last N run records, newest first
+
+Each run record carries run_id, trigger, started_at/finished_at, duration_s, status and the
+SyncJob counters (files_listed, files_downloaded, files_skipped, files_failed,
+bytes_downloaded, download_retries, http_retries).
+
+The scheduler instance is taken from ``app.state.scheduler`` (set it in tests or when
+embedding); otherwise one is built from ``scheduler.load_config()`` on first use.
 """
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, HTTPException, Query, status
+from fastapi.responses import JSONResponse
+
+from scheduler import DBServiceClient, RetryPolicy, Scheduler, SharePointClient, load_config
+
+
+app = FastAPI(title="Scheduler API")
+_init_lock = threading.Lock()
+
+
+def _get_scheduler() -> Scheduler:
+    sched = getattr(app.state, "scheduler", None)  # type: ignore[attr-defined]
+    if sched is None:
+        with _init_lock:
+            sched = getattr(app.state, "scheduler", None)  # type: ignore[attr-defined]
+            if sched is None:  # pragma: no cover - runtime wiring
+                cfg = load_config()
+                policy = RetryPolicy.from_config(cfg)
+                sched = Scheduler(cfg, SharePointClient(cfg, retry_policy=policy), DBServiceClient(retry_policy=policy))
+                app.state.scheduler = sched  # type: ignore[attr-defined]
+    return sched
+
+
+def _run_in_background(sched: Scheduler) -> None:
+    try:
+        sched.execute("api", claimed=True)
+    except Exception:
+        pass  # recorded in the run history and logged by Scheduler.execute
+
+
+@app.get("/health")
+def health() -> Dict[str, str]:
+    return {"status": "ok"}
+
+
+@app.get("/status")
+def get_status() -> Dict[str, Any]:
+    """Current scheduler state.
+
+    Example response:
+        {"state": "idle", "paused": false, "running": false, "current_run": null,
+         "runs_total": 3, "interval_minutes": 60, "last_run": {...}}
+    """
+    return _get_scheduler().status()
+
+
+@app.post("/trigger")
+def trigger(wait: bool = Query(False, description="Run synchronously and return the run record")) -> JSONResponse:
+    """Start a sync run now.
+
+    Returns 202 with the accepted run id, or 200 with the full run record when ``wait=true``.
+    Returns 409 if a run is already in progress.
+    """
+    sched = _get_scheduler()
+    # Claim the run lock here so two concurrent triggers can't both pass the check;
+    # execute() releases it when the run finishes
+    if not sched.try_claim_run():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A sync run is already in progress")
+    if wait:
+        try:
+            record = sched.execute("api", claimed=True)
+        except Exception:
+            record = sched.history[-1]
+        return JSONResponse(status_code=status.HTTP_200_OK, content=record)
+    try:
+        threading.Thread(target=_run_in_background, args=(sched,), name="scheduler-api-run", daemon=True).start()
+    except BaseException:
+        sched.release_claim()  # the run never started
+        raise
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content={"accepted": True})
+
+
+@app.post("/pause")
+def pause() -> Dict[str, Any]:
+    sched = _get_scheduler()
+    sched.pause()
+    return {"paused": sched.paused}
+
+
+@app.post("/resume")
+def resume() -> Dict[str, Any]:
+    sched = _get_scheduler()
+    sched.resume()
+    return {"paused": sched.paused}
+
+
+@app.get("/runs")
+def list_runs(limit: int = Query(20, ge=1, le=1000, description="Number of most recent runs")) -> List[Dict[str, Any]]:
+    """Most recent run records, newest first."""
+    return _get_scheduler().runs(limit)
+
 
-__all__: list[str] = []
+__all__ = ["app"]
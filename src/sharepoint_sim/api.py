@@ -5,12 +5,18 @@ Added endpoints:
 - ``GET /sim/datasets/{name}``: Schema & role info for one dataset.
 - ``POST /sim/generate/all``: Generate all datasets in one call.
 - ``GET /sim/spec``: Return spec addendum markdown (if present) for client introspection.
+- ``POST /sim/download/bulk``: Stream many files as one tar or zip archive.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Response
-from fastapi.responses import PlainTextResponse
+import tarfile
+import zipfile
+from typing import Iterator, Literal
+
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from pathlib import Path
+from pydantic import BaseModel, Field
 from sharepoint_sim.schemas import ROLE_RULES
 from sharepoint_sim.service import GENERATOR_MAP
 
@@ -76,19 +82,29 @@ async def generate_all(rows: int | None = None) -> dict[str, list[dict[str, int
 
 
 @router.get("/files")
-async def files() -> dict[str, list[dict[str, int | str]]]:
-    """List all generated simulator CSV files.
+async def files(since: str | None = None) -> dict[str, object]:
+    """List generated simulator CSV files, optionally only those added since a cursor.
+
+    Args:
+        since (str, optional): Cursor returned by a previous call. When given, only files
+            written after it are listed (delta query). Defaults to None (full listing).
 
     Returns:
-        dict: List of file metadata (filename, size). Example::
+        dict: File metadata (filename, size, mtime, sha256) and the cursor for the next call. Example::
             {
                 "files": [
-                    {"filename": "ACQ__2025-08-18_0200.csv", "size": 1234},
+                    {"filename": "ACQ__2025-08-18_0200.csv", "size": 1234,
+                     "mtime": "2025-08-18T02:00:05+00:00", "sha256": "9f86d0..."},
                     ...
-                ]
+                ],
+                "cursor": "3f2a9c1d7b4e-12"
             }
     """
-    return {"files": _service.list_files()}
+    if since:
+        return _service.list_changes(since)
+    # Capture the cursor before globbing so files written meanwhile show up next time
+    cursor = _service.cursor()
+    return {"files": _service.list_files(), "cursor": cursor}
 
 
 @router.get("/datasets")
@@ -150,22 +166,135 @@ async def spec_addendum() -> str:
     return "Spec addendum not found."
 
 
+class BulkDownloadRequest(BaseModel):
+    filenames: list[str] = Field(..., description="Files to include, in archive order")
+    format: Literal["tar", "zip"] = Field("tar", description="Archive format")
+
+
+_CHUNK = 256 * 1024
+
+
+class _Sink:
+    """Write-only buffer that zipfile can target; drained by the streaming generator."""
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._pos = 0
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        out = b"".join(self._parts)
+        self._parts.clear()
+        return out
+
+
+def _iter_file(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := f.read(_CHUNK):
+            yield chunk
+
+
+def _iter_tar(paths: list[Path]) -> Iterator[bytes]:
+    """Stream a ustar/pax archive: header block, file data, padding, per file."""
+    written = 0
+    for path in paths:
+        st = path.stat()
+        info = tarfile.TarInfo(path.name)
+        info.size = st.st_size
+        info.mtime = int(st.st_mtime)
+        info.mode = 0o644
+        header = info.tobuf(format=tarfile.PAX_FORMAT)
+        yield header
+        for chunk in _iter_file(path):
+            yield chunk
+        pad = -st.st_size % tarfile.BLOCKSIZE
+        yield b"\0" * pad
+        written += len(header) + st.st_size + pad
+    end = 2 * tarfile.BLOCKSIZE
+    end += -(written + end) % tarfile.RECORDSIZE
+    yield b"\0" * end
+
+
+def _iter_zip(paths: list[Path]) -> Iterator[bytes]:
+    sink = _Sink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:  # type: ignore[arg-type]
+        for path in paths:
+            with zf.open(zipfile.ZipInfo.from_file(path, path.name), mode="w") as out:
+                for chunk in _iter_file(path):
+                    out.write(chunk)
+                    yield sink.drain()
+            yield sink.drain()
+    yield sink.drain()
+
+
+@router.post("/download/bulk")
+async def download_bulk(body: BulkDownloadRequest) -> StreamingResponse:
+    """Stream several generated CSV files as a single tar or zip archive.
+
+    One request replaces a ``GET /sim/download/{filename}`` round trip per file. Members are
+    named by bare filename and streamed from disk, so memory use does not grow with the
+    archive size. Duplicate names are sent once.
+
+    Args:
+        body (BulkDownloadRequest): Filenames and archive format. Example::
+            {"filenames": ["ACQ__2025-08-18_0200.csv", "Dials__2025-08-18_0200.csv"], "format": "tar"}
+
+    Returns:
+        StreamingResponse: ``application/x-tar`` or ``application/zip`` body.
+
+    Raises:
+        HTTPException: If any requested file is not found (404, detail lists them).
+    """
+    available = {f.name: f.path for f in _service.storage.list_files()}
+    names = list(dict.fromkeys(body.filenames))
+    missing = [n for n in names if n not in available]
+    if missing:
+        raise HTTPException(status_code=404, detail={"missing": missing})
+    paths = [Path(available[n]) for n in names]
+    if body.format == "zip":
+        return StreamingResponse(
+            _iter_zip(paths), media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="sim_files.zip"'},
+        )
+    return StreamingResponse(
+        _iter_tar(paths), media_type="application/x-tar",
+        headers={"Content-Disposition": 'attachment; filename="sim_files.tar"'},
+    )
+
+
 @router.get("/download/{filename}")
-async def download(filename: str) -> Response:
+async def download(filename: str, if_none_match: str | None = Header(None)) -> Response:
     """Download a generated CSV file by filename.
 
+    The strong ETag is the quoted SHA-256 of the content (as published by ``/sim/files``).
+
     Args:
         filename (str): Name of the file to download.
+        if_none_match (str, optional): ``If-None-Match`` header; a matching ETag yields 304.
 
     Returns:
-        Response: CSV file contents with text/csv media type.
+        Response: Raw CSV bytes streamed from disk with text/csv media type, or an empty
+        304 response when the client already holds this content.
 
     Raises:
         HTTPException: If file is not found (404).
     """
     for f in _service.storage.list_files():
         if f.name == filename:
-            return Response(f.path.read_text(), media_type="text/csv")
+            etag = f'"{_service.storage.describe(f.path).sha256}"'
+            if if_none_match and etag in {t.strip() for t in if_none_match.split(",")}:
+                return Response(status_code=304, headers={"ETag": etag})
+            return FileResponse(f.path, media_type="text/csv", headers={"ETag": etag})
     raise HTTPException(status_code=404, detail="File not found")
 
 
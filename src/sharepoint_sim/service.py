@@ -1,6 +1,7 @@
 """Orchestrator service combining generators, storage, naming, and config."""
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
 from threading import Lock
 
@@ -18,7 +19,7 @@ from sharepoint_sim.datasets.resc import RESCGenerator
 from sharepoint_sim.file_naming import dataset_filename
 from sharepoint_sim.random_provider import RandomProvider
 from sharepoint_sim.roster import Roster
-from sharepoint_sim.storage import Storage
+from sharepoint_sim.storage import FileEntry, Storage
 
 GENERATOR_MAP = {
     "ACQ": ACQGenerator,
@@ -100,10 +101,27 @@ class SharePointCSVGenerator:
         return outputs
 
     def list_files(self) -> list[dict[str, int | str]]:
-        """Return metadata for generated CSV files."""
-        return [
-            {"filename": f.name, "size": f.size()} for f in self.storage.list_files()
-        ]
+        """Return metadata (filename, size, mtime, sha256) for generated CSV files."""
+        return [_file_meta(self.storage.describe(f.path)) for f in self.storage.list_files()]
+
+    def cursor(self) -> str:
+        """Return an opaque listing cursor for the current end of the change index."""
+        return f"{self.storage.epoch}-{self.storage.last_seq}"
+
+    def list_changes(self, since: str | None) -> dict[str, object]:
+        """Return files added since a cursor plus the cursor to use next time.
+
+        Unknown, malformed, or foreign-epoch cursors fall back to every indexed file,
+        so a restarted simulator never causes a client to miss files.
+        """
+        cursor = self.cursor()
+        seq = 0
+        if since:
+            epoch, _, raw = since.rpartition("-")
+            if epoch == self.storage.epoch and raw.isdigit():
+                seq = int(raw)
+        files = [_file_meta(e) for e in self.storage.changes_since(seq)]
+        return {"files": files, "cursor": cursor}
 
     def reset(self) -> None:
         """Delete all generated CSVs and clear cached roster."""
@@ -111,4 +129,10 @@ class SharePointCSVGenerator:
             self.storage.reset()
             self._roster = None
 
+
+def _file_meta(entry: FileEntry) -> dict[str, int | str]:
+    """Serialize an index entry for listing responses."""
+    mtime = datetime.fromtimestamp(entry.mtime_ns / 1e9, tz=UTC).isoformat()
+    return {"filename": entry.name, "size": entry.size, "mtime": mtime, "sha256": entry.sha256}
+
 __all__ = ["SharePointCSVGenerator"]
@@ -1,9 +1,23 @@
-"""Simple filesystem storage for generated CSV files."""
+"""Simple filesystem storage for generated CSV files.
+
+Besides the directory itself, storage keeps an append-only in-memory index of
+written files keyed by a monotonic sequence number. ``changes_since`` answers
+incremental listing queries in O(delta) without globbing or stat-ing the
+directory. The index is seeded from a one-off scan at start-up; files dropped
+into the directory by other processes afterwards only appear in full listings.
+
+Each entry carries size, mtime and a SHA-256 content hash (computed while the
+file is written) so clients can skip transfers of content they already hold.
+"""
 from __future__ import annotations
 
+import bisect
+import hashlib
+import uuid
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 
 
 @dataclass(slots=True)
@@ -22,6 +36,26 @@ class StoredFile:
         return self.path.stat().st_size
 
 
+@dataclass(slots=True, frozen=True)
+class FileEntry:
+    """Index record for a written file."""
+
+    seq: int
+    name: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 hex digest of a file in bounded memory."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 class Storage:
     """Filesystem storage operations for simulator output CSVs."""
 
@@ -29,16 +63,70 @@ class Storage:
         """Create storage ensuring root directory exists."""
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
+        # Identifies this index instance; cursors from another epoch are not comparable
+        self.epoch = uuid.uuid4().hex[:12]
+        self._index_lock = Lock()
+        self._seq = 0
+        self._entries: list[FileEntry] = []
+        self._latest: dict[str, FileEntry] = {}
+        self._external: dict[str, FileEntry] = {}
+        paths = sorted(self.root.glob("*.csv"), key=lambda p: (p.stat().st_mtime_ns, p.name))
+        for p in paths:
+            self._record(p)
+
+    def _record(self, path: Path, sha256: str | None = None) -> FileEntry:
+        """Append a file to the change index (re-writes get a new sequence)."""
+        st = path.stat()
+        digest = sha256 or sha256_file(path)
+        with self._index_lock:
+            self._seq += 1
+            entry = FileEntry(self._seq, path.name, st.st_size, st.st_mtime_ns, digest)
+            self._entries.append(entry)
+            self._latest[path.name] = entry
+            return entry
+
+    def describe(self, path: Path) -> FileEntry:
+        """Return size/mtime/hash metadata for a stored file, reusing indexed hashes.
+
+        Files not written through this storage (or modified since) are hashed once and
+        cached until their size or mtime changes.
+        """
+        st = path.stat()
+        with self._index_lock:
+            known = self._latest.get(path.name) or self._external.get(path.name)
+        if known is not None and known.size == st.st_size and known.mtime_ns == st.st_mtime_ns:
+            return known
+        entry = FileEntry(0, path.name, st.st_size, st.st_mtime_ns, sha256_file(path))
+        with self._index_lock:
+            self._external[path.name] = entry
+        return entry
+
+    @property
+    def last_seq(self) -> int:
+        """Highest sequence number handed out so far."""
+        return self._seq
+
+    def changes_since(self, seq: int) -> list[FileEntry]:
+        """Return current index entries written after ``seq`` (oldest first)."""
+        with self._index_lock:
+            start = bisect.bisect_right(self._entries, seq, key=lambda e: e.seq)
+            return [e for e in self._entries[start:] if self._latest.get(e.name) is e]
 
     def write_csv(
         self, name: str, header: list[str], rows: Iterable[dict[str, str]]
     ) -> Path:
         """Write a CSV file with the given header and row dictionaries."""
         path = self.root / name
+        digest = hashlib.sha256()
         with path.open("w", encoding="utf-8", newline="") as f:
-            f.write(",".join(header) + "\n")
+            line = ",".join(header) + "\n"
+            f.write(line)
+            digest.update(line.encode("utf-8"))
             for r in rows:
-                f.write(",".join(r[h] for h in header) + "\n")
+                line = ",".join(r[h] for h in header) + "\n"
+                f.write(line)
+                digest.update(line.encode("utf-8"))
+        self._record(path, sha256=digest.hexdigest())
         return path
 
     def list_files(self) -> list[StoredFile]:
@@ -49,5 +137,10 @@ class Storage:
         """Remove all CSV files in storage root."""
         for p in self.root.glob("*.csv"):
             p.unlink()
+        # Keep the sequence monotonic so outstanding cursors only see newer files
+        with self._index_lock:
+            self._entries.clear()
+            self._latest.clear()
+            self._external.clear()
 
-__all__ = ["Storage", "StoredFile"]
+__all__ = ["FileEntry", "Storage", "StoredFile", "sha256_file"]
@@ -0,0 +1,44 @@
+"""Tests for per-stage ingest metrics recorded by FileConsumer and DBClient."""
+import logging
+from pathlib import Path
+
+import pytest
+
+from consumer.file_watcher import FileConsumer
+from consumer.metrics import ConsumerMetrics
+from db_service import DBClient
+
+
+def test_stage_timings_counters_and_snapshot(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a consumer run records every stage and writes a Prometheus snapshot.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest.
+        caplog (pytest.LogCaptureFixture): Log capture fixture.
+    """
+    input_dir = tmp_path / "input"
+    archive_dir = tmp_path / "archive"
+    input_dir.mkdir()
+    archive_dir.mkdir()
+    (input_dir / "metrics_test__2025-08-22_0100.csv").write_text("a,b\n1,2\n3,4\n")
+    metrics = ConsumerMetrics()
+    snapshot_path = tmp_path / "metrics" / "consumer.prom"
+    consumer = FileConsumer(
+        input_dir, archive_dir, DBClient(metrics=metrics), metrics=metrics, metrics_path=snapshot_path
+    )
+
+    with caplog.at_level(logging.INFO):
+        consumer.consume_new_files()
+
+    snap = metrics.snapshot()
+    for stage in ("read", "send", "parse", "ddl", "insert", "log", "archive"):
+        assert snap["stage_calls"][stage] == 1, stage
+    assert snap["counters"]["rows"] == 2
+    assert snap["counters"]["bytes"] == len("a,b\n1,2\n3,4\n")
+    assert snap["counters"]["files_ok"] == 1
+    assert snap["gauges"]["backlog_files"] == 0
+
+    text = snapshot_path.read_text()
+    assert 'consumer_stage_seconds_total{stage="insert"}' in text
+    assert "consumer_rows_total 2" in text
+    assert any("ingest_metrics file=metrics_test__2025-08-22_0100.csv" in r.message for r in caplog.records)
@@ -136,3 +136,33 @@ def test_archive_file_moves_file(tmp_dirs: tuple[Path, Path]) -> None:
     consumer.archive_file(f)
     assert not f.exists()
     assert (archive_dir / "toarchive.csv").exists()
+
+def test_gzip_archive_mode_compresses_in_background(tmp_dirs: tuple[Path, Path]) -> None:
+    """Test that gzip archive mode writes a .csv.gz copy and removes the source.
+
+    Args:
+        tmp_dirs (tuple[Path, Path]): Tuple of input and archive directories as pathlib.Path objects.
+    """
+    import gzip
+
+    input_dir, archive_dir = tmp_dirs
+    f = input_dir / "compress.csv"
+    f.write_text("col1,col2\n1,2\n")
+    db_service = MagicMock()
+    consumer = FileConsumer(input_dir, archive_dir, db_service, archive_mode="gzip", archive_queue_size=1)
+    consumer.consume_new_files()
+    consumer.close()
+    archived = archive_dir / "compress.csv.gz"
+    assert not f.exists()
+    assert not (archive_dir / "compress.csv").exists()
+    assert gzip.decompress(archived.read_bytes()) == b"col1,col2\n1,2\n"
+
+def test_archive_mode_rejects_unknown(tmp_dirs: tuple[Path, Path]) -> None:
+    """Test that an unknown archive mode is rejected at construction.
+
+    Args:
+        tmp_dirs (tuple[Path, Path]): Tuple of input and archive directories as pathlib.Path objects.
+    """
+    input_dir, archive_dir = tmp_dirs
+    with pytest.raises(ValueError):
+        FileConsumer(input_dir, archive_dir, MagicMock(), archive_mode="bz2")
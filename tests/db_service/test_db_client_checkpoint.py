@@ -0,0 +1,85 @@
+"""Tests for resumable DBClient ingestion using row-offset checkpoints."""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from db_service import DBClient
+from db_service_core import DBService
+
+
+class FailingOnceService(DBService):
+    """DBService whose N-th batch insert fails once, simulating a crash mid-file."""
+
+    def __init__(self, fail_on_batch: int) -> None:
+        super().__init__()
+        self.fail_on_batch = fail_on_batch
+        self.batches = 0
+        self.failed = False
+
+    def insert_rows(self, table_name: str, rows: List[Dict[str, Any]], checkpoint: Optional[Dict[str, Any]] = None) -> int:
+        self.batches += 1
+        if not self.failed and self.batches == self.fail_on_batch:
+            self.failed = True
+            raise RuntimeError("connection lost")
+        return super().insert_rows(table_name, rows, checkpoint=checkpoint)
+
+
+def test_retry_resumes_from_last_committed_batch() -> None:
+    data = "id,value\n" + "".join(f"{i},v{i}\n" for i in range(10))
+    filename = "ckpt_test__2025-08-22_0100.csv"
+    service = FailingOnceService(fail_on_batch=3)
+    client = DBClient(service=service, batch_size=3)
+    service.clear_checkpoint(filename)
+
+    with pytest.raises(RuntimeError):
+        client.send_to_db(data, table_name="ckpt_test", original_filename=filename)
+    assert service.get_checkpoint(filename, _sha(data), "ckpt_test") == 6
+
+    result = client.send_to_db(data, table_name="ckpt_test", original_filename=filename)
+
+    assert result == {"table": "ckpt_test", "row_count": 10, "resumed_from": 6}
+    rows = service.get_rows("ckpt_test", None, None, "id", ["id"])
+    assert [r["id"] for r in rows] == [str(i) for i in range(10)]
+    assert service.get_checkpoint(filename, _sha(data), "ckpt_test") == 0
+    assert filename in service.get_ingested_filenames(None, None)
+
+
+def test_changed_content_restarts_from_scratch() -> None:
+    filename = "ckpt_change__2025-08-22_0100.csv"
+    service = FailingOnceService(fail_on_batch=2)
+    client = DBClient(service=service, batch_size=1)
+    service.clear_checkpoint(filename)
+
+    with pytest.raises(RuntimeError):
+        client.send_to_db("a\n1\n2\n", table_name="ckpt_change", original_filename=filename)
+    result = client.send_to_db("a\n9\n8\n", table_name="ckpt_change", original_filename=filename)
+
+    assert result["resumed_from"] == 0
+    assert [r["a"] for r in service.get_rows("ckpt_change", None, None, "a", None)] == ["9", "8"]
+
+
+def test_checkpoint_dropped_when_table_is_recreated_by_another_file() -> None:
+    data_a = "id,value\n" + "".join(f"{i},a{i}\n" for i in range(6))
+    file_a = "ckpt_drop__2025-08-22_0100.csv"
+    file_b = "ckpt_drop__2025-08-22_0200.csv"
+    service = FailingOnceService(fail_on_batch=2)
+    client = DBClient(service=service, batch_size=3)
+    service.clear_checkpoint(file_a)
+
+    with pytest.raises(RuntimeError):
+        client.send_to_db(data_a, table_name="ckpt_drop", original_filename=file_a)
+    assert service.get_checkpoint(file_a, _sha(data_a), "ckpt_drop") == 3
+    client.send_to_db("id,value\n100,b\n", table_name="ckpt_drop", original_filename=file_b)
+
+    assert service.get_checkpoint(file_a, _sha(data_a), "ckpt_drop") == 0
+    result = client.send_to_db(data_a, table_name="ckpt_drop", original_filename=file_a)
+    assert result["resumed_from"] == 0
+    assert [r["value"] for r in service.get_rows("ckpt_drop", None, None, "id", ["value"])] == [f"a{i}" for i in range(6)]
+
+
+def _sha(data: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
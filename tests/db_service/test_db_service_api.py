@@ -240,3 +240,80 @@ def test_update_row_invalid(test_client: TestClient):
     test_client.post("/tables/upinv_table/rows", json={"row": {"id": 1, "val": "foo"}})
     response = test_client.put("/tables/upinv_table/rows/1", json=None)
     assert response.status_code == 422
+
+def test_get_rows_page_keyset(test_client: TestClient):
+    """
+    Test GET /tables/{table_name}/rows/page walks the table in pages via next_after.
+
+    Args:
+        test_client (TestClient): FastAPI test client fixture.
+    """
+    test_client.delete("/tables/page_table")
+    test_client.post("/tables", json={"table_name": "page_table", "schema": {"timestamp": "TEXT", "val": "TEXT"}})
+    for i in range(5):
+        test_client.post("/tables/page_table/rows", json={"row": {"timestamp": f"2025-08-22T0{i}:00:00", "val": str(i)}})
+    seen = []
+    after = None
+    while True:
+        params = {"limit": 2, "columns": "val"}
+        if after is not None:
+            params["after"] = after
+        page = test_client.get("/tables/page_table/rows/page", params=params).json()
+        seen += [r["val"] for r in page["rows"]]
+        after = page["next_after"]
+        if after is None:
+            break
+    assert seen == ["0", "1", "2", "3", "4"]
+    assert test_client.get("/tables/missing_page_table/rows/page").status_code == 404
+
+def test_table_generation_changes_on_write(test_client: TestClient):
+    """
+    Test GET /tables/{table_name}/generation increases with every write to the table.
+
+    Args:
+        test_client (TestClient): FastAPI test client fixture.
+    """
+    test_client.post("/tables", json={"table_name": "gen_table", "schema": {"id": "INTEGER PRIMARY KEY", "val": "TEXT"}})
+    start = test_client.get("/tables/gen_table/generation").json()["generation"]
+    test_client.post("/tables/gen_table/rows", json={"row": {"id": 1, "val": "foo"}})
+    after_insert = test_client.get("/tables/gen_table/generation").json()["generation"]
+    test_client.put("/tables/gen_table/rows/1", json={"id": 1, "val": "bar"})
+    after_update = test_client.get("/tables/gen_table/generation").json()["generation"]
+    assert start < after_insert < after_update
+    assert test_client.get("/tables/never_written_table/generation").json() == {"table": "never_written_table", "generation": 0}
+
+
+def test_ingestion_log_is_prepared_once(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test the ingestion log is reflected and indexed on first use only.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    from db_service_core import DBService
+
+    service = DBService()
+    log = service._ensure_ingestion_log()
+    reflects = []
+    monkeypatch.setattr(service.metadata, "reflect", lambda **kw: reflects.append(kw))
+    assert service._ensure_ingestion_log() is log
+    assert service.get_missing_filenames(["never_logged__2025-08-22_0100.csv"]) == ["never_logged__2025-08-22_0100.csv"]
+    assert reflects == []
+
+
+def test_ingest_checkpoint_is_prepared_once(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test the ingest checkpoint table is reflected on first use only.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    from db_service_core import DBService
+
+    service = DBService()
+    ckpt = service._ensure_ingest_checkpoint()
+    reflects = []
+    monkeypatch.setattr(service.metadata, "reflect", lambda **kw: reflects.append(kw))
+    assert service._ensure_ingest_checkpoint() is ckpt
+    assert service.get_checkpoint("never_checkpointed.csv", "0" * 64, "ckpt_once_table") == 0
+    assert reflects == []
@@ -0,0 +1,98 @@
+"""Tests for HTTPDBClient uploading CSV data to the DB API /ingest endpoint."""
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from consumer.file_watcher import FileConsumer
+from db_service import DBClient
+from db_service_api import app as db_app
+from db_service_http import HTTPDBClient
+
+
+def test_send_to_db_uploads_gzip_and_logs_ingestion() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/http_ingest_test")
+    http_db = HTTPDBClient(api_url="", session=client)
+    filename = f"http_ingest_test__{uuid.uuid4().hex[:8]}.csv"  # the ingestion log outlives the table
+
+    result = http_db.send_to_db(
+        "timestamp,value\n2025-08-22T00:00:00,a\n2025-08-22T01:00:00,b\n",
+        table_name="http_ingest_test",
+        original_filename=filename,
+    )
+
+    assert result == {"table": "http_ingest_test", "row_count": 2}
+    rows = client.get("/tables/http_ingest_test/rows").json()
+    assert [r["value"] for r in rows] == ["a", "b"]
+    logged = client.get("/tables/ingestion_log/rows", params={"columns": "filename"}).json()
+    assert {"filename": filename} in logged
+
+
+def test_resending_a_file_replaces_the_table() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/http_resend_test")
+    http_db = HTTPDBClient(api_url="", session=client)
+    filename = f"http_resend_test__{uuid.uuid4().hex[:8]}.csv"
+    data = "timestamp,value\n2025-08-22T00:00:00,a\n"
+
+    first = http_db.send_to_db(data, table_name="http_resend_test", original_filename=filename)
+    again = http_db.send_to_db(data, table_name="http_resend_test", original_filename=filename)
+
+    assert first == again == {"table": "http_resend_test", "row_count": 1}
+    assert len(client.get("/tables/http_resend_test/rows").json()) == 1
+
+
+def test_http_client_matches_in_process_client_table_semantics() -> None:
+    client = TestClient(db_app)
+    http_db = HTTPDBClient(api_url="", session=client, compress=False)
+    run = uuid.uuid4().hex[:8]
+    tables = {}
+    for label, db in (("local", DBClient()), ("http", http_db)):
+        table = f"semantics_{label}"
+        client.delete(f"/tables/{table}")
+        db.send_to_db("a,b\n1,2\n3,4\n", table_name=table, original_filename=f"{table}_1__{run}.csv")
+        db.send_to_db("a,b\n5,6\n", table_name=table, original_filename=f"{table}_2__{run}.csv")
+        tables[label] = client.get(f"/tables/{table}/rows", params={"columns": "a,b"}).json()
+
+    # Each file replaces the table's contents rather than appending to it
+    assert tables["http"] == tables["local"] == [{"a": "5", "b": "6"}]
+
+
+def test_plain_ingest_appends_and_skips_known_files() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/ingest_append_test")
+    run = uuid.uuid4().hex[:8]
+    csv_file = ("upload.csv", b"a,b\n1,2\n", "text/csv")
+
+    params = {"dataset": "ingest_append_test", "filename": f"first__{run}.csv"}
+    assert client.post("/ingest", params=params, files={"file": csv_file}).json()["row_count"] == 1
+    again = client.post("/ingest", params=params, files={"file": csv_file}).json()
+    assert again["skipped"] is True and again["row_count"] == 0
+    params["filename"] = f"second__{run}.csv"
+    assert client.post("/ingest", params=params, files={"file": csv_file}).json()["row_count"] == 1
+
+    assert len(client.get("/tables/ingest_append_test/rows").json()) == 2
+
+
+def test_file_consumer_with_http_client_and_workers(tmp_path: Path) -> None:
+    client = TestClient(db_app)
+    ingest_dir = tmp_path / "ingest"
+    archive_dir = tmp_path / "archive"
+    ingest_dir.mkdir()
+    archive_dir.mkdir()
+    run = uuid.uuid4().hex[:8]
+    names = [f"http_consumer_{i}__{run}.csv" for i in range(3)]
+    for name in names:
+        client.delete(f"/tables/{name.split('__')[0]}")
+        (ingest_dir / name).write_text("a,b\n1,2\n")
+
+    http_db = HTTPDBClient(api_url="", session=client, max_concurrency=3, compress=False)
+    consumer = FileConsumer(ingest_dir, archive_dir, http_db, max_workers=3)
+    consumer.consume_new_files()
+
+    for name in names:
+        assert (archive_dir / name).exists()
+        assert client.get(f"/tables/{name.split('__')[0]}/rows").json() == [{"a": "1", "b": "2"}]
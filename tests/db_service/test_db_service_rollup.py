@@ -0,0 +1,104 @@
+"""Tests for hourly rollup tables maintained on ingest (GET /rollups/hourly)."""
+from __future__ import annotations
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+from db_service_api import app as db_app
+from db_service_core import _rollup_hour
+
+CSV_1 = (
+    "Interval Start,Agent Id,Agent Name,Handle,Avg Handle,Media Type\n"
+    "2025-08-22T09:00:00+00:00,7,Ada,3,120,voice\n"
+    "2025-08-22T09:30:00+00:00,7,Ada,2,60,voice\n"
+    "2025-08-22T09:15:00+00:00,8,Bob,5,,voice\n"
+    "2025-08-22T10:00:00+00:00,7,Ada,1,30,voice\n"
+)
+CSV_2 = "Interval Start,Agent Id,Agent Name,Handle,Avg Handle,Media Type\n2025-08-22T09:45:00+00:00,7,Ada,4,10,voice\n"
+
+
+def _ingest(client: TestClient, text: str, filename: str) -> None:
+    filename = filename.replace(".csv", f"_{uuid.uuid4().hex[:8]}.csv")  # /ingest skips logged files
+    resp = client.post(
+        "/ingest",
+        params={"dataset": "Rollup_IB", "filename": filename},
+        files={"file": (filename, text.encode(), "text/csv")},
+    )
+    assert resp.status_code == 200, resp.text
+
+
+def test_rollup_hour_truncation() -> None:
+    assert _rollup_hour("2025-08-22T09:59:59+00:00") == "2025-08-22T09:00:00"
+    assert _rollup_hour("2025-08-22 23:01:00") == "2025-08-22T23:00:00"
+    assert _rollup_hour("2025-08-22") == "2025-08-22T00:00:00"  # date-only values bucket at the day
+    assert _rollup_hour("22/08/2025") is None
+
+
+def test_ingest_maintains_hourly_rollup() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/Rollup_IB")
+    _ingest(client, CSV_1, "Rollup_IB__2025-08-22_1000.csv")
+    _ingest(client, CSV_2, "Rollup_IB__2025-08-22_1001.csv")
+
+    groups = client.get("/rollups/hourly", params={"dataset": "Rollup_IB"}).json()["rollups"]
+    by_key = {(g["hour"], g["agent"]): g for g in groups}
+
+    assert set(by_key) == {("2025-08-22T09:00:00", "Ada"), ("2025-08-22T09:00:00", "Bob"), ("2025-08-22T10:00:00", "Ada")}
+    ada9 = by_key[("2025-08-22T09:00:00", "Ada")]
+    assert ada9["rows"] == 3
+    assert ada9["metrics"] == {"Handle": 9.0, "Avg Handle": 190.0 / 3}  # Avg columns are averaged, not summed
+    assert ada9["samples"] == {"Handle": 3, "Avg Handle": 3}
+    assert by_key[("2025-08-22T09:00:00", "Bob")]["metrics"] == {"Handle": 5.0}
+
+    window = client.get(
+        "/rollups/hourly", params={"dataset": "Rollup_IB", "start_hour": "2025-08-22T10:00:00", "agent": "Ada"}
+    ).json()["rollups"]
+    assert [(g["hour"], g["rows"]) for g in window] == [("2025-08-22T10:00:00", 1)]
+
+
+def test_rebuild_matches_and_drop_clears_rollup() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/Rollup_IB")
+    _ingest(client, CSV_1, "Rollup_IB__2025-08-22_1100.csv")
+    before = client.get("/rollups/hourly", params={"dataset": "Rollup_IB"}).json()["rollups"]
+
+    rebuilt = client.post("/rollups/hourly/rebuild", params={"dataset": "Rollup_IB"}).json()
+    assert rebuilt == {"dataset": "Rollup_IB", "rows_scanned": 4}
+    assert client.get("/rollups/hourly", params={"dataset": "Rollup_IB"}).json()["rollups"] == before
+
+    client.delete("/tables/Rollup_IB")
+    assert client.get("/rollups/hourly", params={"dataset": "Rollup_IB"}).json()["rollups"] == []
+
+
+def test_update_and_delete_row_keep_rollup_current() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/Rollup_IB")
+    _ingest(client, CSV_1, "Rollup_IB__2025-08-22_1200.csv")
+
+    # Rows have no primary key, so row ids are SQLite rowids in ingest order
+    moved = client.put("/tables/Rollup_IB/rows/4", json={"Interval Start": "2025-08-22T09:05:00+00:00", "Handle": "6"})
+    assert moved.status_code == 200, moved.text
+    assert client.delete("/tables/Rollup_IB/rows/3").status_code == 200
+    maintained = client.get("/rollups/hourly", params={"dataset": "Rollup_IB"}).json()["rollups"]
+
+    assert [(g["hour"], g["agent"], g["rows"]) for g in maintained] == [("2025-08-22T09:00:00", "Ada", 3)]
+    assert maintained[0]["metrics"]["Handle"] == 11.0
+    client.post("/rollups/hourly/rebuild", params={"dataset": "Rollup_IB"})
+    assert client.get("/rollups/hourly", params={"dataset": "Rollup_IB"}).json()["rollups"] == maintained
+
+
+def test_date_only_dataset_rolls_up_per_day() -> None:
+    client = TestClient(db_app)
+    client.delete("/tables/Rollup_Campaign")
+    text = "Date,Initial Direction,First Queue\n2025-08-22,inbound,q1\n2025-08-22,outbound,q1\n"
+    filename = f"Rollup_Campaign__{uuid.uuid4().hex[:8]}.csv"
+    resp = client.post(
+        "/ingest",
+        params={"dataset": "Rollup_Campaign", "filename": filename},
+        files={"file": (filename, text.encode(), "text/csv")},
+    )
+    assert resp.status_code == 200, resp.text
+
+    groups = client.get("/rollups/hourly", params={"dataset": "Rollup_Campaign"}).json()["rollups"]
+    assert [(g["hour"], g["rows"]) for g in groups] == [("2025-08-22T00:00:00", 2)]
@@ -1,11 +1,12 @@
 """End-to-end: Scheduler downloads via sim REST, Consumer ingests to DB."""
 from pathlib import Path
+from typing import Any, List, Optional
 from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
 from sharepoint_sim.server import app
 from scheduler import SyncJob, SharePointClient, DBServiceClient
-from consumer.file_watcher import FileConsumer
+from consumer.file_watcher import ConsumerPipeline, FileConsumer
 from db_service import DBClient
 
 
@@ -23,7 +24,7 @@ def test_e2e_scheduler_to_consumer_to_db(tmp_path: Path) -> None:
     cfg = {"sharepoint_folder": "/Shared Documents/Reports", "ingestion_dir": str(ingest_dir)}
     sp = SharePointClient(session=client, base_url="")
     db = DBServiceClient()
-    db.get_ingested_files = MagicMock(return_value=[])  # type: ignore
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
 
     # Run scheduler sync job
     job = SyncJob(cfg, sp, db)
@@ -42,3 +43,63 @@ def test_e2e_scheduler_to_consumer_to_db(tmp_path: Path) -> None:
     assert not (ingest_dir / f2_name).exists()
     assert (archive_dir / f1_name).exists()
     assert (archive_dir / f2_name).exists()
+
+
+def test_pipeline_mode_ingests_during_sync(tmp_path: Path) -> None:
+    client = TestClient(app)
+    client.post("/sim/reset")
+    resp = client.post("/sim/generate", params={"types": "ACQ,Productivity", "rows": 3})
+    names = [item["filename"] for item in resp.json()["files"]]
+
+    ingest_dir = tmp_path / "ingest"
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    db = DBServiceClient()
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+    rows_by_file: dict[str, int] = {}
+
+    class RecordingDB:
+        def send_to_db(self, data: str, table_name: Optional[str] = None, original_filename: Optional[str] = None) -> Any:
+            rows_by_file[str(original_filename)] = len(data.strip().splitlines()) - 1
+            return {"table": table_name, "row_count": rows_by_file[str(original_filename)]}
+
+    consumer = FileConsumer(ingest_dir, archive_dir, RecordingDB())
+    pipeline = ConsumerPipeline(consumer, queue_size=1)
+    cfg = {"ingestion_dir": str(ingest_dir), "max_concurrent_downloads": 2}
+    downloaded = SyncJob(cfg, SharePointClient(session=client, base_url=""), db, pipeline=pipeline).run()
+    pipeline.close()
+
+    assert set(downloaded) == set(names)
+    assert set(rows_by_file) == set(names) and all(n > 0 for n in rows_by_file.values())
+    for name in names:
+        assert (archive_dir / name).exists()
+        assert not (ingest_dir / name).exists()
+
+
+def test_pipeline_submit_blocks_when_queue_full(tmp_path: Path) -> None:
+    import threading
+
+    release = threading.Event()
+    seen: List[str] = []
+
+    class SlowDB:
+        def send_to_db(self, data: str, table_name: Optional[str] = None, original_filename: Optional[str] = None) -> Any:
+            release.wait(5)
+            seen.append(str(original_filename))
+            return {"row_count": 1}
+
+    (tmp_path / "archive").mkdir()
+    consumer = FileConsumer(tmp_path, tmp_path / "archive", SlowDB())
+    pipeline = ConsumerPipeline(consumer, queue_size=1)
+    for i in range(2):  # one in the worker, one queued
+        (tmp_path / f"X{i}__2025-08-21_1200.csv").write_text("a\n1\n")
+        pipeline.submit(tmp_path / f"X{i}__2025-08-21_1200.csv", b"a\n1\n")
+    (tmp_path / "X2__2025-08-21_1200.csv").write_text("a\n1\n")
+    blocked = threading.Thread(target=pipeline.submit, args=(tmp_path / "X2__2025-08-21_1200.csv",))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()  # backpressure: third submit waits for room
+    release.set()
+    blocked.join(5)
+    pipeline.close()
+    assert sorted(seen) == [f"X{i}__2025-08-21_1200.csv" for i in range(3)]
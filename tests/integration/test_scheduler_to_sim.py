@@ -26,7 +26,7 @@ def test_scheduler_downloads_new_files(tmp_path: Path) -> None:
     db = DBServiceClient()
 
     # Mock DB to pretend one file already ingested
-    db.get_ingested_files = MagicMock(return_value=[acq_name])  # type: ignore
+    db.get_missing_files = MagicMock(side_effect=lambda names: [n for n in names if n != acq_name])  # type: ignore
 
     job = SyncJob(cfg, sp, db)
     downloaded = job.run()
@@ -34,3 +34,96 @@ def test_scheduler_downloads_new_files(tmp_path: Path) -> None:
     assert prod_name in downloaded
     assert acq_name not in downloaded
     assert (ingest_dir / prod_name).exists()
+
+
+def test_sharepoint_client_persists_cursor_between_syncs(tmp_path: Path) -> None:
+    client = TestClient(app)
+    client.post("/sim/reset")
+    client.post("/sim/generate", params={"types": "ACQ", "rows": 2})
+    cursor_path = tmp_path / "state" / "cursor"
+    cfg: Dict[str, Any] = {"ingestion_dir": str(tmp_path / "ingest"), "list_cursor_path": str(cursor_path)}
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    first = SyncJob(cfg, SharePointClient(cfg, session=client, base_url=""), db).run()
+    assert len(first) == 1
+    assert cursor_path.read_text()
+
+    # A fresh client (e.g. after restart) resumes from the persisted cursor
+    client.post("/sim/generate", params={"types": "Dials", "rows": 2})
+    second = SyncJob(cfg, SharePointClient(cfg, session=client, base_url=""), db).run()
+    assert [n.split("__")[0] for n in second] == ["Dials"]
+
+
+def test_download_file_streams_raw_bytes_atomically(tmp_path: Path) -> None:
+    client = TestClient(app)
+    client.post("/sim/reset")
+    name = client.post("/sim/generate", params={"types": "ACQ", "rows": 50}).json()["files"][0]["filename"]
+    sp = SharePointClient({"download_chunk_bytes": 256}, session=client, base_url="")
+
+    dest = sp.download_file("", name, tmp_path / "ingest" / name)
+
+    assert dest.read_bytes() == client.get(f"/sim/download/{name}").content
+    assert [p.name for p in dest.parent.iterdir()] == [name]
+
+
+def test_conditional_download_and_local_copy_skip(tmp_path: Path) -> None:
+    import hashlib
+
+    client = TestClient(app)
+    client.post("/sim/reset")
+    client.post("/sim/generate", params={"types": "ACQ", "rows": 5})
+    meta = client.get("/sim/files").json()["files"][0]
+    body = client.get(f"/sim/download/{meta['filename']}")
+    assert meta["sha256"] == hashlib.sha256(body.content).hexdigest()
+    assert meta["size"] == len(body.content) and meta["mtime"]
+    assert body.headers["etag"] == f'"{meta["sha256"]}"'
+    not_modified = client.get(f"/sim/download/{meta['filename']}", headers={"If-None-Match": body.headers["etag"]})
+    assert not_modified.status_code == 304
+
+    # Local copy already matches the published hash: SyncJob must not download it again
+    ingest_dir = tmp_path / "ingest"
+    ingest_dir.mkdir()
+    (ingest_dir / meta["filename"]).write_bytes(body.content)
+    sp = SharePointClient(session=client, base_url="")
+    sp.download_file = MagicMock()  # type: ignore[method-assign]
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    assert SyncJob({"ingestion_dir": str(ingest_dir)}, sp, db).run() == []
+    sp.download_file.assert_not_called()
+
+
+def test_bulk_download_extracts_archive_in_one_request(tmp_path: Path) -> None:
+    client = TestClient(app)
+    client.post("/sim/reset")
+    names = [f["filename"] for f in client.post("/sim/generate", params={"types": "ACQ,Dials,Productivity", "rows": 3}).json()["files"]]
+    ingest_dir = tmp_path / "ingest"
+    cfg: Dict[str, Any] = {"ingestion_dir": str(ingest_dir), "bulk_download": True, "bulk_batch_size": 10}
+    sp = SharePointClient(cfg, session=client, base_url="")
+    sp.download_file = MagicMock()  # type: ignore[method-assign]
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    job = SyncJob(cfg, sp, db)
+    assert sorted(job.run()) == sorted(names)
+    sp.download_file.assert_not_called()
+    for name in names:
+        assert (ingest_dir / name).read_bytes() == client.get(f"/sim/download/{name}").content
+    assert sorted(p.name for p in ingest_dir.iterdir()) == sorted(names)  # no .part leftovers
+    assert job.last_stats["bytes_downloaded"] == sum((ingest_dir / n).stat().st_size for n in names)
+
+
+def test_bulk_download_falls_back_to_single_files(tmp_path: Path) -> None:
+    client = TestClient(app)
+    client.post("/sim/reset")
+    names = [f["filename"] for f in client.post("/sim/generate", params={"types": "ACQ,Dials", "rows": 3}).json()["files"]]
+    ingest_dir = tmp_path / "ingest"
+    cfg: Dict[str, Any] = {"ingestion_dir": str(ingest_dir), "bulk_download": True}
+    sp = SharePointClient(cfg, session=client, base_url="")
+    sp.download_bulk = MagicMock(return_value=[])  # type: ignore[method-assign]
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    assert sorted(SyncJob(cfg, sp, db).run()) == sorted(names)
+    assert all((ingest_dir / n).exists() for n in names)
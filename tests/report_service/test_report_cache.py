@@ -0,0 +1,153 @@
+"""Tests for the report result cache and its use by POST /reports/generate."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db_service_api import app as db_app
+from report_cache import ReportCache
+from report_service_api import app as report_app
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _artifact(root: Path, name: str, size: int) -> str:
+    (root / name).write_bytes(b"x" * size)
+    return name
+
+
+def test_key_depends_on_every_component() -> None:
+    base = ReportCache.key("ACQ", "s", "e", "csv", ["a"], 1)
+    assert base == ReportCache.key("ACQ", "s", "e", "CSV", ["a"], 1)
+    variants = [
+        ReportCache.key("RESC", "s", "e", "csv", ["a"], 1),
+        ReportCache.key("ACQ", "s2", "e", "csv", ["a"], 1),
+        ReportCache.key("ACQ", "s", "e2", "csv", ["a"], 1),
+        ReportCache.key("ACQ", "s", "e", "xlsx", ["a"], 1),
+        ReportCache.key("ACQ", "s", "e", "csv", ["a", "b"], 1),
+        ReportCache.key("ACQ", "s", "e", "csv", ["a"], 2),
+    ]
+    assert base not in variants
+
+
+def test_lru_eviction_by_size_and_persistence(tmp_path: Path) -> None:
+    clock = _Clock()
+    cache = ReportCache(tmp_path, max_bytes=250, clock=clock)
+    for name in ("a", "b"):
+        cache.put(name, _artifact(tmp_path, f"{name}.csv", 100), {"filename": f"{name}.csv"})
+        clock.now += 1
+    assert cache.get("a") == {"filename": "a.csv"}  # a becomes most recently used
+    clock.now += 1
+
+    evicted = cache.put("c", _artifact(tmp_path, "c.csv", 100), {"filename": "c.csv"})
+
+    assert evicted == ["b.csv"]
+    assert not (tmp_path / "b.csv").exists()
+    reloaded = ReportCache(tmp_path, max_bytes=250, clock=clock)
+    assert len(reloaded) == 2
+    assert reloaded.get("b") is None
+    assert reloaded.get("c") == {"filename": "c.csv"}
+
+
+def test_put_refuses_file_owned_by_another_key(tmp_path: Path) -> None:
+    cache = ReportCache(tmp_path)
+    cache.put("day1", _artifact(tmp_path, "shared.csv", 10), {"filename": "shared.csv"})
+    with pytest.raises(ValueError):
+        cache.put("day2", "shared.csv", {"filename": "shared.csv"})
+    cache.put("day1", "shared.csv", {"filename": "shared.csv", "row_count": 1})  # same key may refresh
+    assert cache.get("day1") == {"filename": "shared.csv", "row_count": 1}
+    assert cache.get("day2") is None
+
+
+def test_same_second_windows_get_distinct_cached_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_client = TestClient(db_app)
+    dataset = "CACHE_COLLIDE"
+    db_client.post("/tables", json={"table_name": dataset, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+    for day in (1, 2):
+        db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": f"2025-08-0{day}T01:00:00", "value": f"d{day}"}})
+    report_app.state.db_session = db_client  # type: ignore[attr-defined]
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    client = TestClient(report_app)
+
+    def body(day: int) -> dict:
+        return {"dataset": dataset, "start_time": f"2025-08-0{day}T00:00:00", "end_time": f"2025-08-0{day}T23:00:00", "format": "csv"}
+
+    day1 = client.post("/reports/generate", json=body(1)).json()
+    day2 = client.post("/reports/generate", json=body(2)).json()
+    again = client.post("/reports/generate", json=body(1)).json()
+
+    assert day1["filename"] != day2["filename"]
+    assert again["cached"] is True and again["filename"] == day1["filename"]
+    assert Path(again["path"]).read_text().splitlines()[1].endswith(",d1")
+
+
+def test_age_eviction_and_missing_artifact(tmp_path: Path) -> None:
+    clock = _Clock()
+    cache = ReportCache(tmp_path, max_age_seconds=60, clock=clock)
+    cache.put("old", _artifact(tmp_path, "old.csv", 10), {})
+    cache.put("gone", _artifact(tmp_path, "gone.csv", 10), {})
+    (tmp_path / "gone.csv").unlink()
+    assert cache.get("gone") is None
+
+    clock.now += 61
+    assert cache.evict() == ["old.csv"]
+    assert len(cache) == 0
+
+
+def test_on_evict_sees_every_dropped_artifact(tmp_path: Path) -> None:
+    clock = _Clock()
+    dropped: List[str] = []
+    cache = ReportCache(tmp_path, max_bytes=150, max_age_seconds=60, clock=clock, on_evict=dropped.append)
+    cache.put("gone", _artifact(tmp_path, "gone.csv", 10), {})
+    (tmp_path / "gone.csv").unlink()
+    assert cache.get("gone") is None
+    cache.put("lru", _artifact(tmp_path, "lru.csv", 100), {})
+    clock.now += 1
+    cache.put("new", _artifact(tmp_path, "new.csv", 100), {})
+    clock.now += 61
+    cache.evict()
+    assert dropped == ["gone.csv", "lru.csv", "new.csv"]
+
+
+def test_generate_returns_cached_artifact_until_table_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_client = TestClient(db_app)
+    dataset = "CACHED_REPORT"
+    db_client.post("/tables", json={"table_name": dataset, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+    db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": "2025-08-22T01:00:00", "value": "a"}})
+
+    page_requests: List[str] = []
+    real_get = db_client.get
+
+    def counting_get(url, **kw):
+        if url.endswith("/rows/page"):
+            page_requests.append(url)
+        return real_get(url, **kw)
+
+    monkeypatch.setattr(db_client, "get", counting_get)
+    report_app.state.db_session = db_client  # type: ignore[attr-defined]
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    client = TestClient(report_app)
+    body = {"dataset": dataset, "start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00", "format": "csv"}
+
+    first = client.post("/reports/generate", json=body).json()
+    second = client.post("/reports/generate", json=body).json()
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["filename"] == first["filename"]
+    assert second["row_count"] == 1
+    assert len(page_requests) == 1
+
+    db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": "2025-08-22T02:00:00", "value": "b"}})
+    third = client.post("/reports/generate", json=body).json()
+    assert third["cached"] is False
+    assert third["row_count"] == 2
+    assert len(page_requests) == 2
@@ -0,0 +1,91 @@
+"""Tests for the indexed report catalog behind GET /reports."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db_service_api import app as db_app
+from report_catalog import ReportCatalog, dataset_from_filename, safe_dataset_name
+from report_service_api import app as report_app
+
+
+def test_dataset_from_filename() -> None:
+    assert dataset_from_filename("IB_Calls_20250822_100000.csv") == "IB_Calls"
+    assert dataset_from_filename("hourly_report_20250822_100000.xlsx") == "hourly_report"
+    assert dataset_from_filename("ACQ_20250822_100000_1a2b3c4d.csv") == "ACQ"
+    assert dataset_from_filename("custom.csv") == "custom"
+
+
+def test_catalog_seeds_from_existing_files_and_paginates(tmp_path: Path) -> None:
+    (tmp_path / "ACQ_20250801_090000.csv").write_text("a\n1\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+    catalog = ReportCatalog(tmp_path)
+    assert [r["filename"] for r in catalog.list()[0]] == ["ACQ_20250801_090000.csv"]
+
+    for i in range(4):
+        name = f"RESC_2025082{i}_090000.csv"
+        (tmp_path / name).write_text("a\n")
+        catalog.add(name, "RESC", "csv", 1, created_at=f"2025-08-2{i}T09:00:00")
+
+    page1, cursor = catalog.list(dataset="RESC", limit=3)
+    page2, last = catalog.list(dataset="RESC", limit=3, before=cursor)
+    assert [r["filename"] for r in page1] == [f"RESC_2025082{i}_090000.csv" for i in (3, 2, 1)]
+    assert [r["filename"] for r in page2] == ["RESC_20250820_090000.csv"] and last is None
+
+    window, _ = catalog.list(start="2025-08-21", end="2025-08-22")
+    assert [r["created_at"] for r in window] == ["2025-08-22T09:00:00", "2025-08-21T09:00:00"]
+    assert catalog.remove("RESC_20250823_090000.csv") is True
+    (tmp_path / "RESC_20250823_090000.csv").unlink()
+    assert ReportCatalog(tmp_path).list(dataset="RESC")[0][0]["filename"] == "RESC_20250822_090000.csv"
+
+
+def test_catalog_reconciles_with_directory_on_open(tmp_path: Path) -> None:
+    catalog = ReportCatalog(tmp_path)
+    for name in ("KEEP_20250822_090000.csv", "GONE_20250822_090000.csv"):
+        (tmp_path / name).write_text("a\n1\n")
+        catalog.add(name, dataset_from_filename(name), "csv", 1)
+    (tmp_path / "GONE_20250822_090000.csv").unlink()
+    (tmp_path / "COPIED_20250822_090000.xlsx").write_bytes(b"xlsx")
+
+    reopened = ReportCatalog(tmp_path)
+    rows = {r["filename"]: r for r in reopened.list()[0]}
+    assert set(rows) == {"KEEP_20250822_090000.csv", "COPIED_20250822_090000.xlsx"}
+    assert rows["KEEP_20250822_090000.csv"]["row_count"] == 1
+    assert rows["COPIED_20250822_090000.xlsx"]["dataset"] == "COPIED"
+    assert all(r["created_at"].endswith("+00:00") for r in rows.values())
+    assert reopened.reconcile() == (0, 0)
+
+
+def test_safe_dataset_name() -> None:
+    assert safe_dataset_name("IB Calls/2025") == "IBCalls2025"
+    assert safe_dataset_name("***") == "dataset"
+    assert safe_dataset_name("", "workbook") == "workbook"
+
+
+def test_api_lists_filters_and_deletes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_client = TestClient(db_app)
+    for table in ("CAT_A", "CAT_B"):
+        db_client.post("/tables", json={"table_name": table, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+        db_client.post(f"/tables/{table}/rows", json={"row": {"timestamp": "2025-08-22T01:00:00", "value": "x"}})
+    monkeypatch.setattr(report_app.state, "db_session", db_client, raising=False)
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    client = TestClient(report_app)
+    window = {"start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00"}
+    made = {t: client.post("/reports/generate", json={"dataset": t, **window}).json() for t in ("CAT_A", "CAT_B")}
+
+    listing = client.get("/reports", params={"limit": 1}).json()
+    assert [r["filename"] for r in listing["reports"]] == [made["CAT_B"]["filename"]]
+    rest = client.get("/reports", params={"limit": 1, "cursor": listing["next_cursor"]}).json()
+    assert [r["filename"] for r in rest["reports"]] == [made["CAT_A"]["filename"]]
+    only_a = client.get("/reports", params={"dataset": "CAT_A"}).json()["reports"]
+    # The filter is normalized the same way as the stored dataset name
+    assert client.get("/reports", params={"dataset": "CAT_A!"}).json()["reports"] == only_a
+    assert only_a[0]["row_count"] == 1 and only_a[0]["format"] == "csv"
+    assert Path(only_a[0]["path"]).exists()
+
+    assert client.delete(f"/reports/{made['CAT_A']['filename']}").status_code == 200
+    assert client.get("/reports", params={"dataset": "CAT_A"}).json()["reports"] == []
+    assert not Path(made["CAT_A"]["path"]).exists()
+    assert client.delete("/reports/missing_20250101_000000.csv").status_code == 404
@@ -0,0 +1,82 @@
+"""Tests for the direct read-only SQLite backend (SQLiteReportDBClient)."""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db_service_api import app as db_app
+from db_service_core import DB_PATH
+from report_service_api import app as report_app
+from report_service_core import SQLiteReportDBClient
+
+
+def _seed(table: str, n: int) -> TestClient:
+    db_client = TestClient(db_app)
+    db_client.post("/tables", json={"table_name": table, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+    for i in range(n):
+        db_client.post(f"/tables/{table}/rows", json={"row": {"timestamp": f"2025-08-22T0{i}:00:00", "value": str(i)}})
+    return db_client
+
+
+def test_direct_client_reads_pages_columns_and_generation() -> None:
+    db_client = _seed("DIRECT_READ", 5)
+    direct = SQLiteReportDBClient(DB_PATH)
+
+    pages = list(direct.iter_pages("DIRECT_READ", "2025-08-22T01:00:00", "2025-08-22T04:00:00", page_size=2))
+    assert [len(p) for p in pages] == [2, 2]
+    assert [r["value"] for p in pages for r in p] == ["1", "2", "3", "4"]
+    chunks = list(direct.iter_columns("DIRECT_READ", columns=["value"], page_size=10))
+    assert chunks == [{"value": ["0", "1", "2", "3", "4"]}]
+    assert list(direct.iter_pages("NO_SUCH_TABLE")) == []
+    assert "DIRECT_READ" in direct.list_tables()
+    api_generation = db_client.get("/tables/DIRECT_READ/generation").json()["generation"]
+    assert direct.get_generation("DIRECT_READ") == api_generation
+
+
+def test_direct_client_is_read_only() -> None:
+    _seed("DIRECT_RO", 1)
+    conn = SQLiteReportDBClient(DB_PATH)._connect()
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute('INSERT INTO "DIRECT_RO" VALUES (\'x\', \'y\')')
+    finally:
+        conn.close()
+
+
+class _NoHTTP:
+    def get(self, url: str, **kwargs: Any) -> Any:
+        raise AssertionError(f"unexpected HTTP call to {url}")
+
+
+def test_report_api_uses_direct_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _seed("DIRECT_API", 3)
+    monkeypatch.setattr(report_app.state, "direct_db", SQLiteReportDBClient(DB_PATH), raising=False)
+    monkeypatch.setattr(report_app.state, "db_session", _NoHTTP(), raising=False)
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    client = TestClient(report_app)
+    body = {"dataset": "DIRECT_API", "start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00", "format": "csv"}
+
+    first = client.post("/reports/generate", json=body).json()
+    second = client.post("/reports/generate", json=body).json()
+
+    assert first["row_count"] == 3 and first["cached"] is False
+    assert second["cached"] is True
+
+
+def test_missing_timestamp_column_is_a_bad_request(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_client = TestClient(db_app)
+    db_client.post("/tables", json={"table_name": "DIRECT_NO_TS", "columns": {"Date": "TEXT", "value": "TEXT"}})
+    direct = SQLiteReportDBClient(DB_PATH)
+    with pytest.raises(ValueError, match="timestamp"):
+        list(direct.iter_pages("DIRECT_NO_TS", "2025-08-22T00:00:00", None))
+    assert list(direct.iter_pages("DIRECT_NO_TS")) == []  # no window, no timestamp needed
+
+    monkeypatch.setattr(report_app.state, "direct_db", direct, raising=False)
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    body = {"dataset": "DIRECT_NO_TS", "start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00"}
+    resp = TestClient(report_app).post("/reports/generate", json=body)
+    assert resp.status_code == 400
@@ -0,0 +1,120 @@
+"""Tests for asynchronous report jobs (POST /reports/jobs and ReportJobQueue)."""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db_service_api import app as db_app
+from report_jobs import FAILED, SUCCEEDED, JobQueueFull, ReportJob, ReportJobQueue
+from report_service_api import app as report_app
+
+
+def _wait(client: TestClient, job_id: str, timeout: float = 10.0) -> Dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/reports/jobs/{job_id}").json()
+        if job["status"] in (SUCCEEDED, FAILED) or time.monotonic() > deadline:
+            return job
+        time.sleep(0.02)
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    report_app.state.db_session = TestClient(db_app)  # type: ignore[attr-defined]
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    monkeypatch.setattr(report_app.state, "page_size", 2, raising=False)
+    queue = ReportJobQueue(workers=2)
+    monkeypatch.setattr(report_app.state, "job_queue", queue, raising=False)
+    yield TestClient(report_app)
+    queue.shutdown()
+
+
+def test_job_renders_report_with_progress_and_result(client: TestClient) -> None:
+    db_client = TestClient(db_app)
+    dataset = "JOB_REPORT"
+    db_client.post("/tables", json={"table_name": dataset, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+    for i in range(5):
+        db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": f"2025-08-22T0{i}:00:00", "value": str(i)}})
+
+    resp = client.post("/reports/jobs", json={
+        "dataset": dataset, "start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00", "format": "csv",
+    })
+    assert resp.status_code == 202
+    accepted = resp.json()
+    job = _wait(client, accepted["job_id"])
+
+    assert job["status"] == SUCCEEDED
+    assert job["progress"] == {"rows_written": 5, "pages_written": 3}
+    assert job["result"]["row_count"] == 5
+    result = client.get(accepted["result_url"])
+    assert result.status_code == 200
+    assert result.text.splitlines()[0] == "timestamp,value"
+    assert [j["job_id"] for j in client.get("/reports/jobs").json()["jobs"]] == [accepted["job_id"]]
+
+
+def test_parallel_jobs_for_one_dataset_get_separate_files(client: TestClient) -> None:
+    db_client = TestClient(db_app)
+    dataset = "JOB_PARALLEL"
+    db_client.post("/tables", json={"table_name": dataset, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+    for day in (1, 2):
+        for i in range(3):
+            db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": f"2025-08-0{day}T0{i}:00:00", "value": f"d{day}"}})
+
+    ids = {
+        day: client.post("/reports/jobs", json={
+            "dataset": dataset, "start_time": f"2025-08-0{day}T00:00:00", "end_time": f"2025-08-0{day}T23:00:00",
+        }).json()["job_id"]
+        for day in (1, 2)
+    }
+    jobs = {day: _wait(client, job_id) for day, job_id in ids.items()}
+
+    assert all(j["status"] == SUCCEEDED for j in jobs.values()), jobs
+    assert jobs[1]["result"]["filename"] != jobs[2]["result"]["filename"]
+    for day, job in jobs.items():
+        values = {line.split(",")[1] for line in Path(job["result"]["path"]).read_text().splitlines()[1:]}
+        assert values == {f"d{day}"}
+
+
+def test_job_errors_and_unknown_ids(client: TestClient) -> None:
+    assert client.post("/reports/jobs", json={"dataset": "x", "start_time": "a", "end_time": "b", "format": "pdf"}).status_code == 400
+    assert client.get("/reports/jobs/nope").status_code == 404
+    assert client.get("/reports/jobs/nope/result").status_code == 404
+
+
+def test_queue_runs_in_background_and_bounds_pending() -> None:
+    queue = ReportJobQueue(workers=1, max_pending=2, history=1)
+    gate = threading.Event()
+
+    def slow(job: ReportJob) -> Dict[str, Any]:
+        gate.wait(5)
+        job.advance(10)
+        return {"filename": "r.csv"}
+
+    first = queue.submit({"n": 1}, slow)
+    second = queue.submit({"n": 2}, lambda job: (_ for _ in ()).throw(RuntimeError("boom")))
+    with pytest.raises(JobQueueFull):
+        queue.submit({"n": 3}, slow)
+    assert not first.done
+    gate.set()
+    queue.shutdown()
+
+    assert first.status == SUCCEEDED and first.rows_written == 10
+    assert second.status == FAILED and second.error == "boom"
+
+
+def test_queue_forgets_oldest_finished_jobs_beyond_history() -> None:
+    queue = ReportJobQueue(workers=1, history=1)
+    jobs = []
+    for _ in range(3):
+        job = queue.submit({}, lambda job: {})
+        while not job.done:
+            time.sleep(0.01)
+        jobs.append(job)
+    queue.shutdown()
+    assert queue.get(jobs[0].job_id) is None
+    assert [j.job_id for j in queue.list()] == [jobs[2].job_id, jobs[1].job_id]
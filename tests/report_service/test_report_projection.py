@@ -0,0 +1,85 @@
+"""Tests for pushing [report.columns] projections into DB queries."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from openpyxl import load_workbook
+
+from db_service_api import app as db_app
+from report_service_api import app as report_app
+from report_service_core import configured_columns, project_columns
+
+SETTINGS: Dict[str, Any] = {"workbook_name": "hourly.xlsx", "columns": {"proj_ib": ["Agent Name", "Handle", "Not There"]}}
+
+
+def test_configured_and_projected_columns() -> None:
+    assert configured_columns("Proj_IB", SETTINGS) == ["Agent Name", "Handle", "Not There"]
+    assert configured_columns("other", SETTINGS) is None
+    assert project_columns(["b", "a", "z"], ["a", "b", "c"]) == ["b", "a"]
+    assert project_columns(["z"], ["a"]) is None
+    assert project_columns(["a"], None) == ["a"]
+    assert project_columns(None, ["a"]) is None
+    assert project_columns(["b", "a"], ["a", "b"], strict=True) == ["b", "a"]
+    with pytest.raises(ValueError, match="z, y"):
+        project_columns(["a", "z", "y"], ["a"], strict=True)
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    db_client = TestClient(db_app)
+    db_client.post("/tables", json={"table_name": "Proj_IB", "columns": {
+        "timestamp": "TEXT", "Agent Name": "TEXT", "Handle": "TEXT", "Wide Unused": "TEXT",
+    }})
+    for i in range(3):
+        db_client.post("/tables/Proj_IB/rows", json={"row": {
+            "timestamp": f"2025-08-22T0{i}:00:00", "Agent Name": f"a{i}", "Handle": str(i), "Wide Unused": "x" * 50,
+        }})
+    monkeypatch.setattr(report_app.state, "db_session", db_client, raising=False)
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    monkeypatch.setattr(report_app.state, "report_settings", SETTINGS, raising=False)
+    return TestClient(report_app)
+
+
+def _page_params(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> List[Dict[str, Any]]:
+    seen: List[Dict[str, Any]] = []
+    db_client = report_app.state.db_session  # type: ignore[attr-defined]
+    real_get = db_client.get
+
+    def recording_get(url: str, **kw: Any) -> Any:
+        if url.endswith("/rows/page"):
+            seen.append(dict(kw.get("params") or {}))
+        return real_get(url, **kw)
+
+    monkeypatch.setattr(db_client, "get", recording_get)
+    return seen
+
+
+def test_generate_pushes_configured_columns(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    seen = _page_params(client, monkeypatch)
+    body = {"dataset": "Proj_IB", "start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00", "format": "csv"}
+
+    resp = client.post("/reports/generate", json=body).json()
+
+    assert seen[0]["columns"] == "Agent Name,Handle"
+    assert resp["columns"] == ["Agent Name", "Handle"]
+    lines = Path(resp["path"]).read_text().splitlines()
+    assert lines == ["Agent Name,Handle", "a0,0", "a1,1", "a2,2"]
+
+    override = client.post("/reports/generate", json={**body, "columns": ["Handle"]}).json()
+    assert override["cached"] is False
+    assert Path(override["path"]).read_text().splitlines()[0] == "Handle"
+
+    unknown = client.post("/reports/generate", json={**body, "columns": ["Handle", "Nope"]})
+    assert unknown.status_code == 400
+    assert "Nope" in unknown.json()["detail"]
+
+
+def test_workbook_sheets_are_projected(client: TestClient) -> None:
+    resp = client.post("/reports/workbook", json={"start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00"})
+    assert resp.status_code == 200, resp.text
+    rows = list(load_workbook(resp.json()["path"], read_only=True)["proj_ib"].iter_rows(values_only=True))
+    assert rows[0] == ("Agent Name", "Handle")
+    assert len(rows) == 4
@@ -64,3 +64,39 @@ def test_list_reports(tmp_path: Path) -> None:
     res = client.get("/reports")
     assert res.status_code == 200
     assert "reports" in res.json()
+
+
+def test_generate_csv_report_streams_multiple_pages(tmp_path: Path, monkeypatch) -> None:
+    db_client = TestClient(db_app)
+    dataset = "PAGED_CSV"
+    db_client.delete(f"/tables/{dataset}")
+    db_client.post("/tables", json={"table_name": dataset, "columns": {"timestamp": "TEXT", "value": "TEXT"}})
+    for i in range(7):
+        db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": f"2025-08-22T0{i}:00:00", "value": str(i)}})
+
+    requested = []
+    real_get = db_client.get
+
+    def counting_get(url, **kw):
+        requested.append(url)
+        return real_get(url, **kw)
+
+    monkeypatch.setattr(db_client, "get", counting_get)
+    report_app.state.db_session = db_client  # type: ignore[attr-defined]
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    monkeypatch.setattr(report_app.state, "page_size", 3, raising=False)
+    client = TestClient(report_app)
+
+    resp = client.post("/reports/generate", json={
+        "dataset": dataset,
+        "start_time": "2025-08-22T00:00:00",
+        "end_time": "2025-08-22T23:00:00",
+        "format": "csv",
+    })
+    assert resp.status_code == 200
+    assert resp.json()["row_count"] == 7
+    assert len([u for u in requested if u.endswith("/rows/page")]) == 3
+    lines = Path(resp.json()["path"]).read_text().splitlines()
+    assert lines[0] == "timestamp,value"
+    assert [ln.split(",")[1] for ln in lines[1:]] == [str(i) for i in range(7)]
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith(".part")]
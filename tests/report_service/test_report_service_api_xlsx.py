@@ -67,3 +67,38 @@ def test_generate_and_download_xlsx(client: TestClient, tmp_path: Path) -> None:
     assert dl.headers.get("content-type", "").startswith(
         "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
+
+
+def test_generate_xlsx_streams_pages_write_only(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    from openpyxl import load_workbook
+
+    dataset = "xlsx_paged_test"
+    _db_client.delete(f"/tables/{dataset}")
+    _db_client.post("/tables", json={"table_name": dataset, "schema": {"timestamp": "TEXT", "a": "TEXT"}})
+    for i in range(5):
+        _db_client.post(f"/tables/{dataset}/rows", json={"row": {"timestamp": f"2025-08-22T0{i}:00:00Z", "a": str(i)}})
+    monkeypatch.setattr(app.state, "page_size", 2, raising=False)
+
+    resp = client.post(
+        "/reports/generate",
+        json={"dataset": dataset, "start_time": "2025-08-22T00:00:00Z", "end_time": "2025-08-22T23:59:59Z", "format": "xlsx"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["row_count"] == 5
+    ws = load_workbook(resp.json()["path"], read_only=True).worksheets[0]
+    assert ws.title == dataset
+    values = [list(r) for r in ws.iter_rows(values_only=True)]
+    assert values[0] == ["timestamp", "a"]
+    assert [r[1] for r in values[1:]] == ["0", "1", "2", "3", "4"]
+
+
+def test_generate_xlsx_empty_window(client: TestClient) -> None:
+    dataset = "xlsx_empty_test"
+    _seed_table(dataset)
+    resp = client.post(
+        "/reports/generate",
+        json={"dataset": dataset, "start_time": "2030-01-01T00:00:00Z", "end_time": "2030-01-02T00:00:00Z", "format": "xlsx"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["row_count"] == 0
+    assert Path(resp.json()["path"]).exists()
@@ -0,0 +1,137 @@
+"""Tests for multi-dataset workbook generation (POST /reports/workbook)."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from openpyxl import load_workbook
+
+from db_service_api import app as db_app
+from report_service_api import app as report_app
+from report_service_core import fetch_parallel, resolve_tables, write_xlsx_sheets
+
+
+class _BarrierSession:
+    """Forwards to the DB API but makes every dataset's first page wait for all the others."""
+
+    def __init__(self, db_client: TestClient, parties: int) -> None:
+        self.db_client = db_client
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.seen: set[str] = set()
+        self.lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        if url.endswith("/rows/page"):
+            with self.lock:
+                first = url not in self.seen
+                self.seen.add(url)
+            if first:
+                self.barrier.wait()  # raises BrokenBarrierError if fetches ran one after another
+        return self.db_client.get(url, **kwargs)
+
+
+def _seed(db_client: TestClient, table: str, n: int) -> None:
+    db_client.post("/tables", json={"table_name": table, "columns": {"timestamp": "TEXT", "Agent Name": "TEXT"}})
+    for i in range(n):
+        db_client.post(f"/tables/{table}/rows", json={"row": {"timestamp": f"2025-08-22T0{i}:00:00", "Agent Name": f"a{i}"}})
+
+
+def test_resolve_tables_is_case_insensitive() -> None:
+    assert resolve_tables(["ib_calls", "qcbs", "other"], ["IB_Calls", "QCBS"]) == {
+        "ib_calls": "IB_Calls", "qcbs": "QCBS", "other": "other",
+    }
+
+
+def test_fetch_parallel_spools_pages_to_disk() -> None:
+    fetched: List[str] = []
+
+    def fetch(d: str) -> Any:
+        for i in range(3):
+            fetched.append(d)
+            yield [{"dataset": d, "page": i}]
+
+    with fetch_parallel(fetch, ["a", "b"]) as pages:
+        assert sorted(fetched) == ["a"] * 3 + ["b"] * 3  # drained before any page is consumed
+        assert [p[0]["page"] for p in pages["b"]] == [0, 1, 2]
+        assert list(pages["a"])[0] == [{"dataset": "a", "page": 0}]
+
+
+def test_fetch_parallel_spools_values_as_json() -> None:
+    page = [{"s": "line\nbreak", "i": 1, "f": 0.5, "n": None}]
+    with fetch_parallel(lambda d: [page, page], ["a"]) as pages:
+        assert list(pages["a"]) == [page, page]
+
+
+def test_write_xlsx_sheets_deduplicates_truncated_titles(tmp_path: Path) -> None:
+    prefix = "x" * 31
+    names = [f"{prefix}_inbound", f"{prefix}_outbound", f"{prefix.upper()}_third"]
+    sheets = [(name, [[{"v": i}] * (i + 1)]) for i, name in enumerate(names)]
+
+    counts = write_xlsx_sheets(sheets, tmp_path / "w.xlsx")
+
+    assert counts == {names[0]: 1, names[1]: 2, names[2]: 3}
+    titles = load_workbook(tmp_path / "w.xlsx").sheetnames
+    assert titles == [prefix, "x" * 29 + "~2", "X" * 29 + "~3"]
+
+
+def test_fetch_parallel_reraises_fetch_errors() -> None:
+    def fetch(d: str) -> Any:
+        if d == "bad":
+            raise RuntimeError("boom")
+        return [[{"x": 1}]]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with fetch_parallel(fetch, ["ok", "bad"]):
+            pass
+
+
+def test_workbook_fetches_datasets_concurrently(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_client = TestClient(db_app)
+    _seed(db_client, "WB_Alpha", 3)
+    _seed(db_client, "WB_Beta", 1)
+    db_client.delete("/tables/wb_gamma")
+    settings: Dict[str, Any] = {"workbook_name": "hourly_report.xlsx", "columns": {"wb_alpha": [], "wb_beta": [], "wb_gamma": []}}
+
+    monkeypatch.setattr(report_app.state, "db_session", _BarrierSession(db_client, 3), raising=False)
+    monkeypatch.setattr(report_app.state, "reports_dir", tmp_path, raising=False)
+    monkeypatch.setattr(report_app.state, "report_settings", settings, raising=False)
+    client = TestClient(report_app)
+
+    resp = client.post("/reports/workbook", json={"start_time": "2025-08-22T00:00:00", "end_time": "2025-08-22T23:00:00"})
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["filename"].startswith("hourly_report_")
+    assert body["sheets"] == {"wb_alpha": 3, "wb_beta": 1, "wb_gamma": 0}
+    wb = load_workbook(body["path"], read_only=True)
+    assert wb.sheetnames == ["wb_alpha", "wb_beta", "wb_gamma"]
+    rows: List[Any] = list(wb["wb_alpha"].iter_rows(values_only=True))
+    assert rows[0] == ("timestamp", "Agent Name")
+    assert len(rows) == 4
+
+
+def test_workbook_requires_datasets(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(report_app.state, "report_settings", {}, raising=False)
+    resp = TestClient(report_app).post("/reports/workbook", json={"start_time": "a", "end_time": "b"})
+    assert resp.status_code == 400
+
+
+def test_report_service_generate_workbook(tmp_path: Path) -> None:
+    from http_transport import HTTPTransport
+    from report_service_core import ReportDBClient, ReportService
+
+    db_client = TestClient(db_app)
+    _seed(db_client, "WB_Svc", 2)
+    svc = ReportService(ReportDBClient(transport=HTTPTransport("", session=db_client)), reports_dir=tmp_path)
+
+    result = svc.generate_workbook(
+        "2025-08-22T00:00:00", "2025-08-22T23:00:00", settings={"workbook_name": "daily.xlsx", "columns": {"wb_svc": []}}
+    )
+
+    assert result.format == "xlsx" and result.row_count == 2
+    assert result.path.name.startswith("daily_")
+    assert load_workbook(result.path, read_only=True).sheetnames == ["wb_svc"]
+    assert [r["filename"] for r in svc.catalog.list()[0]] == [result.path.name]
@@ -32,3 +32,16 @@ def test_get_ingested_files_filters_by_time_window() -> None:
 
     assert f"ACQ__{inside_dt}.csv" in files
     assert f"Productivity__{outside_dt}.csv" not in files
+
+
+def test_get_missing_files_returns_only_uningested() -> None:
+    client = TestClient(db_app)
+    now = datetime.now(timezone.utc)
+    client.post("/tables", json={"table_name": "ingestion_log", "columns": {"filename": "TEXT", "dataset": "TEXT", "ingested_at": "TEXT"}})
+    client.post("/tables/ingestion_log/rows", json={"row": {"filename": "ACQ__2025-08-20_1130.csv", "dataset": "ACQ", "ingested_at": now.isoformat(timespec="seconds")}})
+
+    svc = DBServiceClient(api_url="", session=client)
+    candidates = ["ACQ__2025-08-20_1130.csv", "Dials__2025-08-20_1130.csv", "RESC__2025-08-20_1130.csv"]
+
+    assert svc.get_missing_files(candidates) == ["Dials__2025-08-20_1130.csv", "RESC__2025-08-20_1130.csv"]
+    assert svc.get_missing_files([]) == []
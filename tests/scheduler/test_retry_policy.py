@@ -0,0 +1,103 @@
+"""Tests for RetryPolicy backoff, circuit breaker and deadline handling."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from scheduler import CircuitBreaker, CircuitOpenError, RetryPolicy, SharePointClient, SyncJob
+
+
+class _Resp:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+def test_backoff_grows_exponentially_and_is_capped() -> None:
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, multiplier=2.0, jitter=0.0)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_backoff_jitter_stays_within_bounds() -> None:
+    policy = RetryPolicy(base_delay=2.0, jitter=0.5)
+    delays = [policy.backoff(1) for _ in range(50)]
+    assert all(1.0 <= d <= 2.0 for d in delays)
+
+
+def test_call_retries_retryable_status_then_succeeds() -> None:
+    sleeps: List[float] = []
+    policy = RetryPolicy(max_attempts=3, base_delay=0.1, jitter=0.0, sleep=sleeps.append)
+    responses = iter([_Resp(503), _Resp(429), _Resp(200)])
+    assert policy.call(lambda: next(responses), host="h").status_code == 200
+    assert sleeps == [0.1, 0.2]
+
+
+def test_call_does_not_retry_client_errors() -> None:
+    calls: List[int] = []
+
+    def fn() -> Any:
+        calls.append(1)
+        return _Resp(404)
+
+    policy = RetryPolicy(max_attempts=3, base_delay=0.0)
+    assert policy.call(fn, host="h").status_code == 404
+    assert len(calls) == 1
+
+
+def test_breaker_opens_after_threshold_and_fails_fast() -> None:
+    policy = RetryPolicy(max_attempts=1, failure_threshold=2, reset_timeout=60)
+    calls: List[int] = []
+
+    def boom() -> Any:
+        calls.append(1)
+        raise ConnectionError("refused")
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            policy.call(boom, host="sim")
+    with pytest.raises(CircuitOpenError):
+        policy.call(boom, host="sim")
+    assert len(calls) == 2
+    # Other hosts are unaffected
+    assert policy.call(lambda: _Resp(200), host="db").status_code == 200
+
+
+def test_breaker_half_open_trial_closes_or_reopens() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.state == "open"
+    now[0] = 11.0
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one trial call at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+    now[0] = 22.0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_deadline_stops_retries() -> None:
+    sleeps: List[float] = []
+    policy = RetryPolicy(max_attempts=5, base_delay=10.0, jitter=0.0, sleep=sleeps.append)
+    with policy.deadline_in(1.0):
+        assert policy.call(lambda: _Resp(503), host="h").status_code == 503
+    assert sleeps == []
+
+
+def test_syncjob_gives_up_on_open_circuit(tmp_path: Path) -> None:
+    policy = RetryPolicy(failure_threshold=1, reset_timeout=60)
+    session = MagicMock()
+    session.get.return_value.status_code = 200
+    session.get.return_value.json.return_value = {"files": [{"filename": "A__2025-08-21_1200.csv"}]}
+    cfg = {"ingestion_dir": str(tmp_path), "max_retries": 5, "retry_delay_seconds": 0}
+    sp = SharePointClient(cfg, session=session, base_url="http://other", retry_policy=policy)
+    sp.download_file = MagicMock(side_effect=CircuitOpenError("circuit open"))  # type: ignore[method-assign]
+    db = MagicMock()
+    db.get_missing_files = MagicMock(side_effect=list)
+    assert SyncJob(cfg, sp, db).run() == []
+    assert sp.download_file.call_count == 1
@@ -107,7 +107,7 @@ def test_sync_job_skips_already_ingested_files(
         scheduler_config: Scheduler configuration.
         tmp_path: Temporary directory path.
     """
-    mock_db_service_client.get_ingested_files.return_value = ["already.csv"]
+    mock_db_service_client.get_missing_files.return_value = ["new.csv"]
     mock_sharepoint_client.list_files.return_value = ["already.csv", "new.csv"]
 
     # Simulate download path for new file
@@ -163,7 +163,7 @@ def test_sync_job_handles_db_errors(
         mock_db_service_client: Mocked DB service client.
         scheduler_config: Scheduler configuration.
     """
-    mock_db_service_client.get_ingested_files.side_effect = Exception("DB error")
+    mock_db_service_client.get_missing_files.side_effect = Exception("DB error")
 
     job = SyncJob(
         config=scheduler_config,
@@ -0,0 +1,104 @@
+"""Tests for the scheduler control-plane API."""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from scheduler import Scheduler, SharePointClient
+from scheduler_api import app
+
+
+class _SharePoint(SharePointClient):
+    def __init__(self, names: List[str]) -> None:
+        super().__init__({})
+        self._names = names
+
+    def list_files(self, folder: str) -> List[str]:  # type: ignore[override]
+        return list(self._names)
+
+    def download_file(self, folder: str, filename: str, dest: Path) -> Path:  # type: ignore[override]
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text("col\nvalue\n")
+        return dest
+
+
+def _client(tmp_path: Path, names: List[str]) -> TestClient:
+    db = MagicMock()
+    db.get_missing_files = MagicMock(side_effect=lambda files: [n for n in files if not n.startswith("old")])
+    cfg: Dict[str, Any] = {"ingestion_dir": str(tmp_path), "run_history_size": 3}
+    app.state.scheduler = Scheduler(cfg, _SharePoint(names), db)
+    return TestClient(app)
+
+
+def test_trigger_wait_records_run_stats(tmp_path: Path) -> None:
+    client = _client(tmp_path, ["A__2025-08-21_1200.csv", "old__2025-08-21_1100.csv"])
+    record = client.post("/trigger", params={"wait": "true"}).json()
+    assert record["status"] == "ok"
+    assert record["files_listed"] == 2
+    assert record["files_downloaded"] == 1
+    assert record["files_skipped"] == 1
+    assert record["bytes_downloaded"] == len("col\nvalue\n")
+    assert record["download_retries"] == 0 and record["http_retries"] == 0
+    assert record["duration_s"] >= 0
+    assert record["started_at"].endswith("+00:00") and record["finished_at"].endswith("+00:00")
+    assert client.get("/status").json()["last_run"]["run_id"] == record["run_id"]
+
+
+def test_trigger_in_background_and_history_limit(tmp_path: Path) -> None:
+    client = _client(tmp_path, ["A__2025-08-21_1200.csv"])
+    assert client.post("/trigger").status_code == 202
+    deadline = time.monotonic() + 5
+    while client.get("/status").json()["last_run"] is None or app.state.scheduler.is_running:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    for _ in range(4):
+        client.post("/trigger", params={"wait": "true"})
+    runs = client.get("/runs", params={"limit": 10}).json()
+    assert [r["run_id"] for r in runs] == [5, 4, 3]  # history keeps run_history_size records
+    assert client.get("/runs", params={"limit": 1}).json()[0]["run_id"] == 5
+
+
+def test_pause_resume_skips_scheduled_runs(tmp_path: Path) -> None:
+    client = _client(tmp_path, ["A__2025-08-21_1200.csv"])
+    sched: Scheduler = app.state.scheduler
+    assert client.post("/pause").json() == {"paused": True}
+    assert client.get("/status").json()["state"] == "paused"
+    sched._scheduled_run()  # type: ignore[protected-access]
+    assert client.get("/runs").json() == []
+    assert client.post("/resume").json() == {"paused": False}
+    sched._scheduled_run()  # type: ignore[protected-access]
+    assert client.get("/runs").json()[0]["trigger"] == "scheduled"
+
+
+def test_failed_run_is_recorded(tmp_path: Path) -> None:
+    client = _client(tmp_path, [])
+    sched: Scheduler = app.state.scheduler
+    sched.sync_job.sharepoint_client.list_files = MagicMock(side_effect=RuntimeError("sim down"))  # type: ignore[method-assign]
+    record = client.post("/trigger", params={"wait": "true"}).json()
+    assert record["status"] == "error"
+    assert record["error"] == "sim down"
+
+
+def test_concurrent_triggers_start_one_run(tmp_path: Path) -> None:
+    client = _client(tmp_path, [])
+    sched: Scheduler = app.state.scheduler
+    release = threading.Event()
+    sched.sync_job.run = MagicMock(side_effect=lambda: release.wait(5))  # type: ignore[method-assign]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        codes = list(pool.map(lambda _: client.post("/trigger").status_code, range(4)))
+    release.set()
+    deadline = time.monotonic() + 5
+    while sched.is_running:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert sorted(codes) == [202, 409, 409, 409]
+    assert sched.sync_job.run.call_count == 1
+    assert client.post("/trigger", params={"wait": "true"}).json()["status"] == "ok"
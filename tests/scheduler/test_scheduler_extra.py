@@ -124,6 +124,7 @@ def test_syncjob_partial_failure(monkeypatch):  # type: ignore
     sp = MagicMock()
     db = MagicMock()
     sp.list_files.return_value = ['a.csv', 'b.csv']
+    db.get_missing_files.return_value = ['a.csv', 'b.csv']
     sp.download_file.side_effect = [Exception('fail'), Path('b.csv')]
     job = SyncJob(config={'ingestion_dir': '.'}, sharepoint_client=sp, db_service_client=db)
     result = job.run()
@@ -143,7 +144,7 @@ def test_integration_happy_path(tmp_path):  # type: ignore
     sp = MagicMock()
     db = MagicMock()
     sp.list_files.return_value = ['a.csv']
-    db.get_ingested_files.return_value = []
+    db.get_missing_files.return_value = ['a.csv']
     sp.download_file.return_value = tmp_path / 'a.csv'
     job = SyncJob(config={'ingestion_dir': str(tmp_path), 'sharepoint_folder': 'folder'}, sharepoint_client=sp, db_service_client=db)  # type: ignore
     result = job.run()
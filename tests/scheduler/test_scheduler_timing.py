@@ -0,0 +1,72 @@
+"""Timing tests for the adaptive scheduling mode and quad-daily run times."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from scheduler import DEFAULT_QUAD_DAILY_TIMES, AdaptiveInterval, Scheduler, load_config, next_quad_daily
+
+
+def _scheduler(**overrides: Any) -> Scheduler:
+    cfg: Dict[str, Any] = {
+        "schedule_mode": "adaptive",
+        "adaptive_min_minutes": 1,
+        "adaptive_max_minutes": 16,
+        "quad_daily_times": [],
+    }
+    cfg.update(overrides)
+    return Scheduler(cfg, MagicMock(), MagicMock())
+
+
+def test_adaptive_interval_backs_off_and_resets() -> None:
+    interval = AdaptiveInterval(min_seconds=60, max_seconds=480, factor=2)
+    assert [interval.observe(0) for _ in range(4)] == [120, 240, 480, 480]
+    assert interval.observe(3) == 60
+
+
+def test_next_quad_daily_wraps_to_next_day() -> None:
+    times = ["08:00", "12:00", "16:00", "19:00"]
+    assert next_quad_daily(datetime(2025, 8, 21, 12, 0), times) == datetime(2025, 8, 21, 16, 0)
+    assert next_quad_daily(datetime(2025, 8, 21, 19, 30), times) == datetime(2025, 8, 22, 8, 0)
+    assert next_quad_daily(datetime(2025, 8, 21, 12, 0), []) is None
+
+
+def test_quad_daily_times_come_from_settings(tmp_path: Path) -> None:
+    settings = tmp_path / "settings.toml"
+    settings.write_text('[schedules]\nquad_daily_times = ["06:30", "18:45"]\n', encoding="utf-8")
+    assert load_config(settings)["quad_daily_times"] == ["06:30", "18:45"]
+
+    settings.write_text("[schedules]\nhourly_interval_minutes = 60\n", encoding="utf-8")
+    assert load_config(settings)["quad_daily_times"] == DEFAULT_QUAD_DAILY_TIMES
+    assert load_config(tmp_path / "missing.toml")["quad_daily_times"] == DEFAULT_QUAD_DAILY_TIMES
+
+
+def test_scheduled_runs_drive_adaptive_interval() -> None:
+    sched = _scheduler()
+    sched.sync_job = MagicMock()
+    sched.sync_job.last_stats = {"files_downloaded": 0}
+    sched._scheduled_run()  # type: ignore[protected-access]
+    sched._scheduled_run()  # type: ignore[protected-access]
+    assert sched.adaptive is not None and sched.adaptive.current == 240
+    sched.sync_job.last_stats = {"files_downloaded": 5}
+    sched._scheduled_run()  # type: ignore[protected-access]
+    assert sched.adaptive.current == 60
+    assert sched.status()["schedule_mode"] == "adaptive"
+
+
+def test_next_delay_never_skips_quad_daily_time() -> None:
+    sched = _scheduler(quad_daily_times=["12:00"])
+    assert sched.adaptive is not None
+    sched.adaptive.current = 16 * 60
+    assert sched.next_delay(datetime(2025, 8, 21, 11, 55)) == 300
+    assert sched.next_delay(datetime(2025, 8, 21, 9, 0)) == 16 * 60
+
+
+def test_adaptive_loop_stops_on_shutdown() -> None:
+    sched = _scheduler(adaptive_min_minutes=60)
+    sched._schedule_jobs()  # type: ignore[protected-access]
+    sched.shutdown()
+    sched._loop_thread.join(2)  # type: ignore[attr-defined]
+    assert not sched._loop_thread.is_alive()  # type: ignore[attr-defined]
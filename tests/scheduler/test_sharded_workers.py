@@ -0,0 +1,111 @@
+"""Tests for sharded SyncJob workers coordinated through the SQLite lease table."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from scheduler import ShardLeases, SharePointClient, SyncJob, shard_of
+
+NAMES = [f"{ds}__2025-08-21_1200.csv" for ds in ("ACQ", "Dials", "IB_Calls", "Productivity", "QCBs", "RESC")]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _SharePoint(SharePointClient):
+    def __init__(self, log: List[str]) -> None:
+        super().__init__({})
+        self._log = log
+
+    def list_files(self, folder: str) -> List[str]:  # type: ignore[override]
+        return list(NAMES)
+
+    def download_file(self, folder: str, filename: str, dest: Path) -> Path:  # type: ignore[override]
+        self._log.append(filename)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text("col\nval\n")
+        return dest
+
+
+def _job(tmp_path: Path, worker: str, clock: _Clock, log: List[str]) -> SyncJob:
+    leases = ShardLeases(str(tmp_path / "leases.sqlite3"), shard_count=4, worker_id=worker, ttl_seconds=60, clock=clock)
+    db = MagicMock()
+    db.get_missing_files = MagicMock(side_effect=list)
+    cfg: Dict[str, Any] = {"ingestion_dir": str(tmp_path / worker)}
+    return SyncJob(cfg, _SharePoint(log), db, leases=leases)
+
+
+def test_shard_of_is_stable_per_dataset() -> None:
+    assert shard_of("ACQ__2025-08-21_1200.csv", 8) == shard_of("ACQ__2025-08-22_0900.csv", 8)
+    assert 0 <= shard_of("Dials__2025-08-21_1200.csv", 8) < 8
+
+
+def test_workers_split_shards_and_download_each_file_once(tmp_path: Path) -> None:
+    clock = _Clock()
+    log: List[str] = []
+    a = _job(tmp_path, "a", clock, log)
+    b = _job(tmp_path, "b", clock, log)
+    assert a.leases is not None and b.leases is not None
+    # Rebalancing converges in one extra round: a gives back shards beyond its fair share
+    a.leases.acquire()
+    b.leases.acquire()
+    a.leases.acquire()
+    first = a.run()
+    second = b.run()
+    assert set(a.last_stats["shards"]).isdisjoint(b.last_stats["shards"])
+    assert len(a.last_stats["shards"]) == len(b.last_stats["shards"]) == 2
+    assert sorted(first + second) == sorted(NAMES)
+    assert sorted(log) == sorted(NAMES)
+
+
+def test_surviving_worker_takes_over_expired_leases(tmp_path: Path) -> None:
+    clock = _Clock()
+    log: List[str] = []
+    a = _job(tmp_path, "a", clock, log)
+    b = _job(tmp_path, "b", clock, log)
+    assert a.leases is not None and b.leases is not None
+    a.leases.acquire()
+    b.leases.acquire()
+    a_shards = a.leases.acquire()
+    b_shards = b.leases.acquire()
+    assert len(a_shards) == len(b_shards) == 2
+    # "a" dies; once its heartbeat and leases expire "b" owns every shard
+    clock.now += 120
+    assert b.leases.acquire() == [0, 1, 2, 3]
+
+
+def test_claims_prevent_duplicate_downloads_until_expiry(tmp_path: Path) -> None:
+    clock = _Clock()
+    a = ShardLeases(str(tmp_path / "l.sqlite3"), 2, worker_id="a", ttl_seconds=60, clock=clock)
+    b = ShardLeases(str(tmp_path / "l.sqlite3"), 2, worker_id="b", ttl_seconds=60, clock=clock)
+    assert a.claim_files(["x.csv", "y.csv"]) == ["x.csv", "y.csv"]
+    assert b.claim_files(["x.csv", "y.csv"]) == []
+    a.complete_files(["x.csv"], ["y.csv"])
+    assert b.claim_files(["x.csv", "y.csv"]) == ["y.csv"]  # released after failure
+    clock.now += 120
+    assert b.claim_files(["x.csv"]) == ["x.csv"]
+
+
+def test_idle_worker_keeps_heartbeating(tmp_path: Path) -> None:
+    clock = _Clock()
+    log: List[str] = []
+    a = _job(tmp_path, "a", clock, log)
+    b = _job(tmp_path, "b", clock, log)
+    assert a.leases is not None and b.leases is not None
+    a.leases.acquire()
+    b.leases.acquire()
+    a.leases.acquire()
+    a.sharepoint_client.list_files = lambda folder: []  # type: ignore[method-assign]
+    # "a" has nothing to sync, yet its runs must keep its leases alive
+    for _ in range(3):
+        clock.now += 40
+        assert a.run() == []
+        b.leases.acquire()
+    assert len(a.last_stats["shards"]) == 2
+    assert len(b.leases.acquire()) == 2
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+import time
 from typing import Any, Dict, List
 from unittest.mock import MagicMock
 
@@ -37,7 +38,7 @@ def test_syncjob_retries_and_succeeds(tmp_path: Path) -> None:
     }
     sp = FlakySharePoint(fail_times=2)
     db = DBServiceClient(api_url="", session=MagicMock())
-    db.get_ingested_files = MagicMock(return_value=[])  # type: ignore
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
 
     job = SyncJob(cfg, sp, db)
     out = job.run()
@@ -53,10 +54,99 @@ def test_syncjob_exhausts_retries(tmp_path: Path) -> None:
     }
     sp = FlakySharePoint(fail_times=5)
     db = DBServiceClient(api_url="", session=MagicMock())
-    db.get_ingested_files = MagicMock(return_value=[])  # type: ignore
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
 
     job = SyncJob(cfg, sp, db)
     out = job.run()
     assert out == []
     # File should not exist after failed attempts
     assert not (tmp_path / "ACQ__2025-08-21_1200.csv").exists()
+
+
+def test_failed_redownload_keeps_existing_local_copy(tmp_path: Path) -> None:
+    cfg: Dict[str, Any] = {"ingestion_dir": str(tmp_path), "max_retries": 2, "retry_delay_seconds": 0}
+    existing = tmp_path / "ACQ__2025-08-21_1200.csv"
+    existing.write_text("col\nkept\n")
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    assert SyncJob(cfg, FlakySharePoint(fail_times=5), db).run() == []
+    assert existing.read_text() == "col\nkept\n"
+
+
+class SlowSharePoint(SharePointClient):
+    def __init__(self, names: List[str], delay: float, flaky: str | None = None) -> None:
+        super().__init__({})
+        self._names = names
+        self._delay = delay
+        self._flaky = flaky
+        self.completed: List[str] = []
+
+    def list_files(self, folder: str) -> List[str]:  # type: ignore[override]
+        return list(self._names)
+
+    def download_file(self, folder: str, filename: str, dest: Path) -> Path:  # type: ignore[override]
+        if filename == self._flaky:
+            self._flaky = None
+            raise RuntimeError("network error")
+        time.sleep(self._delay)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text("col\nval\n")
+        self.completed.append(filename)
+        return dest
+
+
+def test_syncjob_concurrent_downloads_overlap(tmp_path: Path) -> None:
+    names = [f"ACQ__2025-08-21_12{i:02d}.csv" for i in range(4)]
+    cfg: Dict[str, Any] = {"ingestion_dir": str(tmp_path), "max_concurrent_downloads": 4}
+    sp = SlowSharePoint(names, delay=0.2)
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    started = time.monotonic()
+    out = SyncJob(cfg, sp, db).run()
+
+    assert out == names
+    assert time.monotonic() - started < 0.6
+
+
+def test_syncjob_retry_does_not_block_other_downloads(tmp_path: Path) -> None:
+    names = ["ACQ__2025-08-21_1200.csv", "ACQ__2025-08-21_1300.csv", "ACQ__2025-08-21_1400.csv"]
+    cfg: Dict[str, Any] = {
+        "ingestion_dir": str(tmp_path),
+        "max_concurrent_downloads": 1,
+        "max_retries": 2,
+        "retry_delay_seconds": 0.05,
+    }
+    sp = SlowSharePoint(names, delay=0.05, flaky=names[0])
+    db = DBServiceClient(api_url="", session=MagicMock())
+    db.get_missing_files = MagicMock(side_effect=list)  # type: ignore
+
+    out = SyncJob(cfg, sp, db).run()
+
+    assert out == names
+    # The flaky file's retry was scheduled behind the others rather than sleeping in line
+    assert sp.completed[-1] == names[0]
+
+
+class _BrokenStreamResponse:
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_content(self, chunk_size: int = 1) -> Any:
+        yield b"col\n"
+        raise ConnectionError("connection reset")
+
+
+def test_download_file_failure_leaves_no_partial_file(tmp_path: Path) -> None:
+    session = MagicMock(spec=["get"])
+    session.get.return_value = _BrokenStreamResponse()
+    sp = SharePointClient({}, session=session, base_url="http://sim")
+
+    with pytest.raises(ConnectionError):
+        sp.download_file("", "ACQ__2025-08-21_1200.csv", tmp_path / "ACQ__2025-08-21_1200.csv")
+
+    session.get.assert_called_once_with(
+        "http://sim/sim/download/ACQ__2025-08-21_1200.csv", timeout=(5.0, 30.0), stream=True
+    )
+    assert list(tmp_path.iterdir()) == []
@@ -47,3 +47,52 @@ def test_service_reset_and_list_files(tmp_path: Path):
     assert len(storage.list_files()) == 1
     storage.reset()
     assert len(storage.list_files()) == 0
+
+def test_storage_changes_since_is_incremental(tmp_path: Path):
+    storage = Storage(tmp_path)
+    storage.write_csv("a.csv", ["A"], [{"A": "1"}])
+    cursor = storage.last_seq
+    storage.write_csv("b.csv", ["A"], [{"A": "2"}])
+    storage.write_csv("a.csv", ["A"], [{"A": "3"}])  # rewrite moves 'a' after the cursor
+    assert [e.name for e in storage.changes_since(cursor)] == ["b.csv", "a.csv"]
+    assert storage.changes_since(storage.last_seq) == []
+    storage.reset()
+    assert storage.changes_since(0) == []
+
+def test_api_files_since_cursor_lists_only_new_files():
+    client.post("/sim/reset")
+    client.post("/sim/generate", params={"types": "ACQ", "rows": 2})
+    first = client.get("/sim/files").json()
+    assert len(first["files"]) == 1
+    unchanged = client.get("/sim/files", params={"since": first["cursor"]}).json()
+    assert unchanged["files"] == []
+    client.post("/sim/generate", params={"types": "Dials", "rows": 2})
+    delta = client.get("/sim/files", params={"since": unchanged["cursor"]}).json()
+    assert [f["filename"].split("__")[0] for f in delta["files"]] == ["Dials"]
+    # A cursor from another simulator instance falls back to a full listing
+    stale = client.get("/sim/files", params={"since": "unknown-99"}).json()
+    assert len(stale["files"]) == 2
+
+
+def test_api_bulk_download_tar_and_zip():
+    import io
+    import tarfile
+    import zipfile
+
+    client = TestClient(app)
+    client.post("/sim/reset")
+    names = [f["filename"] for f in client.post("/sim/generate", params={"types": "ACQ,Dials", "rows": 3}).json()["files"]]
+    bodies = {n: client.get(f"/sim/download/{n}").content for n in names}
+
+    resp = client.post("/sim/download/bulk", json={"filenames": names})
+    assert resp.headers["content-type"] == "application/x-tar"
+    with tarfile.open(fileobj=io.BytesIO(resp.content)) as tar:
+        assert {m.name: tar.extractfile(m).read() for m in tar} == bodies  # type: ignore[union-attr]
+
+    resp = client.post("/sim/download/bulk", json={"filenames": names, "format": "zip"})
+    with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+        assert {n: zf.read(n) for n in zf.namelist()} == bodies
+
+    missing = client.post("/sim/download/bulk", json={"filenames": [names[0], "nope.csv"]})
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == {"missing": ["nope.csv"]}
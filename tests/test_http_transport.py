@@ -0,0 +1,153 @@
+"""Tests for the shared pooled HTTP transport."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import http_transport
+from db_service_api import app as db_app
+from db_service_http import HTTPDBClient
+from http_transport import HTTPTransport, RetryPolicy, TransportMetrics, iter_body, shared_session
+from report_service_core import ReportDBClient
+from scheduler import DBServiceClient, SharePointClient
+
+
+class _Resp:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+def test_request_applies_timeout_and_records_metrics() -> None:
+    session = MagicMock(spec=["get"])
+    session.get.return_value = _Resp(200)
+    metrics = TransportMetrics()
+    transport = HTTPTransport("http://db:8000", session=session, service="db", connect_timeout=2, read_timeout=9, metrics=metrics)
+
+    transport.get("/tables", params={"a": 1})
+    transport.get("/tables", timeout=1)
+
+    assert session.get.call_args_list[0].args == ("http://db:8000/tables",)
+    assert session.get.call_args_list[0].kwargs == {"timeout": (2.0, 9.0), "params": {"a": 1}}
+    assert session.get.call_args_list[1].kwargs == {"timeout": 1}
+    snap = metrics.snapshot()["db GET 2xx"]
+    assert snap["count"] == 2 and snap["seconds"] >= 0
+    assert 'http_client_requests_total{service="db",method="GET",status="2xx"} 2' in metrics.to_prometheus()
+
+
+def test_request_retries_through_policy() -> None:
+    session = MagicMock(spec=["post"])
+    session.post.side_effect = [ConnectionError("reset"), _Resp(503), _Resp(201)]
+    metrics = TransportMetrics()
+    policy = RetryPolicy(max_attempts=3, base_delay=0, sleep=lambda _s: None)
+    transport = HTTPTransport("http://db", session=session, retry_policy=policy, metrics=metrics)
+
+    assert transport.post("/ingest", json={}, attempts=3).status_code == 201
+    assert policy.retries == 2
+    assert {k: int(v["count"]) for k, v in metrics.snapshot().items()} == {
+        "db POST error": 1, "db POST 5xx": 1, "db POST 2xx": 1,
+    }
+
+
+def test_stream_reads_requests_and_httpx_bodies() -> None:
+    class _RequestsResp:
+        status_code = 200
+        closed = False
+
+        def iter_content(self, chunk_size: int = 1) -> Any:
+            yield b"ab"
+            yield b"c"
+
+        def close(self) -> None:
+            self.closed = True
+
+    resp = _RequestsResp()
+    session = MagicMock(spec=["get"])
+    session.get.return_value = resp
+    with HTTPTransport("http://sim", session=session).stream("GET", "/x") as r:
+        assert b"".join(iter_body(r, 2)) == b"abc"
+    assert resp.closed
+    assert session.get.call_args.kwargs["stream"] is True
+
+    client = TestClient(db_app)
+    with HTTPTransport("", session=client).stream("GET", "/health") as r:
+        assert b"".join(iter_body(r, 1024)) == b'{"status":"ok"}'
+
+
+def test_clients_share_transport_layer() -> None:
+    client = TestClient(db_app)
+    metrics = TransportMetrics()
+    transport = HTTPTransport("", session=client, service="db_service", metrics=metrics)
+    db = DBServiceClient(transport=transport)
+    report_db = ReportDBClient(transport=transport)
+    uploads = HTTPDBClient(transport=transport)
+    assert db.session is client and report_db.session is client and uploads.session is client
+    db.get_missing_files(["never_ingested__2025-08-21_1200.csv"])
+    report_db.get_rows("ingestion_log", columns=["filename"])
+    client.delete("/tables/transport_upload")
+    uploads.send_to_db("a,b\n1,2\n", table_name="transport_upload")
+    calls = {k: int(v["count"]) for k, v in metrics.snapshot().items()}
+    assert calls == {"db_service GET 2xx": 1, "db_service POST 2xx": 2}
+    sp = SharePointClient({"max_concurrent_downloads": 4}, session=client, base_url="")
+    assert sp.transport.service == "sharepoint" and sp.session is client
+
+
+def test_shared_session_pool_grows_on_demand(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_transport, "_shared_session", None)
+    monkeypatch.setattr(http_transport, "_shared_pool_maxsize", 0)
+
+    sess = shared_session(4)
+    assert sess.get_adapter("http://db").poolmanager.connection_pool_kw["maxsize"] == 4
+    assert shared_session(2) is sess
+    assert sess.get_adapter("http://db").poolmanager.connection_pool_kw["maxsize"] == 4
+    assert shared_session(32) is sess
+    assert sess.get_adapter("https://db").poolmanager.connection_pool_kw["maxsize"] == 32
+
+
+def test_shared_session_closes_replaced_adapter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_transport, "_shared_session", None)
+    monkeypatch.setattr(http_transport, "_shared_pool_maxsize", 0)
+
+    old = shared_session(4).get_adapter("http://db")
+    closed = []
+    monkeypatch.setattr(old, "close", lambda: closed.append(old))
+    shared_session(8)
+    assert closed == [old]
+
+
+def test_post_is_not_retried_unless_requested() -> None:
+    session = MagicMock(spec=["post"])
+    session.post.side_effect = [_Resp(503), _Resp(201)]
+    policy = RetryPolicy(max_attempts=3, base_delay=0, sleep=lambda _s: None)
+    transport = HTTPTransport("http://db", session=session, retry_policy=policy)
+
+    assert transport.post("/ingest", json={}).status_code == 503
+    assert session.post.call_count == 1 and policy.retries == 0
+
+
+def test_sharepoint_shim_download_removes_part_file_on_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import scheduler_sharepoint_api
+
+    class _BrokenBody:
+        status_code = 200
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def iter_content(self, chunk_size: int = 1) -> Any:
+            yield b"partial"
+            raise ConnectionError("reset mid-body")
+
+        def close(self) -> None:
+            pass
+
+    session = MagicMock(spec=["get"])
+    session.get.return_value = _BrokenBody()
+    monkeypatch.setattr(scheduler_sharepoint_api, "_http", lambda: HTTPTransport("http://sim", session=session))
+
+    with pytest.raises(ConnectionError):
+        scheduler_sharepoint_api.download_sharepoint_file("", "a.csv", tmp_path / "a.csv")
+    assert list(tmp_path.iterdir()) == []